@@ -16,6 +16,7 @@ from typing import (
     Type,
     Union,
     Iterator,
+    AsyncIterator,
     overload,
 )
 from collections import defaultdict
@@ -34,8 +35,8 @@ from ai.utils.merge_dict import merge_dictionaries
 from ai.run.response import RunResponse, RunResponseExtraData
 from ai.model.message import Message
 from ai.agent.core.print import create_panel, response, cli_app
-from ai.agent.core.run import _aggregate_metrics_from_run_messages, generic_run_response, _run, run
-from ai.agent.core.api import _create_run_data, log_agent_run, log_agent_session
+from ai.agent.core.run import _aggregate_metrics_from_run_messages, generic_run_response, _run, run, _arun, arun
+from ai.agent.core.api import _create_run_data, log_agent_run, alog_agent_run, log_agent_session
 from ai.agent.core.tools import get_tools, search_knowledge_base, add_to_knowledge, get_transfer_prompt, get_transfer_function
 from ai.agent.core.messages import get_relevant_docs_from_knowledge, convert_documents_to_string, convert_context_to_string, get_system_message, get_json_output_prompt, get_user_message
 from ai.agent.core.session_management import AgentSession, get_agent_session, from_agent_session, read_from_storage, write_to_storage, add_introduction, load_session, create_session, new_session
@@ -305,6 +306,35 @@ class Agent(BaseModel):
             logger.debug(f"_run number of videos: {len(videos)}")
         return _run(self, message=message, stream=stream, audio=audio, images=images, videos=videos, messages=messages, stream_intermediate_steps=stream_intermediate_steps, **kwargs)
 
+    async def arun(
+        self,
+        message: Optional[Union[str, List, Dict, Message]] = None,
+        *,
+        stream: bool = False,
+        audio: Optional[Any] = None,
+        images: Optional[Sequence[Any]] = None,
+        videos: Optional[Sequence[Any]] = None,
+        messages: Optional[Sequence[Union[Dict, Message]]] = None,
+        stream_intermediate_steps: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        logger.info(f"Agent {self.agent_id} starting async run with message type: {type(message).__name__}")
+        return await arun(self, message=message, stream=stream, audio=audio, images=images, videos=videos, messages=messages, stream_intermediate_steps=stream_intermediate_steps, **kwargs)
+
+    def _arun(
+        self,
+        message: Optional[Union[str, List, Dict, Message]] = None,
+        *,
+        stream: bool = False,
+        audio: Optional[Any] = None,
+        images: Optional[Sequence[Any]] = None,
+        videos: Optional[Sequence[Any]] = None,
+        messages: Optional[Sequence[Union[Dict, Message]]] = None,
+        stream_intermediate_steps: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[RunResponse]:
+        return _arun(self, message=message, stream=stream, audio=audio, images=images, videos=videos, messages=messages, stream_intermediate_steps=stream_intermediate_steps, **kwargs)
+
     def get_agent_session(self) -> AgentSession:
         return get_agent_session(self)
 
@@ -338,6 +368,9 @@ class Agent(BaseModel):
     def log_agent_run(self) -> None:
         return log_agent_run(self)
 
+    async def alog_agent_run(self) -> None:
+        return await alog_agent_run(self)
+
     def log_agent_session(self):
         return log_agent_session(self)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from uuid import uuid4
 from collections import defaultdict, deque
@@ -476,12 +477,18 @@ async def _arun(
     self.update_model()
     self.run_response.model = self.model.id if self.model is not None else None
 
-    # 2. Read existing session from storage
-    self.read_from_storage()
-
-    # 3. Prepare messages for this run
-    system_message, user_messages, messages_for_model = self.get_messages_for_run(
-        message=message, audio=audio, images=images, videos=videos, messages=messages, **kwargs
+    # 2. Read existing session from storage (blocking storage drivers run in a worker thread)
+    await asyncio.to_thread(self.read_from_storage)
+
+    # 3. Prepare messages for this run; retrievers may do blocking vector searches
+    system_message, user_messages, messages_for_model = await asyncio.to_thread(
+        self.get_messages_for_run,
+        message=message,
+        audio=audio,
+        images=images,
+        videos=videos,
+        messages=messages,
+        **kwargs,
     )
 
     # 4. Reason about the task if reasoning is enabled
@@ -526,6 +533,14 @@ async def _arun(
                     self.run_response.content = model_response_chunk.content
                     self.run_response.created_at = model_response_chunk.created_at
                     yield self.run_response
+
+                # Handle audio chunks (content may be None for audio-only chunks)
+                if model_response_chunk.audio is not None:
+                    if self.run_response.audio is None:
+                        self.run_response.audio = []
+                    self.run_response.audio.append(model_response_chunk.audio)
+                    self.run_response.response_audio = model_response_chunk.audio
+                    yield self.run_response
             elif model_response_chunk.event == ModelResponseEvent.tool_call_started.value:
                 # Add tool call to the run_response
                 tool_call_dict = model_response_chunk.tool_call
@@ -561,6 +576,8 @@ async def _arun(
             self.run_response.content_type = self.response_model.__name__
         else:
             self.run_response.content = model_response.content
+        if model_response.audio is not None:
+            self.run_response.response_audio = model_response.audio
         self.run_response.messages = messages_for_model
         self.run_response.created_at = model_response.created_at
 
@@ -632,7 +649,7 @@ async def _arun(
         await self.memory.aupdate_summary()
 
     # 7. Save session to storage
-    self.write_to_storage()
+    await asyncio.to_thread(self.write_to_storage)
 
     # 8. Save output to file if save_response_to_file is set
     self.save_run_response_to_file(message=message)
@@ -28,6 +28,26 @@ class Document(BaseModel):
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    @staticmethod
+    def embed_documents(documents: List["Document"], embedder: Embedder) -> Optional[Dict[str, Any]]:
+        """Embed the documents that have no embedding yet, in batched requests to the embedder.
+
+        Returns the combined usage of the requests. Each document's usage is its share of
+        that total, in proportion to the length of its content.
+        """
+        pending = [document for document in documents if document.embedding is None]
+        if not pending:
+            return None
+
+        embeddings, usage = embedder.get_embeddings_and_usage([document.content for document in pending])
+        if len(embeddings) != len(pending):
+            raise ValueError(f"Embedder returned {len(embeddings)} embeddings for {len(pending)} documents")
+        shares = embedder.split_usage(usage, [len(document.content) for document in pending])
+        for document, embedding, share in zip(pending, embeddings, shares):
+            document.embedding = embedding
+            document.usage = share
+        return usage
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
 
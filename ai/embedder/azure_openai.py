@@ -1,5 +1,5 @@
 from os import getenv
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from typing_extensions import Literal
 
 from ai.embedder.base import Embedder
@@ -53,7 +53,7 @@ class AzureOpenAIEmbedder(Embedder):
             _client_params["azure_ad_token_provider"] = self.azure_ad_token_provider
         return AzureOpenAIClient(**_client_params)
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.model,
@@ -81,3 +81,12 @@ class AzureOpenAIEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.batches(texts):
+            response: CreateEmbeddingResponse = self._response(text=batch)
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+            usage = self.merge_usage(usage, response.usage.model_dump() if response.usage else None)
+        return embeddings, usage
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Any, Iterator
 
 from pydantic import BaseModel, ConfigDict
 
@@ -7,6 +7,8 @@ class Embedder(BaseModel):
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts sent to the embedding backend in one request
+    batch_size: int = 64
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -15,3 +17,71 @@ class Embedder(BaseModel):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts, returning one embedding per text in the same order"""
+        return self.get_embeddings_and_usage(texts)[0]
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Embed several texts, returning one embedding per text and the combined usage of the requests.
+
+        Embedders whose backend accepts several inputs per request override this;
+        the default embeds the texts one at a time.
+        """
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict[str, Any]] = None
+        for text in texts:
+            embedding, text_usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usage = self.merge_usage(usage, text_usage)
+        return embeddings, usage
+
+    def batches(self, texts: List[str]) -> Iterator[List[str]]:
+        """Split texts into request-sized batches"""
+        size = max(1, self.batch_size)
+        for start in range(0, len(texts), size):
+            yield texts[start : start + size]
+
+    @staticmethod
+    def merge_usage(usage: Optional[Dict[str, Any]], other: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Sum the numeric fields of two usage dicts"""
+        if not other:
+            return usage
+        if not usage:
+            return dict(other)
+        merged = dict(usage)
+        for key, value in other.items():
+            if isinstance(value, (int, float)) and isinstance(merged.get(key), (int, float)):
+                merged[key] += value
+            elif key not in merged:
+                merged[key] = value
+        return merged
+
+    @staticmethod
+    def split_usage(usage: Optional[Dict[str, Any]], weights: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """Split the numeric fields of a usage dict into one share per weight.
+
+        Integer fields are split so that the shares add up to the original value.
+        """
+        if not usage or not weights:
+            return [None] * len(weights)
+        total = sum(weights)
+        fractions = [weight / total if total else 1 / len(weights) for weight in weights]
+        shares: List[Dict[str, Any]] = [{} for _ in weights]
+        for key, value in usage.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                for share in shares:
+                    share[key] = value
+            elif isinstance(value, float):
+                for share, fraction in zip(shares, fractions):
+                    share[key] = value * fraction
+            else:
+                exact = [value * fraction for fraction in fractions]
+                parts = [int(part) for part in exact]
+                # Hand the rounding remainder to the largest fractional parts
+                by_remainder = sorted(range(len(parts)), key=lambda i: exact[i] - parts[i], reverse=True)
+                for i in by_remainder[: value - sum(parts)]:
+                    parts[i] += 1
+                for share, part in zip(shares, parts):
+                    share[key] = part
+        return shares
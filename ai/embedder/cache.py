@@ -0,0 +1,234 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import ConfigDict, model_validator
+
+from ai.embedder.base import Embedder
+from ai.utils.log import logger
+
+# (model id, dimensions, sha256 of the text)
+CacheKey = Tuple[str, int, str]
+
+# Embedder settings that don't change the vectors an embedder returns
+_IGNORED_SETTINGS = ("batch_size", "timeout", "max_retries", "user")
+_SECRET_MARKERS = ("key", "token", "secret", "password", "client")
+
+
+class EmbeddingCache:
+    """Two-tier cache of embeddings: an in-memory LRU in front of an optional SQLite file.
+
+    Vectors are held as float32, in memory and on disk. The cache is thread-safe
+    and the SQLite file can be shared by several processes.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_memory_entries: int = 10000):
+        self.path: Optional[Path] = Path(path) if path else None
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[CacheKey, array]" = OrderedDict()
+        # Guards the LRU and counters; lookups that hit memory never wait on SQLite
+        self._lock = threading.Lock()
+        # Serializes use of the shared SQLite connection
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "model TEXT NOT NULL, dimensions INTEGER NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+                    "PRIMARY KEY (model, dimensions, text_hash))"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                # The memory tier still works without the file
+                logger.warning(f"Embedding cache at {self.path} unavailable: {e}")
+                self._db = None
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get_many(self, keys: List[CacheKey]) -> Dict[CacheKey, List[float]]:
+        """Cached embeddings of the keys that have one"""
+        found: Dict[CacheKey, array] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            self.memory_hits += len(found)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        from_disk = self._read(missing) if missing and self._db is not None else {}
+        found.update(from_disk)
+        with self._lock:
+            self.disk_hits += len(from_disk)
+            for key, vector in from_disk.items():
+                self._remember(key, vector)
+            self.misses += len(set(keys) - set(found))
+        return {key: vector.tolist() for key, vector in found.items()}
+
+    def put_many(self, items: Dict[CacheKey, List[float]]) -> None:
+        vectors = {key: array("f", embedding) for key, embedding in items.items() if embedding}
+        if not vectors:
+            return
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+        with self._db_lock:
+            if self._db is None:
+                return
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, dimensions, text_hash, vector) VALUES (?, ?, ?, ?)",
+                    [(*key, vector.tobytes()) for key, vector in vectors.items()],
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write embeddings to cache: {e}")
+
+    def _remember(self, key: CacheKey, vector: array) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read(self, keys: List[CacheKey]) -> Dict[CacheKey, array]:
+        found: Dict[CacheKey, array] = {}
+        # One query per model and dimensions, with the text hashes in batches below
+        # SQLite's bound-parameter limit
+        by_model: Dict[Tuple[str, int], List[str]] = {}
+        for model, dimensions, text_hash in keys:
+            by_model.setdefault((model, dimensions), []).append(text_hash)
+        with self._db_lock:
+            if self._db is None:
+                return found
+            try:
+                for (model, dimensions), hashes in by_model.items():
+                    for start in range(0, len(hashes), 500):
+                        chunk = hashes[start : start + 500]
+                        rows = self._db.execute(
+                            "SELECT text_hash, vector FROM embeddings WHERE model = ? AND dimensions = ? "
+                            f"AND text_hash IN ({', '.join('?' * len(chunk))})",
+                            (model, dimensions, *chunk),
+                        ).fetchall()
+                        for text_hash, blob in rows:
+                            vector = array("f")
+                            vector.frombytes(blob)
+                            found[(model, dimensions, text_hash)] = vector
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read embeddings from cache: {e}")
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per tier and memory occupancy"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "lookups": lookups,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_memory_entries,
+                "path": str(self.path) if self.path else None,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class CachedEmbedder(Embedder):
+    """Embedder that serves repeated texts from an EmbeddingCache and embeds only the rest.
+
+    Entries are keyed by (model_id, dimensions, text hash). model_id defaults to the
+    wrapped embedder's class, model and the other settings that change its vectors.
+    Embeddings served from the cache report no usage.
+    """
+
+    embedder: Embedder
+    cache: EmbeddingCache
+    model_id: Optional[str] = None
+    # Mirrors the wrapped embedder's model, for callers that read it
+    model: Optional[str] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, protected_namespaces=())
+
+    @model_validator(mode="after")
+    def mirror_embedder(self) -> "CachedEmbedder":
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.model = getattr(self.embedder, "model", None)
+        if self.model_id is None:
+            self.model_id = self.embedder_id(self.embedder)
+        return self
+
+    @staticmethod
+    def embedder_id(embedder: Embedder) -> str:
+        """Class and model of an embedder, plus a digest of the other settings that change its vectors"""
+        settings = {}
+        for name, value in embedder.model_dump(exclude={"dimensions", "model"}).items():
+            if name in _IGNORED_SETTINGS or any(marker in name for marker in _SECRET_MARKERS):
+                continue
+            if value is None or isinstance(value, (str, int, float, bool, list, dict)):
+                settings[name] = value
+        digest = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()[:12]
+        return f"{type(embedder).__name__}:{getattr(embedder, 'model', '')}:{digest}"
+
+    def _key(self, text: str) -> CacheKey:
+        return self.model_id or "", self.dimensions or 0, self.cache.text_hash(text)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self._key(text)
+        cached = self.cache.get_many([key])
+        if key in cached:
+            return cached[key], None
+        embedding, usage = self.embedder.get_embedding_and_usage(text)
+        self.cache.put_many({key: embedding})
+        return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        keys = [self._key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        # Each distinct missing text is embedded once
+        missing: Dict[CacheKey, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        usage: Optional[Dict] = None
+        if missing:
+            embeddings, usage = self.embedder.get_embeddings_and_usage(list(missing.values()))
+            fresh = dict(zip(missing.keys(), embeddings))
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+        return [cached.get(key, []) for key in keys], usage
@@ -28,7 +28,9 @@ class CohereEmbedder(Embedder):
             client_params["api_key"] = self.api_key
         return CohereClient(**client_params)
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    def response(
+        self, text: Union[str, List[str]]
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.model:
@@ -39,7 +41,8 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        texts = [text] if isinstance(text, str) else text
+        return self.client.embed(texts=texts, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -68,3 +71,20 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict[str, Any]] = None
+        for batch in self.batches(texts):
+            response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=batch)
+            if isinstance(response, EmbeddingsFloatsEmbedResponse):
+                embeddings.extend(response.embeddings)
+            elif isinstance(response, EmbeddingsByTypeEmbedResponse) and response.embeddings.float_:
+                embeddings.extend(response.embeddings.float_)
+            else:
+                logger.warning("No embeddings found")
+                embeddings.extend([] for _ in batch)
+            billed_units = response.meta.billed_units if response.meta else None
+            if billed_units:
+                usage = self.merge_usage(usage, billed_units.model_dump())
+        return embeddings, usage
@@ -14,17 +14,25 @@ class FastEmbedEmbedder(Embedder):
 
     model: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    fastembed_client: Optional[TextEmbedding] = None
+
+    def _client(self) -> TextEmbedding:
+        # Loading the model is expensive, so it is done once per embedder
+        if self.fastembed_client is None:
+            self.fastembed_client = TextEmbedding(model_name=self.model)
+        return self.fastembed_client
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.model)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)
+        embeddings = self.get_embeddings([text])
+        return embeddings[0] if embeddings else []
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
 
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
         try:
-            return embedding_list
+            embeddings = self._client().embed(texts, batch_size=self.batch_size)
+            return [embedding.tolist() for embedding in embeddings], None
         except Exception as e:
             logger.warning(e)
-            return []
-
-    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
-        return super().get_embedding_and_usage(text)
+            return [[] for _ in texts], None
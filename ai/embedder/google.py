@@ -35,7 +35,7 @@ class GeminiEmbedder(Embedder):
         self.gemini_client.configure(**_client_params)  # type: ignore
         return self.gemini_client
 
-    def _response(self, text: str) -> Union[EmbeddingDict, BatchEmbeddingDict]:
+    def _response(self, text: Union[str, List[str]]) -> Union[EmbeddingDict, BatchEmbeddingDict]:
         _request_params: Dict[str, Any] = {
             "content": text,
             "model": self.model,
@@ -63,3 +63,11 @@ class GeminiEmbedder(Embedder):
         except Exception as e:
             logger.warning(e)
             return [], usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        for batch in self.batches(texts):
+            # A list of contents is embedded in one batch request
+            response = self._response(text=batch)
+            embeddings.extend(response.get("embedding", [[] for _ in batch]))
+        return embeddings, None
@@ -1,6 +1,6 @@
 import json
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ai.embedder.base import Embedder
 from ai.utils.log import logger
@@ -32,7 +32,7 @@ class HuggingfaceCustomEmbedder(Embedder):
             _client_params.update(self.client_params)
         return InferenceClient(**_client_params)
 
-    def _response(self, text: str):
+    def _response(self, text: Union[str, List[str]]):
         _request_params: SentenceSimilarityInput = {
             "json": {"inputs": text},
             "model": self.model,
@@ -51,3 +51,14 @@ class HuggingfaceCustomEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        for batch in self.batches(texts):
+            response = self._response(text=batch)
+            try:
+                embeddings.extend(json.loads(response.decode("utf-8")))
+            except Exception as e:
+                logger.warning(e)
+                embeddings.extend([] for _ in batch)
+        return embeddings, None
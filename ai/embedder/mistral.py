@@ -1,5 +1,5 @@
 from os import getenv
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 
 from ai.embedder.base import Embedder
 from ai.utils.log import logger
@@ -43,7 +43,7 @@ class MistralEmbedder(Embedder):
             _client_params.update(self.client_params)
         return Mistral(**_client_params)
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.model,
@@ -66,3 +66,12 @@ class MistralEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.batches(texts):
+            response: EmbeddingResponse = self._response(text=batch)
+            embeddings.extend(item.embedding for item in response.data)
+            usage = self.merge_usage(usage, response.usage.model_dump() if response.usage else None)
+        return embeddings, usage
@@ -54,3 +54,23 @@ class OllamaEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        client = self.client
+        if not hasattr(client, "embed"):
+            # ollama clients before 0.3 only have the single-prompt embeddings endpoint
+            return super().get_embeddings_and_usage(texts)
+
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+
+        embeddings: List[List[float]] = []
+        for batch in self.batches(texts):
+            try:
+                response = client.embed(model=self.model, input=batch, **kwargs)
+                embeddings.extend(response["embeddings"])
+            except Exception as e:
+                logger.warning(e)
+                embeddings.extend([] for _ in batch)
+        return embeddings, None
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from typing_extensions import Literal
 
 from ai.embedder.base import Embedder
@@ -39,7 +39,7 @@ class OpenAIEmbedder(Embedder):
             _client_params.update(self.client_params)
         return OpenAIClient(**_client_params)
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.model,
@@ -69,3 +69,13 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.batches(texts):
+            response: CreateEmbeddingResponse = self.response(text=batch)
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+            if response.usage:
+                usage = self.merge_usage(usage, response.usage.model_dump())
+        return embeddings, usage
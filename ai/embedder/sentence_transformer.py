@@ -47,12 +47,16 @@ class SentenceTransformerEmbedder(Embedder):
             logger.debug(f"Truncated embedding from {current_dim} to {self.target_dimensions} dimensions")
             return truncated.tolist()
 
-    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+    def _client(self) -> SentenceTransformer:
         if self.sentence_transformer_client is None:
             self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.model)
-        
+        return self.sentence_transformer_client
+
+    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        client = self._client()
+
         try:
-            embedding = self.sentence_transformer_client.encode(text)
+            embedding = client.encode(text)
             
             # Handle both single text and list of texts
             if isinstance(text, str):
@@ -67,3 +71,13 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        client = self._client()
+        try:
+            # encode batches the texts itself
+            embeddings = client.encode(texts, batch_size=self.batch_size, show_progress_bar=False)
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            return [[] for _ in texts], None
+        return [self._pad_or_truncate_embedding(embedding) for embedding in embeddings], None
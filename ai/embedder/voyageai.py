@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ai.embedder.base import Embedder
 from ai.utils.log import logger
@@ -37,9 +37,9 @@ class VoyageAIEmbedder(Embedder):
             _client_params.update(self.client_params)
         return Client(**_client_params)
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingsObject:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": [text] if isinstance(text, str) else text,
             "model": self.model,
         }
         if self.request_params:
@@ -60,3 +60,12 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.batches(texts):
+            response: EmbeddingsObject = self._response(text=batch)
+            embeddings.extend(response.embeddings)
+            usage = self.merge_usage(usage, {"total_tokens": response.total_tokens})
+        return embeddings, usage
@@ -87,22 +87,10 @@ class AgentKnowledge(AssistantKnowledge):
         self.vector_db.create()
 
         logger.info("Loading knowledge base")
-        num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                self.vector_db.upsert(documents=documents_to_load, filters=filters)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    documents_to_load = [
-                        document for document in document_list if not self.vector_db.doc_exists(document)
-                    ]
-                self.vector_db.insert(documents=documents_to_load, filters=filters)
-            num_documents += len(documents_to_load)
-            logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+        num_documents = self._pipeline().run(
+            self.document_lists, upsert=upsert, skip_existing=skip_existing, filters=filters
+        )
+        logger.info(f"Added {num_documents} documents to knowledge base")
 
     def load_documents(
         self,
@@ -128,23 +116,9 @@ class AgentKnowledge(AssistantKnowledge):
         logger.debug("Creating collection")
         self.vector_db.create()
 
-        # Upsert documents if upsert is True
-        if upsert and self.vector_db.upsert_available():
-            self.vector_db.upsert(documents=documents, filters=filters)
-            logger.info(f"Loaded {len(documents)} documents to knowledge base")
-            return
-
-        # Filter out documents which already exist in the vector db
-        documents_to_load = (
-            [document for document in documents if not self.vector_db.doc_exists(document)]
-            if skip_existing
-            else documents
-        )
-
-        # Insert documents
-        if len(documents_to_load) > 0:
-            self.vector_db.insert(documents=documents_to_load, filters=filters)
-            logger.info(f"Loaded {len(documents_to_load)} documents to knowledge base")
+        num_documents = self._pipeline().run([documents], upsert=upsert, skip_existing=skip_existing, filters=filters)
+        if num_documents > 0:
+            logger.info(f"Loaded {num_documents} documents to knowledge base")
         else:
             logger.info("No new documents to load")
 
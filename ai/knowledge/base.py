@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict
 from ai.document import Document
 from ai.document.reader.base import Reader
 from ai.vectordb import VectorDb
+from ai.knowledge.pipeline import IngestionPipeline
 from ai.utils.log import logger
 
 
@@ -19,10 +20,18 @@ class AssistantKnowledge(BaseModel):
     num_documents: int = 2
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Number of batches embedded concurrently while loading
+    embed_workers: int = 4
+    # Number of batches each loading stage may hold ahead of the next
+    ingest_queue_size: int = 8
 
     driver: str = "knowledge"
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    def _pipeline(self) -> IngestionPipeline:
+        """Pipeline loading documents into the vector db; only called once a vector db is set"""
+        return IngestionPipeline(self.vector_db, embed_workers=self.embed_workers, queue_size=self.ingest_queue_size)
+
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterator that yields lists of documents in the knowledge base
@@ -74,22 +83,10 @@ class AssistantKnowledge(BaseModel):
         self.vector_db.create()
 
         logger.info("Loading knowledge base")
-        num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                self.vector_db.upsert(documents=documents_to_load, filters=filters)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    documents_to_load = [
-                        document for document in document_list if not self.vector_db.doc_exists(document)
-                    ]
-                self.vector_db.insert(documents=documents_to_load, filters=filters)
-            num_documents += len(documents_to_load)
-            logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+        num_documents = self._pipeline().run(
+            self.document_lists, upsert=upsert, skip_existing=skip_existing, filters=filters
+        )
+        logger.info(f"Added {num_documents} documents to knowledge base")
 
     def load_documents(
         self,
@@ -115,23 +112,9 @@ class AssistantKnowledge(BaseModel):
         logger.debug("Creating collection")
         self.vector_db.create()
 
-        # Upsert documents if upsert is True
-        if upsert and self.vector_db.upsert_available():
-            self.vector_db.upsert(documents=documents, filters=filters)
-            logger.info(f"Loaded {len(documents)} documents to knowledge base")
-            return
-
-        # Filter out documents which already exist in the vector db
-        documents_to_load = (
-            [document for document in documents if not self.vector_db.doc_exists(document)]
-            if skip_existing
-            else documents
-        )
-
-        # Insert documents
-        if len(documents_to_load) > 0:
-            self.vector_db.insert(documents=documents_to_load, filters=filters)
-            logger.info(f"Loaded {len(documents_to_load)} documents to knowledge base")
+        num_documents = self._pipeline().run([documents], upsert=upsert, skip_existing=skip_existing, filters=filters)
+        if num_documents > 0:
+            logger.info(f"Loaded {num_documents} documents to knowledge base")
         else:
             logger.info("No new documents to load")
 
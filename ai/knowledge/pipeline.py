@@ -0,0 +1,165 @@
+import queue
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from ai.document import Document
+from ai.embedder import Embedder
+from ai.vectordb import VectorDb
+from ai.utils.log import logger
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+class IngestionPipeline:
+    """Loads documents into a vector db through concurrent stages connected by bounded queues.
+
+    A reader thread iterates the document lists (readers extract and chunk each source) and
+    splits them into embedding batches; embedding workers filter out documents the vector db
+    already holds and embed each batch in one request; the calling thread writes the embedded
+    batches to the vector db. The bounded queues keep a fast reader from holding a whole
+    knowledge base in memory while the embedding backend catches up.
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDb,
+        embed_workers: int = 4,
+        queue_size: int = 8,
+        batch_size: Optional[int] = None,
+    ):
+        self.vector_db = vector_db
+        # Vector dbs without an embedder attribute embed in insert/upsert themselves
+        self.embedder: Optional[Embedder] = getattr(vector_db, "embedder", None)
+        self.embed_workers = max(1, embed_workers)
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size or (self.embedder.batch_size if self.embedder else 64))
+
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+
+    def run(
+        self,
+        document_lists: Iterable[List[Document]],
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Load the documents and return how many were written
+
+        Args:
+            document_lists (Iterable[List[Document]]): Lists of documents, e.g. a knowledge base's document_lists
+            upsert (bool): If True and the vector db supports it, upserts documents. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
+            filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying. Defaults to None.
+        """
+        use_upsert = upsert and self.vector_db.upsert_available()
+        skip_existing = skip_existing and not use_upsert
+        self._stop = threading.Event()
+        self._errors = []
+
+        batches: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        embedded: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        threads = [
+            threading.Thread(target=self._read, args=(document_lists, batches), name="knowledge-reader", daemon=True)
+        ]
+        threads.extend(
+            threading.Thread(
+                target=self._embed,
+                args=(batches, embedded, skip_existing),
+                name=f"knowledge-embedder-{i}",
+                daemon=True,
+            )
+            for i in range(self.embed_workers)
+        )
+        for thread in threads:
+            thread.start()
+
+        num_documents = 0
+        workers_done = 0
+        try:
+            while workers_done < self.embed_workers:
+                batch = embedded.get()
+                if batch is _DONE:
+                    workers_done += 1
+                    continue
+                if self._stop.is_set():
+                    continue
+                try:
+                    if use_upsert:
+                        self.vector_db.upsert(documents=batch, filters=filters)
+                    else:
+                        self.vector_db.insert(documents=batch, filters=filters)
+                except BaseException as e:
+                    self._fail(e)
+                    continue
+                num_documents += len(batch)
+                logger.debug(f"Added {len(batch)} documents to knowledge base")
+        finally:
+            self._stop.set()
+            # Unblock workers still handing over batches if the loop above was interrupted
+            while any(thread.is_alive() for thread in threads):
+                try:
+                    embedded.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+        if self._errors:
+            raise self._errors[0]
+        return num_documents
+
+    def _fail(self, error: BaseException) -> None:
+        self._errors.append(error)
+        self._stop.set()
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """Put item, giving up if the pipeline is stopping; returns whether it was queued"""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _finish(target: queue.Queue, count: int) -> None:
+        # Consumers read until their end marker, so these puts always complete
+        for _ in range(count):
+            target.put(_DONE)
+
+    def _read(self, document_lists: Iterable[List[Document]], batches: queue.Queue) -> None:
+        try:
+            for document_list in document_lists:
+                for start in range(0, len(document_list), self.batch_size):
+                    if not self._put(batches, document_list[start : start + self.batch_size]):
+                        return
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._finish(batches, self.embed_workers)
+
+    def _embed(self, batches: queue.Queue, embedded: queue.Queue, skip_existing: bool) -> None:
+        try:
+            while True:
+                batch = batches.get()
+                if batch is _DONE:
+                    return
+                if self._stop.is_set():
+                    continue
+                if skip_existing:
+                    existing = self.vector_db.docs_exist(batch)
+                    batch = [document for position, document in enumerate(batch) if position not in existing]
+                if not batch:
+                    continue
+                if self.embedder is not None:
+                    Document.embed_documents(batch, self.embedder)
+                self._put(embedded, batch)
+        except BaseException as e:
+            self._fail(e)
+            # Keep consuming so the reader is never blocked on a full queue
+            while batches.get() is not _DONE:
+                pass
+        finally:
+            self._finish(embedded, 1)
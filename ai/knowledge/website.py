@@ -75,7 +75,10 @@ class WebsiteKnowledgeBase(AgentKnowledge):
             document_list = self.reader.read(url=url)
             # Filter out documents which already exist in the vector db
             if not recreate:
-                document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
+                existing = self.vector_db.docs_exist(document_list)
+                document_list = [
+                    document for position, document in enumerate(document_list) if position not in existing
+                ]
             if upsert and self.vector_db.upsert_available():
                 self.vector_db.upsert(documents=document_list, filters=filters)
             else:
@@ -58,11 +58,13 @@ class AzureOpenAIChat(OpenAILike):
 
     def get_async_client(self) -> AsyncAzureOpenAIClient:
         """
-        Returns an asynchronous OpenAI client.
+        Returns an asynchronous OpenAI client, reused across calls (and by model_copy clones) so connections are pooled.
 
         Returns:
             AsyncAzureOpenAIClient: An instance of the asynchronous OpenAI client.
         """
+        if self.async_client:
+            return self.async_client
 
         _client_params: Dict[str, Any] = self.get_client_params()
 
@@ -73,7 +75,8 @@ class AzureOpenAIChat(OpenAILike):
             _client_params["http_client"] = httpx.AsyncClient(
                 limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
             )
-        return AsyncAzureOpenAIClient(**_client_params)
+        self.async_client = AsyncAzureOpenAIClient(**_client_params)
+        return self.async_client
 
     def get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {}
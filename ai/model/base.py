@@ -1,7 +1,8 @@
+import asyncio
 import collections.abc
 
 from types import GeneratorType
-from typing import List, Iterator, Optional, Dict, Any, Callable, Union, Sequence
+from typing import List, Iterator, AsyncIterator, Optional, Dict, Any, Callable, Union, Sequence
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo
 
@@ -304,6 +305,19 @@ class Model(BaseModel):
                 self.deactivate_function_calls()
                 break  # Exit early if we reach the function call limit
 
+    async def arun_function_calls(
+        self, function_calls: List[FunctionCall], function_call_results: List[Message], tool_role: str = "tool"
+    ) -> AsyncIterator[ModelResponse]:
+        """Async variant of run_function_calls. Tools are synchronous, so each step runs in a worker thread."""
+        function_call_iterator = self.run_function_calls(
+            function_calls=function_calls, function_call_results=function_call_results, tool_role=tool_role
+        )
+        while True:
+            model_response = await asyncio.to_thread(next, function_call_iterator, None)
+            if model_response is None:
+                return
+            yield model_response
+
     def handle_post_tool_call_messages(self, messages: List[Message], model_response: ModelResponse) -> ModelResponse:
         last_message = messages[-1]
         if last_message.stop_after_tool_call:
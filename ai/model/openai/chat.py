@@ -1,6 +1,6 @@
 from os import getenv
 from dataclasses import dataclass, field
-from typing import Optional, List, Iterator, Dict, Any, Union
+from typing import Optional, List, Iterator, AsyncIterator, Dict, Any, Union
 
 import httpx
 from pydantic import BaseModel
@@ -24,7 +24,9 @@ from ai.model.openai.chat_utils import (
     create_assistant_message,
     get_request_kwargs,
     handle_tool_calls,
-    handle_stream_tool_calls
+    handle_stream_tool_calls,
+    ahandle_tool_calls,
+    ahandle_stream_tool_calls,
 )
 
 try:
@@ -42,7 +44,7 @@ try:
         )
 
     from openai.types.chat.chat_completion_message import ChatCompletionMessage, ChatCompletionAudio
-    from openai import OpenAI as OpenAIClient
+    from openai import OpenAI as OpenAIClient, AsyncOpenAI as AsyncOpenAIClient
     from openai.types.completion_usage import CompletionUsage
     from openai.types.chat.chat_completion import ChatCompletion
     from openai.types.chat.parsed_chat_completion import ParsedChatCompletion
@@ -101,6 +103,7 @@ class OpenAIChat(Model):
     client_params: Optional[Dict[str, Any]] = None
     # OpenAI clients
     client: Optional[OpenAIClient] = None
+    async_client: Optional[AsyncOpenAIClient] = None
     # Whether to use the structured outputs with this Model.
     structured_outputs: Optional[bool] = False
     # Whether the Model supports structured outputs.
@@ -136,6 +139,20 @@ class OpenAIChat(Model):
         new_client = OpenAIClient(**client_params)
         return new_client
 
+    def get_async_client(self) -> AsyncOpenAIClient:
+        """
+        Returns an asynchronous OpenAI client, reused across calls (and by model_copy clones) so connections are pooled.
+
+        Returns:
+            AsyncOpenAIClient: An instance of the asynchronous OpenAI client.
+        """
+        if self.async_client:
+            return self.async_client
+
+        client_params: Dict[str, Any] = self.get_client_params()
+        self.async_client = AsyncOpenAIClient(**client_params)
+        return self.async_client
+
     @property
     def request_kwargs(self) -> Dict[str, Any]:
         """
@@ -258,6 +275,45 @@ class OpenAIChat(Model):
             logger.error(f"Error during OpenAI stream creation or iteration: {e}")
             raise
 
+    async def ainvoke(self, messages: List[Message]) -> Union[ChatCompletion, ParsedChatCompletion]:
+        """
+        Send an asynchronous chat completion request to the OpenAI API.
+        """
+        request_kwargs = self.request_kwargs
+        formatted_messages = [self.format_message(m) for m in messages] # type: ignore
+
+        if self.response_format is not None and self.structured_outputs:
+            if isinstance(self.response_format, type) and issubclass(self.response_format, BaseModel):
+                return await self.get_async_client().beta.chat.completions.parse(
+                    model=self.id,
+                    messages=formatted_messages,
+                    **request_kwargs,
+                )
+            raise ValueError("response_format must be a subclass of BaseModel if structured_outputs=True")
+
+        return await self.get_async_client().chat.completions.create(
+            model=self.id,
+            messages=formatted_messages,
+            **request_kwargs,
+        )
+
+    async def ainvoke_stream(self, messages: List[Message]) -> AsyncIterator[ChatCompletionChunk]:
+        """
+        Send an asynchronous streaming chat completion request to the OpenAI API.
+        """
+        formatted_messages = [self.format_message(m) for m in messages] # type: ignore
+        request_kwargs = self.request_kwargs
+
+        stream = await self.get_async_client().chat.completions.create(
+            model=self.id,
+            messages=formatted_messages,
+            stream=True,
+            stream_options={"include_usage": True},
+            **request_kwargs,
+        )
+        async for chunk in stream:  # type: ignore
+            yield chunk
+
     def handle_tool_calls(
         self,
         assistant_message: Message,
@@ -425,6 +481,80 @@ class OpenAIChat(Model):
         logger.debug("---------- OpenAI Response End ----------")
         return model_response
 
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        """
+        Generate an asynchronous response from OpenAI.
+        """
+        logger.debug("---------- OpenAI Async Response Start ----------")
+        self._log_messages(messages)
+        model_response = ModelResponse()
+        metrics = Metrics()
+
+        # -*- Generate response
+        metrics.response_timer.start()
+        try:
+            response: Union[ChatCompletion, ParsedChatCompletion] = await self.ainvoke(messages=messages)
+        except Exception as e:
+            logger.error(f"Failed to invoke OpenAI model: {e}")
+            model_response.error = str(e)
+            return model_response
+        metrics.response_timer.stop()
+
+        # -*- Parse response
+        response_message: ChatCompletionMessage = response.choices[0].message
+        response_usage: Optional[CompletionUsage] = response.usage
+        response_audio: Optional[ChatCompletionAudio] = response_message.audio
+
+        # -*- Parse transcript if available
+        if response_audio:
+            if response_audio.transcript and not response_message.content:
+                response_message.content = response_audio.transcript
+
+        # -*- Parse structured outputs
+        try:
+            if (
+                self.response_format is not None
+                and self.structured_outputs
+                and issubclass(self.response_format, BaseModel)
+            ):
+                parsed_object = response_message.parsed  # type: ignore
+                if parsed_object is not None:
+                    model_response.parsed = parsed_object
+        except Exception as e:
+            logger.warning(f"Error retrieving structured outputs: {e}")
+
+        # -*- Create assistant message and add it to messages
+        assistant_message = self.create_assistant_message(
+            response_message=response_message, metrics=metrics, response_usage=response_usage
+        )
+        messages.append(assistant_message)
+
+        # -*- Log response and metrics
+        assistant_message.log()
+        metrics.log()
+
+        # -*- Update model response with assistant message content and audio
+        if assistant_message.content is not None:
+            model_response.content = assistant_message.get_content_string()
+        if assistant_message.audio is not None:
+            model_response.audio = assistant_message.audio
+
+        # -*- Handle tool calls
+        tool_role = "tool"
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            tool_call_response = await ahandle_tool_calls(
+                assistant_message=assistant_message,
+                messages=messages,
+                model_response=model_response,
+                model=self,
+                tool_role=tool_role,
+            )
+            if tool_call_response is not None:
+                return await self.ahandle_post_tool_call_messages(messages=messages, model_response=tool_call_response)
+
+        logger.debug("---------- OpenAI Async Response End ----------")
+        return model_response
+
     def update_stream_metrics(self, assistant_message: Message, metrics: Metrics):
         """
         Update the usage metrics for the assistant message and the model.
@@ -556,3 +686,81 @@ class OpenAIChat(Model):
             logger.debug("No tool calls in assistant message from stream or run_tools is False.")
 
         logger.debug("---------- OpenAI Stream Response End ----------")
+
+    async def aresponse_stream(self, messages: List[Message]) -> AsyncIterator[ModelResponse]:
+        """
+        Generate an asynchronous streaming response from OpenAI.
+        """
+        logger.debug("---------- OpenAI Async Stream Response Start ----------")
+        self._log_messages(messages)
+        stream_data: StreamData = StreamData()
+        metrics: Metrics = Metrics()
+
+        # -*- Generate response
+        metrics.response_timer.start()
+        try:
+            async for response in self.ainvoke_stream(messages=messages):
+                if response.choices is not None and len(response.choices) > 0:
+                    metrics.completion_tokens += 1
+                    if metrics.completion_tokens == 1:
+                        metrics.time_to_first_token = metrics.response_timer.elapsed
+
+                    response_delta: ChoiceDelta = response.choices[0].delta
+
+                    if response_delta.content is not None:
+                        stream_data.response_content += response_delta.content
+                        yield ModelResponse(content=response_delta.content)
+
+                    if hasattr(response_delta, "audio") and response_delta.audio is not None:
+                        stream_data.response_audio = response_delta.audio
+                        yield ModelResponse(audio=response_delta.audio)
+
+                    if response_delta.tool_calls is not None:
+                        if stream_data.response_tool_calls is None:
+                            stream_data.response_tool_calls = []
+                        stream_data.response_tool_calls.extend(response_delta.tool_calls)
+
+                if response.usage is not None:
+                    add_response_usage_to_metrics(metrics=metrics, response_usage=response.usage)
+            metrics.response_timer.stop()
+        except Exception as e:
+            metrics.response_timer.stop()
+            logger.error(f"Error during async stream processing: {e}")
+            yield ModelResponse(content=f"Error: {str(e)}")
+            return
+
+        # -*- Create assistant message
+        assistant_message = Message(role="assistant")
+        if stream_data.response_content != "":
+            assistant_message.content = stream_data.response_content
+        if stream_data.response_audio is not None:
+            assistant_message.audio = stream_data.response_audio
+        if stream_data.response_tool_calls is not None:
+            _tool_calls = build_tool_calls(stream_data.response_tool_calls)
+            if len(_tool_calls) > 0:
+                assistant_message.tool_calls = _tool_calls
+
+        # -*- Update usage metrics
+        self.update_stream_metrics(assistant_message=assistant_message, metrics=metrics)
+
+        # -*- Add assistant message to messages
+        messages.append(assistant_message)
+
+        # -*- Log response and metrics
+        assistant_message.log()
+        metrics.log()
+
+        # -*- Handle tool calls
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            try:
+                async for tool_call_response in ahandle_stream_tool_calls(
+                    assistant_message=assistant_message, messages=messages, model=self, tool_role="tool"
+                ):
+                    yield tool_call_response
+                async for post_tool_call_response in self.ahandle_post_tool_call_messages_stream(messages=messages):
+                    yield post_tool_call_response
+            except Exception as e:
+                logger.error(f"Error during async stream tool call handling: {e}")
+                yield ModelResponse(content=f"Error: {str(e)}")
+
+        logger.debug("---------- OpenAI Async Stream Response End ----------")
@@ -558,3 +558,114 @@ def handle_stream_tool_calls(
 
         if len(function_call_results) > 0:
             messages.extend(function_call_results)
+
+
+async def ahandle_tool_calls(
+    assistant_message: Message,
+    messages: List[Message],
+    model_response: ModelResponse,
+    model,
+    tool_role: str = "tool",
+) -> Optional[ModelResponse]:
+    """
+    Async variant of handle_tool_calls that runs the tools off the event loop.
+
+    Args:
+        assistant_message (Message): The assistant message.
+        messages (List[Message]): The list of messages.
+        model_response (ModelResponse): The model response.
+        model: The model with configuration parameters.
+        tool_role (str): The role of the tool call. Defaults to "tool".
+
+    Returns:
+        Optional[ModelResponse]: The model response after handling tool calls.
+    """
+    if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and model.run_tools:
+        if model_response.content is None:
+            model_response.content = ""
+        function_call_results: List[Message] = []
+        function_calls_to_run = _get_function_calls_to_run(assistant_message, messages, model, tool_role="tool")
+
+        if model.show_tool_calls:
+            model_response.content += "\nRunning:"
+            for _f in function_calls_to_run:
+                model_response.content += f"\n - {_f.get_call_str()}"
+            model_response.content += "\n\n"
+
+        async for _ in model.arun_function_calls(
+            function_calls=function_calls_to_run, function_call_results=function_call_results, tool_role=tool_role
+        ):
+            pass
+
+        if len(function_call_results) > 0:
+            messages.extend(function_call_results)
+
+        return model_response
+    return None
+
+
+async def ahandle_stream_tool_calls(
+    assistant_message: Message,
+    messages: List[Message],
+    model,
+    tool_role: str = "tool",
+):
+    """
+    Async variant of handle_stream_tool_calls that runs the tools off the event loop.
+
+    Args:
+        assistant_message (Message): The assistant message.
+        messages (List[Message]): The list of messages.
+        model: The model with configuration parameters.
+        tool_role (str): The role of the tool call. Defaults to "tool".
+
+    Returns:
+        AsyncIterator[ModelResponse]: An async iterator of the model response.
+    """
+    if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and model.run_tools:
+        function_call_results: List[Message] = []
+        function_calls_to_run = _get_function_calls_to_run(assistant_message, messages, model, tool_role=tool_role)
+
+        if model.show_tool_calls:
+            yield ModelResponse(content="\nRunning:")
+            for _f in function_calls_to_run:
+                yield ModelResponse(content=f"\n - {_f.get_call_str()}")
+            yield ModelResponse(content="\n\n")
+
+        async for function_call_response in model.arun_function_calls(
+            function_calls=function_calls_to_run, function_call_results=function_call_results, tool_role=tool_role
+        ):
+            yield function_call_response
+
+        if len(function_call_results) > 0:
+            messages.extend(function_call_results)
+
+
+def _get_function_calls_to_run(
+    assistant_message: Message, messages: List[Message], model, tool_role: str = "tool"
+) -> List[FunctionCall]:
+    """Resolve tool calls to FunctionCalls, appending an error message for any that cannot run."""
+    function_calls_to_run: List[FunctionCall] = []
+    for tool_call in assistant_message.tool_calls:
+        _tool_call_id = tool_call.get("id")
+        _function_call = get_function_call_for_tool_call(tool_call, model.functions)
+        if _function_call is None:
+            messages.append(
+                Message(
+                    role=tool_role,
+                    tool_call_id=_tool_call_id,
+                    content="Could not find function to call.",
+                )
+            )
+            continue
+        if _function_call.error is not None:
+            messages.append(
+                Message(
+                    role=tool_role,
+                    tool_call_id=_tool_call_id,
+                    content=_function_call.error,
+                )
+            )
+            continue
+        function_calls_to_run.append(_function_call)
+    return function_calls_to_run
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 from ai.document import Document
 
@@ -15,6 +15,14 @@ class VectorDb(ABC):
     def doc_exists(self, document: Document) -> bool:
         raise NotImplementedError
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """Positions in documents of the documents that already exist.
+
+        Backends override this with a single batched lookup; the default checks
+        the documents one at a time.
+        """
+        return {position for position, document in enumerate(documents) if self.doc_exists(document)}
+
     @abstractmethod
     def name_exists(self, name: str) -> bool:
         raise NotImplementedError
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any, Iterable
+from typing import Optional, List, Dict, Any, Iterable, Set
 
 from ai.vectordb.base import VectorDb
 from ai.embedder import Embedder
@@ -64,6 +64,17 @@ class CassandraDb(VectorDb):
         result = self.session.execute(query, (document.id,))
         return result[0].count > 0
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """Positions in documents of the documents that exist, from one IN query by ID."""
+        ids = list({doc.id for doc in documents if doc.id is not None})
+        if not ids:
+            return set()
+        from cassandra.query import ValueSequence
+
+        query = f"SELECT row_id FROM {self.keyspace}.{self.table_name} WHERE row_id IN %s"
+        found = {row.row_id for row in self.session.execute(query, (ValueSequence(ids),))}
+        return {position for position, doc in enumerate(documents) if doc.id in found}
+
     def name_exists(self, name: str) -> bool:
         """Check if a document exists by name."""
         query = f"SELECT COUNT(*) FROM {self.keyspace}.{self.table_name} WHERE document_name = %s"
@@ -79,8 +90,8 @@ class CassandraDb(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         logger.debug(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
         futures = []
+        Document.embed_documents(documents, self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             metadata = {key: str(value) for key, value in doc.meta_data.items()}
             futures.append(
                 self.table.put_async(
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -101,6 +101,24 @@ class ChromaDb(VectorDb):
                 logger.error(f"Document does not exist: {e}")
         return False
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """Positions in documents of the documents in the collection, from one get by ids.
+        Args:
+            documents (List[Document]): Documents to check.
+        Returns:
+            Set[int]: Positions of the documents that exist.
+        """
+        if not self.client or not documents:
+            return set()
+        hashes = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection)
+            found = set(collection.get(ids=list(set(hashes)), include=[])["ids"])
+        except Exception as e:
+            logger.error(f"Error checking documents: {e}")
+            return set()
+        return {position for position, doc_id in enumerate(hashes) if doc_id in found}
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
         Args:
@@ -129,8 +147,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -160,8 +178,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
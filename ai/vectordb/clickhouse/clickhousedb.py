@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from ai.vectordb.clickhouse.index import HNSW
 
@@ -142,6 +142,27 @@ class ClickhouseDb(VectorDb):
         )
         return bool(result.result_rows)
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """
+        Positions in documents of the documents that exist, from one IN query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        if not documents:
+            return set()
+        hashes = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = list(set(hashes))
+
+        result = self.client.query(
+            "SELECT content_hash FROM {database_name:Identifier}.{table_name:Identifier} "
+            "WHERE content_hash IN {content_hashes:Array(String)}",
+            parameters=parameters,
+        )
+        found = {row[0] for row in result.result_rows}
+        return {position for position, content_hash in enumerate(hashes) if content_hash in found}
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -180,8 +201,8 @@ class ClickhouseDb(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
     ) -> None:
         rows: List[List[Any]] = []
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
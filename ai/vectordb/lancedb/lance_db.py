@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 import json
 
 try:
@@ -135,6 +135,23 @@ class LanceDb(VectorDb):
             return len(result) > 0
         return False
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """
+        Positions in documents of the documents that exist, from one filtered query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        if not self.table or not documents:
+            return set()
+        hashes = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        unique = list(set(hashes))
+        id_list = ", ".join(f"'{doc_id}'" for doc_id in unique)
+        query = self.table.search().where(f"{self._id} IN ({id_list})").select([self._id])
+        result = query.limit(len(unique)).to_arrow()
+        found = set(result.column(self._id).to_pylist())
+        return {position for position, doc_id in enumerate(hashes) if doc_id in found}
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -145,8 +162,8 @@ class LanceDb(VectorDb):
         """
         logger.debug(f"Inserting {len(documents)} documents")
         data = []
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
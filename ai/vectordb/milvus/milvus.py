@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 try:
     from pymilvus import MilvusClient  # type: ignore
@@ -102,6 +102,24 @@ class Milvus(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """
+        Positions in documents of the documents that exist, from one get by ids
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        if not self.client or not documents:
+            return set()
+        hashes = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        rows = self.client.get(
+            collection_name=self.collection,
+            ids=list(set(hashes)),
+            output_fields=["id"],
+        )
+        found = {row["id"] for row in rows}
+        return {position for position, doc_id in enumerate(hashes) if doc_id in found}
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -141,8 +159,8 @@ class Milvus(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         logger.debug(f"Inserting {len(documents)} documents")
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -177,8 +195,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         logger.debug(f"Upserting {len(documents)} documents")
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
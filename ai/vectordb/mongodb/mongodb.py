@@ -1,5 +1,5 @@
 import time
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 from ai.document import Document
 from ai.embedder import Embedder
@@ -181,6 +181,18 @@ class MongoDBVector(VectorDb):
             logger.error(f"Error checking document existence: {e}")
             return False
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """Positions in documents of the documents in the collection, from one $in query."""
+        hashes = [
+            md5(document.content.replace("\x00", "\ufffd").encode("utf-8")).hexdigest() for document in documents
+        ]
+        try:
+            found = {doc["_id"] for doc in self._collection.find({"_id": {"$in": list(set(hashes))}}, {"_id": 1})}
+        except Exception as e:
+            logger.error(f"Error checking documents existence: {e}")
+            return set()
+        return {position for position, doc_id in enumerate(hashes) if doc_id in found}
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection."""
         try:
@@ -206,6 +218,7 @@ class MongoDBVector(VectorDb):
         logger.info(f"Inserting {len(documents)} documents")
 
         prepared_docs = []
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -230,6 +243,7 @@ class MongoDBVector(VectorDb):
         """Upsert documents into the MongoDB collection."""
         logger.info(f"Upserting {len(documents)} documents")
 
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -360,7 +374,8 @@ class MongoDBVector(VectorDb):
 
     def prepare_doc(self, document: Document) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
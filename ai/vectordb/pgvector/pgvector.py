@@ -1,6 +1,6 @@
 from math import sqrt
 from hashlib import md5
-from typing import Optional, List, Union, Dict, Any, cast
+from typing import Optional, List, Union, Dict, Any, Set, cast
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -244,6 +244,24 @@ class PgVector(VectorDb):
         content_hash = md5(cleaned_content.encode()).hexdigest()
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """
+        Positions in documents of the documents whose content hash exists in the table, from one IN query.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            Set[int]: Positions of the documents that exist.
+        """
+        if not documents:
+            return set()
+        hashes = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        with self.Session() as sess, sess.begin():
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(set(hashes)))
+            found = set(sess.execute(stmt).scalars().all())
+        return {position for position, content_hash in enumerate(hashes) if content_hash in found}
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -301,10 +319,10 @@ class PgVector(VectorDb):
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
                         # Prepare documents for insertion
+                        Document.embed_documents(batch_docs, self.embedder)
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -365,10 +383,10 @@ class PgVector(VectorDb):
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
                         # Prepare documents for upserting
+                        Document.embed_documents(batch_docs, self.embedder)
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
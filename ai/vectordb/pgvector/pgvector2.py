@@ -1,4 +1,4 @@
-from typing import Optional, List, Union, Dict, Any
+from typing import Optional, List, Union, Dict, Any, Set
 from hashlib import md5
 
 try:
@@ -129,6 +129,22 @@ class PgVector2(VectorDb):
                 result = sess.execute(stmt).first()
                 return result is not None
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """
+        Positions in documents of the documents that exist, from one IN query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        if not documents:
+            return set()
+        hashes = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        with self.Session() as sess:
+            with sess.begin():
+                stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(set(hashes)))
+                found = set(sess.execute(stmt).scalars().all())
+        return {position for position, content_hash in enumerate(hashes) if content_hash in found}
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -158,8 +174,8 @@ class PgVector2(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: int = 10) -> None:
         with self.Session() as sess:
             counter = 0
+            Document.embed_documents(documents, self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -201,8 +217,8 @@ class PgVector2(VectorDb):
         """
         with self.Session() as sess:
             counter = 0
+            Document.embed_documents(documents, self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
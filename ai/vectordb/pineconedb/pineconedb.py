@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Set
 
 try:
     from pinecone import Pinecone, ServerlessSpec, PodSpec
@@ -182,6 +182,22 @@ class PineconeDB(VectorDb):
         response = self.index.fetch(ids=[document.id])
         return len(response.vectors) > 0
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """Positions in documents of the documents in the index, from one fetch by ids.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            Set[int]: Positions of the documents that exist.
+
+        """
+        ids = [document.id for document in documents if document.id is not None]
+        if not ids:
+            return set()
+        found = set(self.index.fetch(ids=list(set(ids))).vectors)
+        return {position for position, document in enumerate(documents) if document.id in found}
+
     def name_exists(self, name: str) -> bool:
         """Check if an index with the given name exists.
 
@@ -218,8 +234,8 @@ class PineconeDB(VectorDb):
         """
 
         vectors = []
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -1,5 +1,6 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from uuid import UUID
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 try:
     from qdrant_client import QdrantClient  # noqa: F401
@@ -35,6 +36,7 @@ class Qdrant(VectorDb):
         host: Optional[str] = None,
         path: Optional[str] = None,
         reranker: Optional[Reranker] = None,
+        client: Optional[QdrantClient] = None,
         **kwargs,
     ):
         # Collection attributes
@@ -51,8 +53,8 @@ class Qdrant(VectorDb):
         # Distance metric
         self.distance: Distance = distance
 
-        # Qdrant client instance
-        self._client: Optional[QdrantClient] = None
+        # Qdrant client instance (may be shared across collections on the same server)
+        self._client: Optional[QdrantClient] = client
 
         # Qdrant client arguments
         self.location: Optional[str] = location
@@ -108,6 +110,17 @@ class Qdrant(VectorDb):
                 vectors_config=models.VectorParams(size=self.dimensions, distance=_distance),
             )
 
+    @staticmethod
+    def doc_id(document: Document) -> str:
+        """
+        Point id of a document: the md5 of its content, so identical chunks map to one point
+
+        Args:
+            document (Document): Document to get the id of
+        """
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        return md5(cleaned_content.encode()).hexdigest()
+
     def doc_exists(self, document: Document) -> bool:
         """
         Validating if the document exists or not
@@ -116,15 +129,34 @@ class Qdrant(VectorDb):
             document (Document): Document to validate
         """
         if self.client:
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = md5(cleaned_content.encode()).hexdigest()
             collection_points = self.client.retrieve(
                 collection_name=self.collection,
-                ids=[doc_id],
+                ids=[self.doc_id(document)],
             )
             return len(collection_points) > 0
         return False
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """
+        Positions in documents of the documents that exist, from one retrieve per 1000 ids
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        ids = [self.doc_id(document) for document in documents]
+        found: Set[str] = set()
+        unique_ids = list(dict.fromkeys(ids))
+        for start in range(0, len(unique_ids), 1000):
+            points = self.client.retrieve(
+                collection_name=self.collection,
+                ids=unique_ids[start : start + 1000],
+                with_payload=False,
+                with_vectors=False,
+            )
+            # Qdrant returns the md5 hex ids in UUID form
+            found.update(UUID(str(point.id)).hex for point in points)
+        return {position for position, doc_id in enumerate(ids) if doc_id in found}
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -157,13 +189,12 @@ class Qdrant(VectorDb):
         """
         logger.debug(f"Inserting {len(documents)} documents")
         points = []
+        Document.embed_documents(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = md5(cleaned_content.encode()).hexdigest()
             points.append(
                 models.PointStruct(
-                    id=doc_id,
+                    id=self.doc_id(document),
                     vector=document.embedding,
                     payload={
                         "name": document.name,
@@ -203,11 +234,34 @@ class Qdrant(VectorDb):
             logger.error(f"Error getting embedding for Query: {query}")
             return []
 
+        search_results = [
+            document for document, _ in self.search_with_scores(query_embedding, limit=limit, with_vectors=True)
+        ]
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        return search_results
+
+    def search_with_scores(
+        self, query_embedding: List[float], limit: int = 5, with_vectors: bool = False
+    ) -> List[Tuple[Document, float]]:
+        """
+        Search with a precomputed query embedding, returning (document, score) pairs.
+
+        Scores are oriented so that higher is always more similar, which lets
+        results from several collections be merged by score.
+
+        Args:
+            query_embedding (List[float]): Embedding of the query
+            limit (int): Number of search results to return
+            with_vectors (bool): Whether to return the stored vectors on the documents
+        """
         try:
             results = self.client.search(
                 collection_name=self.collection,
                 query_vector=query_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
             )
@@ -220,26 +274,22 @@ class Qdrant(VectorDb):
                 logger.error(f"Error searching collection '{self.collection}': {e}")
                 raise
 
-        # Build search results
-        search_results: List[Document] = []
+        # Euclidean scores are distances (lower is better)
+        sign = -1.0 if self.distance == Distance.l2 else 1.0
+        scored_results: List[Tuple[Document, float]] = []
         for result in results:
             if result.payload is None:
                 continue
-            search_results.append(
-                Document(
-                    name=result.payload["name"],
-                    meta_data=result.payload["meta_data"],
-                    content=result.payload["content"],
-                    embedder=self.embedder,
-                    embedding=result.vector,
-                    usage=result.payload["usage"],
-                )
+            document = Document(
+                name=result.payload["name"],
+                meta_data=result.payload["meta_data"],
+                content=result.payload["content"],
+                embedder=self.embedder,
+                embedding=result.vector if with_vectors else None,
+                usage=result.payload["usage"],
             )
-
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
-        return search_results
+            scored_results.append((document, sign * result.score))
+        return scored_results
 
     def drop(self) -> None:
         if self.exists():
@@ -329,6 +379,30 @@ class Qdrant(VectorDb):
             logger.error(f"Error deleting documents by filename: {e}")
             return False
 
+    def delete_ids(self, ids: List[str]) -> bool:
+        """
+        Delete points from the collection by id.
+
+        Args:
+            ids (List[str]): Point ids, as returned by doc_id
+
+        Returns:
+            bool: True if deletion was successful, False otherwise
+        """
+        if not ids:
+            return True
+
+        try:
+            self.client.delete(
+                collection_name=self.collection,
+                points_selector=models.PointIdsList(points=list(ids)),
+            )
+            logger.debug(f"Deleted {len(ids)} points from {self.collection}")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents by id: {e}")
+            return False
+
     def delete(self) -> bool:
         try:
             if self.exists():
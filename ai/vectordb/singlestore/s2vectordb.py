@@ -1,5 +1,5 @@
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from hashlib import md5
 
 try:
@@ -144,6 +144,21 @@ class S2VectorDb(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def docs_exist(self, documents: List[Document]) -> Set[int]:
+        """
+        Positions in documents of the documents that exist, from one IN query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        if not documents:
+            return set()
+        hashes = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        with self.Session.begin() as sess:
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(set(hashes)))
+            found = set(sess.execute(stmt).scalars().all())
+        return {position for position, content_hash in enumerate(hashes) if content_hash in found}
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -179,8 +194,8 @@ class S2VectorDb(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_documents(documents, self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -218,8 +233,8 @@ class S2VectorDb(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_documents(documents, self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -23,7 +23,9 @@ from src.routes import auth_router, users_router, payments_router, uploads_route
 from src.routes.agent_runtime import router as agent_runtime_router
 from src.services.rbac_service import init_default_roles
 from src.scheduler import start_scheduler, shutdown_scheduler
+from src.services.knowledge_ingestion_service import KnowledgeIngestionService
 from src.utils.log import logger
+from src.utils.strategy_registry import warm_strategies
 
 # Load environment variables FIRST
 load_dotenv()
@@ -43,13 +45,20 @@ async def lifespan(app: FastAPI):
     await init_database()
     logger.info("Database initialized")
     
+    # Resolve configured model/tool/embedder strategy classes before the first request
+    warm_strategies()
+    
     # Start APScheduler
     start_scheduler()
     logger.info("APScheduler started")
     
+    # Start background knowledge ingestion workers
+    KnowledgeIngestionService.start()
+    
     yield
     
-    # Shutdown scheduler and database
+    # Shutdown ingestion workers, scheduler and database
+    await KnowledgeIngestionService.stop()
     shutdown_scheduler()
     await close_database()
     logger.info("Application shutdown complete")
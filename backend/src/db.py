@@ -51,11 +51,15 @@ def get_collections():
         "embedderConfig": database["embedderConfig"],
         "tenants": database["tenants"],
         "knowledgeConfig": database["knowledgeConfig"],
+        "knowledgeManifests": database["knowledgeManifests"],
+        "knowledgeJobs": database["knowledgeJobs"],
+        "knowledgeJobLocks": database["knowledgeJobLocks"],
         "agents": database["agents"],
         "conversations": database["conversations"],
         "agent_runs": database["agent_runs"],
         "workflowConfig": database["workflowConfig"],
         "workflowInstances": database["workflowInstances"],
+        "workflowSpecs": database["workflowSpecs"],
         "projects": database["projects"],
         "projectActivities": database["projectActivities"],
         "activityNotifications": database["activityNotifications"],
@@ -164,6 +168,20 @@ async def ensure_indexes():
         await collections["knowledgeConfig"].create_index("category")
         await collections["knowledgeConfig"].create_index("created_at")
 
+        # Knowledge ingestion manifests (indexed files per collection)
+        await collections["knowledgeManifests"].create_index(
+            [("tenantId", 1), ("userId", 1), ("collection", 1)], unique=True
+        )
+
+        # Knowledge ingestion jobs (claimed by workers in created_at order)
+        await collections["knowledgeJobs"].create_index("job_id", unique=True)
+        await collections["knowledgeJobs"].create_index([("status", 1), ("created_at", 1)])
+        await collections["knowledgeJobs"].create_index([("tenantId", 1), ("collection", 1), ("created_at", -1)])
+        # One ingestion lease per knowledge collection
+        await collections["knowledgeJobLocks"].create_index(
+            [("tenantId", 1), ("userId", 1), ("collection", 1)], unique=True
+        )
+
         # Agents collection indexes
         await collections["agents"].create_index([("tenantId", 1), ("name", 1)], unique=True)
         await collections["agents"].create_index("category")
@@ -197,6 +215,9 @@ async def ensure_indexes():
         await collections["workflowInstances"].create_index("tenantId")
         await collections["workflowInstances"].create_index([("tenantId", 1), ("status", 1), ("created_at", -1)])
 
+        # Workflow specs (content-addressed, shared by instances)
+        await collections["workflowSpecs"].create_index([("tenantId", 1), ("spec_hash", 1)], unique=True)
+
         # Projects collection indexes
         await collections["projects"].create_index([("tenantId", 1), ("name", 1)], unique=True)
         await collections["projects"].create_index("parent_id")
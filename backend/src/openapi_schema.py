@@ -1214,10 +1214,33 @@ def get_openapi_schema():
                 "post": {
                     "tags": ["Knowledge"],
                     "summary": "Upload to knowledge base",
-                    "description": "Upload files to knowledge base",
+                    "description": "Upload files to knowledge base and queue them for indexing",
                     "security": [{"BearerAuth": []}],
                     "requestBody": {"required": True, "content": {"multipart/form-data": {"schema": {"type": "object", "properties": {"files": {"type": "array", "items": {"type": "string", "format": "binary"}}}}}}},
-                    "responses": {"200": {"description": "Files uploaded successfully"}}
+                    "responses": {"200": {"description": "Files uploaded; returns the ingestion job id"}}
+                }
+            },
+            "/api/knowledge/jobs": {
+                "get": {
+                    "tags": ["Knowledge"],
+                    "summary": "List ingestion jobs",
+                    "description": "Get recent knowledge ingestion jobs with progress and throughput",
+                    "security": [{"BearerAuth": []}],
+                    "parameters": [
+                        {"name": "collection", "in": "query", "required": False, "schema": {"type": "string"}},
+                        {"name": "limit", "in": "query", "required": False, "schema": {"type": "integer", "default": 20}}
+                    ],
+                    "responses": {"200": {"description": "Ingestion jobs"}}
+                }
+            },
+            "/api/knowledge/jobs/{job_id}": {
+                "get": {
+                    "tags": ["Knowledge"],
+                    "summary": "Get ingestion job",
+                    "description": "Get an ingestion job's status, per-file progress, errors and throughput",
+                    "security": [{"BearerAuth": []}],
+                    "parameters": [{"name": "job_id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                    "responses": {"200": {"description": "Ingestion job"}, "404": {"description": "Job not found"}}
                 }
             },
             "/api/knowledge/diag": {
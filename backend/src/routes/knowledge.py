@@ -13,6 +13,7 @@ import json
 
 from ..utils.auth import verify_token_middleware
 from ..services.knowledge_service import KnowledgeService
+from ..services.knowledge_ingestion_service import KnowledgeIngestionService
 from ..utils.log import logger
 
 router = APIRouter(tags=["knowledge"])
@@ -160,8 +161,9 @@ async def upload_knowledge_files(
     payload: str | None = Form(default=None),
     user: dict = Depends(verify_token_middleware)
 ):
-    """Upload files to MinIO under uploads/tenantId/userId/collection/ and index them.
+    """Upload files to MinIO under uploads/userId/collection/ and queue them for indexing.
     Accepts an optional 'payload' form field containing the full collection payload as JSON.
+    Returns the ingestion job id; poll /jobs/{job_id} for progress.
     """
     payload_dict = None
     if payload:
@@ -175,6 +177,22 @@ async def upload_knowledge_files(
     return await KnowledgeService.upload_knowledge_files(files, user, payload_dict)
 
 
+@router.get("/jobs")
+async def list_ingestion_jobs(
+    collection: str | None = Query(None, description="Only jobs of this collection"),
+    limit: int = Query(20, ge=1, le=100),
+    user: dict = Depends(verify_token_middleware)
+):
+    """List recent ingestion jobs with their progress and throughput."""
+    return {"jobs": await KnowledgeIngestionService.list_jobs(user, collection, limit)}
+
+
+@router.get("/jobs/{job_id}")
+async def get_ingestion_job(job_id: str, user: dict = Depends(verify_token_middleware)):
+    """Get an ingestion job's status, per-file progress, errors and throughput."""
+    return await KnowledgeIngestionService.get_job(job_id, user)
+
+
 @router.get("/diag")
 async def diag():
     """Knowledge service diagnostics."""
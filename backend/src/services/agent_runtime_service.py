@@ -1,46 +1,53 @@
 import asyncio
-import ast
-import importlib
+import concurrent.futures
+import copy
 import json
 import os
+import threading
+import time
 import uuid
+import weakref
 import base64
-from typing import Dict, Any, Optional, AsyncGenerator, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, AsyncGenerator, List, Tuple
 from datetime import datetime
 from fastapi import HTTPException, status
 from ..utils.log import logger
+from ..utils.strategy_registry import resolve_strategy
+from ..utils.embedding_cache import cached_embedder
 from ..utils.mongo_storage import MongoStorageService
+from ..utils.sync_bridge import iterate_sync_generator, run_sync
 from .agent_service import AgentService
 from .file_service import FileService
 
-def module_loader(module_path: str):
-    if not module_path:
-        return None
-    try:
-        module = importlib.import_module(module_path)
-        module_file = getattr(module, "__file__", None)
-        class_name = None
-        if module_file and module_file.endswith(".py"):
-            with open(module_file, 'r', encoding='utf-8') as file:
-                tree = ast.parse(file.read())
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    class_name = node.name
-                    break
-        if class_name:
-            logger.info(f"module_loader found class {class_name} in {module_path}")
-            return getattr(module, class_name)
-        else:
-            logger.error(f"module_loader could not find any class in {module_path}")
-    except Exception as e:
-        logger.error(f"module_loader failed for {module_path}: {e}")
-    return None
+# Searches for one retrieval fan out over this pool; kept apart from the agent
+# worker pool so a retriever running on an agent worker can't starve itself
+_retrieval_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("RETRIEVER_POOL_SIZE", 16)),
+    thread_name_prefix="retriever",
+)
+
+_qdrant_clients: Dict[Tuple[Optional[str], int], Any] = {}
+_qdrant_clients_lock = threading.Lock()
+
+
+def _get_qdrant_client():
+    """Process-wide QdrantClient for the configured server, shared by every collection"""
+    key = (os.getenv('QDRANT_HOST'), int(os.getenv('QDRANT_PORT')))
+    with _qdrant_clients_lock:
+        client = _qdrant_clients.get(key)
+        if client is None:
+            from qdrant_client import QdrantClient
+            client = QdrantClient(host=key[0], port=key[1])
+            _qdrant_clients[key] = client
+        return client
+
 
 def _create_multi_collection_retriever(collection_names: list = None, conv_id: str = None, embedder = None):
     """Create a custom retriever that searches across multiple collections"""
     def multi_collection_retriever(agent, query: str, num_documents: int = None, **kwargs):
-        """Custom retriever that searches across multiple existing collections"""
-        from typing import List, Dict, Any
+        """Custom retriever that searches all collections concurrently and merges the top results by score"""
+        from ai.vectordb.qdrant import Qdrant
         
         # List of collections to search
         collections_to_search = []
@@ -56,52 +63,275 @@ def _create_multi_collection_retriever(collection_names: list = None, conv_id: s
         if not collections_to_search:
             return None
         
-        all_results = []
+        limit = num_documents or 5
+        client = _get_qdrant_client()
+        first = Qdrant(collection=collections_to_search[0], embedder=embedder, client=client)
+        # Qdrant falls back to a default embedder when none is configured; share that one too
+        vector_dbs = [first] + [
+            Qdrant(collection=collection, embedder=first.embedder, client=client)
+            for collection in collections_to_search[1:]
+        ]
+        
+        # Embed the query once and reuse it for every collection
+        query_embedding = first.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f'retriever.embedding_failed: query={query[:100]}')
+            return None
         
-        for collection in collections_to_search:
+        def _search(vector_db):
+            return vector_db.search_with_scores(query_embedding, limit=limit)
+        
+        futures = {_retrieval_executor.submit(_search, vector_db): vector_db.collection for vector_db in vector_dbs}
+        scored_results = []
+        for future in concurrent.futures.as_completed(futures):
+            collection = futures[future]
             try:
-                # Create vector DB connection for this collection
-                from ai.vectordb.qdrant import Qdrant
-                
-                # Get Qdrant configuration from environment variables
-                qdrant_host = os.getenv('QDRANT_HOST')
-                qdrant_port = int(os.getenv('QDRANT_PORT'))
-                
-                vector_db = Qdrant(
-                    collection=collection,
-                    host=qdrant_host,
-                    port=qdrant_port,
-                    embedder=embedder
-                )
-                
-                # Check if collection exists
-                if vector_db.exists():
-                    # Search this collection
-                    results = vector_db.search(query=query, limit=num_documents or 5)
-                    # Convert to dict format and add collection info
-                    for doc in results:
-                        doc_dict = doc.to_dict()
-                        doc_dict['source_collection'] = collection  # Track which collection
-                        all_results.append(doc_dict)
-                else:
-                    logger.warning(f'retriever.collection_not_found: collection={collection} does not exist, skipping')
-                        
+                for doc, score in future.result():
+                    doc_dict = doc.to_dict()
+                    doc_dict['source_collection'] = collection  # Track which collection
+                    scored_results.append((score, doc_dict))
             except Exception as e:
-                if "404" in str(e) or "not found" in str(e).lower():
-                    logger.warning(f'retriever.collection_not_found: collection={collection}, error={str(e)}')
-                else:
-                    logger.error(f'retriever.collection_search_error: collection={collection}, error={str(e)}')
-                continue
+                logger.error(f'retriever.collection_search_error: collection={collection}, error={str(e)}')
         
-        # Sort by relevance score and limit results
-        if num_documents:
-            all_results = all_results[:num_documents]
+        # Global top-k across collections by similarity score
+        scored_results.sort(key=lambda item: item[0], reverse=True)
+        all_results = [doc_dict for _, doc_dict in scored_results[:limit]]
         
         return all_results if all_results else None
     
     return multi_collection_retriever
 
+# ----------------------------------------------------------------------
+# Compiled agent templates
+# ----------------------------------------------------------------------
+class _AgentTemplate:
+    """Resolved, request-independent pieces of an agent built from its config documents.
+
+    The template's own model/tool/embedder instances are never handed to an
+    agent; ``instantiate`` returns per-request clones that share the expensive
+    parts (resolved classes, validated params, HTTP clients) but not run state.
+    """
+
+    def __init__(self):
+        self.model = None
+        self.tools: List[Any] = []
+        self.embedder = None
+        self.collection_names: List[str] = []
+        # Config ids this template was built from -> their updated_at at build time
+        self.versions: Dict[str, Any] = {}
+        # False when any config lookup failed; such templates are not cached
+        self.complete = True
+        # Async client created once for the model and shared by every clone (see share_async_client)
+        self._async_client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._clones = 0
+        self._retired = False
+        self._lock = threading.Lock()
+
+    def share_async_client(self) -> None:
+        """Create the model's async client on the template, so every clone reuses one connection pool.
+
+        Call from the event loop the agents run on; the client is closed on that loop once the
+        template is retired and no clone is left.
+        """
+        if self.model is None or "async_client" not in type(self.model).model_fields:
+            return
+        if self.model.async_client is None and hasattr(self.model, "get_async_client"):
+            self.model.async_client = self.model.get_async_client()
+        if self.model.async_client is None:
+            return
+        self._async_client = self.model.async_client
+        self._loop = asyncio.get_running_loop()
+
+    def retire(self) -> None:
+        """Mark the template as no longer handed out (evicted, invalidated or never cached)"""
+        with self._lock:
+            self._retired = True
+        self._close_if_unused()
+
+    def _release_clone(self) -> None:
+        with self._lock:
+            self._clones -= 1
+        self._close_if_unused()
+
+    def _close_if_unused(self) -> None:
+        with self._lock:
+            if not self._retired or self._clones or self._async_client is None:
+                return
+            client, self._async_client = self._async_client, None
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(lambda: _close_async_client(client))
+        except RuntimeError:
+            # The loop closed in the meantime; its connections went with it
+            pass
+
+    @staticmethod
+    def _clone_model(model):
+        if model is None:
+            return None
+        # Shallow copy keeps the validated params and any cached client; run state is reset
+        return model.model_copy(update={
+            "metrics": {},
+            "tools": None,
+            "functions": None,
+            "function_call_stack": None,
+            "session_id": None,
+        })
+
+    @staticmethod
+    def _clone_tool(tool):
+        from ai.tools.function import Function
+        from ai.tools.toolkit import Toolkit
+        # Agents bind themselves onto Function objects, so each agent needs its own
+        if isinstance(tool, Function):
+            return tool.model_copy()
+        if not isinstance(tool, Toolkit):
+            return tool
+        clone = copy.copy(tool)
+        clone.functions = OrderedDict((name, func.model_copy()) for name, func in tool.functions.items())
+        return clone
+
+    def instantiate(self) -> Tuple[Any, List[Any], Any]:
+        """Return (model, tools, embedder) for a single agent run"""
+        model = self._clone_model(self.model)
+        if model is not None and self._loop is not None:
+            # The shared async client stays open while any clone can still use it
+            with self._lock:
+                leased = self._async_client is not None
+                if leased:
+                    self._clones += 1
+            if leased:
+                weakref.finalize(model, self._release_clone)
+            else:
+                # Retired and closed between lookup and here; the clone opens its own client
+                model.async_client = None
+        return (
+            model,
+            [self._clone_tool(tool) for tool in self.tools],
+            self.embedder,
+        )
+
+
+# Close tasks still running, referenced so they aren't garbage collected mid-close
+_closing_clients: set = set()
+
+
+def _close_async_client(client: Any) -> None:
+    """Close a shared async model client; runs on the loop the client was used on"""
+    task = asyncio.ensure_future(client.close())
+    _closing_clients.add(task)
+    task.add_done_callback(_closing_clients.discard)
+
+
+class _AgentTemplateCache:
+    """Thread-safe LRU of compiled agent templates keyed by (tenant, agent id, agent updated_at).
+
+    Entries are dropped when a config they depend on is written (see
+    ``AgentRuntimeService.invalidate_agent_templates``) and after ``ttl`` seconds,
+    which bounds staleness when configs are edited through another worker process.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._templates: "OrderedDict[Tuple[str, str, str], Tuple[_AgentTemplate, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[_AgentTemplate]:
+        with self._lock:
+            entry = self._templates.get(key)
+            if entry is not None and self.ttl > 0 and time.monotonic() - entry[1] > self.ttl:
+                del self._templates[key]
+                entry[0].retire()
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Tuple[str, str, str], template: _AgentTemplate) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            replaced = self._templates.get(key)
+            if replaced is not None and replaced[0] is not template:
+                replaced[0].retire()
+            self._templates[key] = (template, time.monotonic())
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size:
+                _, (evicted, _) = self._templates.popitem(last=False)
+                evicted.retire()
+                self.evictions += 1
+
+    def invalidate(self, config_id: Optional[str] = None, tenant_id: Optional[str] = None) -> int:
+        """Drop templates depending on ``config_id`` (all templates when None), optionally within one tenant"""
+        with self._lock:
+            stale = [
+                key for key, (template, _) in self._templates.items()
+                if (tenant_id is None or key[0] == tenant_id)
+                and (config_id is None or config_id in template.versions)
+            ]
+            for key in stale:
+                self._templates.pop(key)[0].retire()
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._templates),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
 class AgentRuntimeService:
+
+    # Use the agent's native async path (agent.arun) when its model implements one;
+    # otherwise the sync agent.run is driven on the worker pool.
+    ASYNC_EXECUTION = os.getenv("AGENT_ASYNC_EXECUTION", "true").lower() == "true"
+
+    @classmethod
+    def _use_async_execution(cls, agent: Any) -> bool:
+        """True when the agent's model natively implements aresponse/aresponse_stream"""
+        model = getattr(agent, "model", None)
+        if not cls.ASYNC_EXECUTION or model is None:
+            return False
+        from ai.model.base import Model
+        return type(model).aresponse is not Model.aresponse and hasattr(model, "aresponse_stream")
+
+    # Compiled agent templates, reused across requests until a config they depend on changes
+    _agent_templates = _AgentTemplateCache(
+        int(os.getenv("AGENT_TEMPLATE_CACHE_SIZE", 128)),
+        float(os.getenv("AGENT_TEMPLATE_TTL", 300)),
+    )
+
+    @classmethod
+    def invalidate_agent_templates(cls, config_id: Optional[Any] = None, tenant_id: Optional[str] = None) -> int:
+        """Drop cached agent templates built from ``config_id`` (every template when None)"""
+        dropped = cls._agent_templates.invalidate(str(config_id) if config_id is not None else None, tenant_id)
+        if dropped:
+            logger.debug(f"[AGENT] Invalidated {dropped} cached agent template(s) for config {config_id or '*'}")
+        return dropped
+
+    @classmethod
+    def get_agent_template_stats(cls) -> Dict[str, Any]:
+        return cls._agent_templates.stats()
     
     @classmethod
     async def _search_images_for_agent(cls, user: Dict[str, Any], conv_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -187,6 +417,103 @@ class AgentRuntimeService:
         logger.info(f"[AGENT] Image search complete. Found {len(images)} images")
         return images
     
+    @classmethod
+    def _agent_template_key(cls, agent_config: Dict[str, Any], user: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+        """Cache key for an agent document; None when it can't be versioned (e.g. unsaved configs)"""
+        agent_id = agent_config.get("id") or agent_config.get("_id")
+        updated_at = agent_config.get("updated_at")
+        if agent_id is None or updated_at is None:
+            return None
+        return (str(user.get("tenantId")), str(agent_id), str(updated_at))
+
+    @classmethod
+    async def _compile_agent_template(cls, agent_config: Dict[str, Any], user: Dict[str, Any]) -> _AgentTemplate:
+        """Fetch the agent's model/tool/knowledge configs and construct their components"""
+        from .model_config_service import ModelConfigService
+        from .tool_config_service import ToolConfigService
+        from .knowledge_service import KnowledgeService
+
+        template = _AgentTemplate()
+        agent_id = agent_config.get("id") or agent_config.get("_id")
+        if agent_id is not None:
+            template.versions[str(agent_id)] = agent_config.get("updated_at")
+
+        # Load model configuration
+        model_config = None
+        model_ref = agent_config.get("model")
+        
+        if model_ref:
+            try:
+                model_id = model_ref if isinstance(model_ref, str) else model_ref.get("id")
+                if model_id:
+                    model_config = await ModelConfigService.get_model_config_by_id(model_id, user)
+                    if model_config:
+                        template.versions[str(model_id)] = model_config.get("updated_at")
+                        model_strategy = model_config.get("model", {}).get("strategy")
+                        model_params = model_config.get("model", {}).get("params", {})
+                        
+                        if model_strategy:
+                            model_class = resolve_strategy(model_strategy)
+                            if model_class:
+                                template.model = model_class(**model_params)
+            except Exception as e:
+                template.complete = False
+                logger.warning(f"Failed to load model {model_ref}: {e}")
+        
+        # Load tools configurations
+        tools_config = agent_config.get("tools", {})
+        
+        if tools_config:
+            for tool_id in tools_config.keys():
+                try:
+                    if tool_id:
+                        tool_config = await ToolConfigService.get_tool_config_by_id(tool_id, user)
+                        if tool_config:
+                            template.versions[str(tool_id)] = tool_config.get("updated_at")
+                            tool_strategy = tool_config.get("tool", {}).get("strategy")
+                            tool_params = tool_config.get("tool", {}).get("params", {})
+                            if tool_strategy:
+                                tool_class = resolve_strategy(tool_strategy)
+                                if tool_class:
+                                    tool_instance = tool_class(**tool_params)
+                                    template.tools.append(tool_instance)
+                except Exception as e:
+                    template.complete = False
+                    logger.warning(f"Failed to load tool {tool_id}: {e}")
+        
+        # Load knowledge collection names
+        collections_config = agent_config.get("collections", {})
+        if collections_config:
+            for collection_id in collections_config.keys():
+                try:
+                    if collection_id:
+                        knowledge_config = await KnowledgeService.get_collection_by_id(collection_id, user)
+                        if knowledge_config:
+                            template.versions[str(collection_id)] = knowledge_config.get("updated_at")
+                            vector_collection_name = knowledge_config.get("vector_collection")
+                            template.collection_names.append(vector_collection_name)
+                            
+                except Exception as e:
+                    template.complete = False
+                    logger.warning(f"Failed to load knowledge collection {collection_id}: {e}")
+        
+        # Build embedder if config exists
+        embedder_config = model_config.get("embedding") if model_config else None
+        if embedder_config:
+            try:
+                embedder_strategy = embedder_config.get("strategy")
+                embedder_params = embedder_config.get("params", {})
+                if embedder_strategy:
+                    embedder_class = resolve_strategy(embedder_strategy)
+                    if embedder_class:
+                        # Repeated queries are embedded once
+                        template.embedder = cached_embedder(embedder_class(**embedder_params))
+            except Exception as e:
+                template.complete = False
+                logger.warning(f"Failed to load embedder: {e}")
+
+        return template
+
     @classmethod
     async def build_agent_from_config(cls, agent_config: Dict[str, Any], user: Dict[str, Any]) -> Any:
         conv_id = agent_config.get("conv_id")
@@ -194,84 +521,25 @@ class AgentRuntimeService:
             logger.debug(f"Building new agent from config for conv_id: {conv_id}")
             
             from ai.agent.agent import Agent
-            from .model_config_service import ModelConfigService
-            from .tool_config_service import ToolConfigService
-            from .knowledge_service import KnowledgeService
             
-            # Load model configuration
-            model = None
-            model_ref = agent_config.get("model")
-            
-            if model_ref:
-                try:
-                    model_id = model_ref if isinstance(model_ref, str) else model_ref.get("id")
-                    if model_id:
-                        model_config = await ModelConfigService.get_model_config_by_id(model_id, user)
-                        if model_config:
-                            model_strategy = model_config.get("model", {}).get("strategy")
-                            model_params = model_config.get("model", {}).get("params", {})
-                            
-                            if model_strategy:
-                                model_class = module_loader(model_strategy)
-                                if model_class:
-                                    model = model_class(**model_params)
-                except Exception as e:
-                    logger.warning(f"Failed to load model {model_ref}: {e}")
-            
-            # Load tools configurations
-            tools = []
-            tools_config = agent_config.get("tools", {})
-            
-            if tools_config:
-                for tool_id in tools_config.keys():
-                    try:
-                        if tool_id:
-                            tool_config = await ToolConfigService.get_tool_config_by_id(tool_id, user)
-                            if tool_config:
-                                tool_strategy = tool_config.get("tool", {}).get("strategy")
-                                tool_params = tool_config.get("tool", {}).get("params", {})
-                                if tool_strategy:
-                                    tool_class = module_loader(tool_strategy)
-                                    if tool_class:
-                                        tool_instance = tool_class(**tool_params)
-                                        tools.append(tool_instance)
-                    except Exception as e:
-                        logger.warning(f"Failed to load tool {tool_id}: {e}")
-            
-            # Load knowledge collection names and create custom retriever
-            collection_names = []
-            embedder_config = None
-            conv_id = agent_config.get("conv_id")
-            
-            # Handle collections object with multiple collection IDs
-            collections_config = agent_config.get("collections", {})
-            if collections_config:
-                for collection_id in collections_config.keys():
-                    try:
-                        if collection_id:
-                            knowledge_config = await KnowledgeService.get_collection_by_id(collection_id, user)
-                            if knowledge_config:
-                                vector_collection_name = knowledge_config.get("vector_collection")
-                                collection_names.append(vector_collection_name)
-                                
-                    except Exception as e:
-                        logger.warning(f"Failed to load knowledge collection {collection_id}: {e}")
+            # Reuse the compiled template for this agent version when one is cached
+            template_key = cls._agent_template_key(agent_config, user)
+            template = cls._agent_templates.get(template_key) if template_key else None
+            cached = template is not None
+            if template is None:
+                template = await cls._compile_agent_template(agent_config, user)
+                template.share_async_client()
+                if template_key and template.complete and cls._agent_templates.max_size > 0:
+                    cls._agent_templates.put(template_key, template)
+                    cached = True
+            else:
+                logger.debug(f"[AGENT] Using cached agent template for {agent_config.get('name')}")
             
-            # Build embedder if config exists
-            if not embedder_config and model_config.get("embedding"):
-                embedder_config = model_config.get("embedding")
-
-            embedder = None
-            if embedder_config:
-                try:
-                    embedder_strategy = embedder_config.get("strategy")
-                    embedder_params = embedder_config.get("params", {})
-                    if embedder_strategy:
-                        embedder_class = module_loader(embedder_strategy)
-                        if embedder_class:
-                            embedder = embedder_class(**embedder_params)
-                except Exception as e:
-                    logger.warning(f"Failed to load embedder: {e}")
+            model, tools, embedder = template.instantiate()
+            if not cached:
+                # Nothing else will instantiate it; its client closes with this run's model
+                template.retire()
+            collection_names = list(template.collection_names)
             
             # Create custom retriever
             custom_retriever = None
@@ -348,12 +616,19 @@ class AgentRuntimeService:
             if images_for_run:
                 run_kwargs["images"] = images_for_run
             
-            # Get the streaming generator or direct response based on stream parameter
+            # Get the streaming generator or direct response based on stream parameter.
+            # The sync agent.run blocks on model/tool I/O, so it runs on the agent worker pool.
+            use_async = cls._use_async_execution(agent)
+            logger.info(f"[AGENT] Execution path: {'async' if use_async else 'worker pool'}")
             try:
-                if stream:
-                    agent_generator = agent.run(prompt, **run_kwargs)
+                if stream and use_async:
+                    agent_generator = await agent.arun(prompt, **run_kwargs)
+                elif stream:
+                    agent_generator = iterate_sync_generator(lambda: agent.run(prompt, **run_kwargs))
+                elif use_async:
+                    agent_response = await agent.arun(prompt, **run_kwargs)
                 else:
-                    agent_response = agent.run(prompt, **run_kwargs)
+                    agent_response = await run_sync(agent.run, prompt, **run_kwargs)
             except Exception as e:
                 logger.error(f"Error calling agent.run(): {e}")
                 import traceback
@@ -366,15 +641,12 @@ class AgentRuntimeService:
                 iteration_started = False
                 sent_audio_count = 0  # Track how many audio chunks have been sent
                 try:
-                    for response in agent_generator:
+                    async for response in agent_generator:
                         if not iteration_started:
                             iteration_started = True
                             
                         response_count += 1
                         
-                        # Yield control to event loop every chunk for multi-user support
-                        await asyncio.sleep(0)
-                        
                         if cancel_event and cancel_event.is_set():
                             logger.info("Streaming cancelled by user.")
                             yield {"type": "cancelled", "timestamp": asyncio.get_event_loop().time()}
@@ -439,7 +711,6 @@ class AgentRuntimeService:
                                 chunk_payload["response_audio"] = str(response_audio)
                         
                         yield {"type": "agent_chunk", "payload": chunk_payload, "timestamp": asyncio.get_event_loop().time()}
-                        await asyncio.sleep(0)
                         
                     # Send completion event after all chunks have been sent
                     logger.info(f"Streaming complete. Sent {response_count} chunks")
@@ -450,6 +721,9 @@ class AgentRuntimeService:
                     import traceback
                     logger.error(f"Traceback: {traceback.format_exc()}")
                     raise
+                finally:
+                    # Stops the worker thread on cancellation or client disconnect
+                    await agent_generator.aclose()
                 
                 # Check if agent has stored the response even though it didn't stream
                         
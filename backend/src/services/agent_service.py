@@ -436,6 +436,8 @@ class AgentService:
                 # Remove the 'id' field from record as it should not be stored (we use _id)
                 record.pop("id", None)
                 await MongoStorageService.update_one("agents", {"_id": existing["_id"]}, {"$set": record}, tenant_id=tenant_id)
+                from .agent_runtime_service import AgentRuntimeService
+                AgentRuntimeService.invalidate_agent_templates(existing["_id"])
                 action = "updated"
             else:
                 # Create new agent
@@ -492,6 +494,9 @@ class AgentService:
                 logger.warning(f"[AGENTS] Agent with ID '{agent_id}' not found for deletion in tenant: {tenant_id}")
                 raise HTTPException(status_code=404, detail="Agent not found")
             
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(agent_id)
+            
             logger.info(f"[AGENTS] Successfully deleted agent by ID '{agent_id}' for tenant: {tenant_id}")
             return {"message": f"Agent deleted"}
         except HTTPException:
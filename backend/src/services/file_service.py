@@ -38,6 +38,9 @@ class FileService:
     }
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 
+    # Part size for streamed uploads (MinIO's minimum is 5MB)
+    STREAM_PART_SIZE = int(os.getenv("FILE_STREAM_PART_SIZE", 8 * 1024 * 1024))
+
     # Storage configuration
     STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "minio").lower()  # "minio" or "disk"
     DISK_STORAGE_PATH = os.getenv("DISK_STORAGE_PATH", "/tmp/file_storage")
@@ -359,6 +362,29 @@ class FileService:
             logger.error(f"[FILE] Error uploading content to {object_name}: {e}")
             return False
 
+    @staticmethod
+    async def upload_file_stream(
+        object_name: str, stream: BinaryIO, length: int, content_type: str = None
+    ) -> bool:
+        """Upload a file object to configured storage without reading it into memory"""
+        try:
+            logger.info(f"[FILE] Streaming {length} bytes to object: {object_name}")
+
+            if FileService.STORAGE_BACKEND == "disk":
+                success = await FileService._upload_stream_to_disk(object_name, stream)
+            else:
+                success = await FileService._upload_stream_to_minio(object_name, stream, length, content_type)
+
+            if success:
+                logger.info(f"[FILE] Successfully uploaded content to {object_name}")
+            else:
+                logger.error(f"[FILE] Failed to upload content to {object_name}")
+            return success
+
+        except Exception as e:
+            logger.error(f"[FILE] Error uploading content to {object_name}: {e}")
+            return False
+
     # Public storage operations for other services
     @staticmethod
     async def upload_file_content_to_path(file_path: str, content: bytes) -> bool:
@@ -492,6 +518,34 @@ class FileService:
             logger.error(f"[FILE] MinIO upload failed for {file_path}: {e}")
             return False
 
+    @staticmethod
+    async def _upload_stream_to_minio(file_path: str, stream: BinaryIO, length: int, content_type: str = None) -> bool:
+        """Stream a file object to MinIO in parts"""
+        import asyncio
+
+        def _put():
+            minio_client = FileService._get_minio_client()
+            bucket_name = "uploads"
+            if not minio_client.bucket_exists(bucket_name):
+                minio_client.make_bucket(bucket_name)
+            minio_client.put_object(
+                bucket_name,
+                file_path,
+                stream,
+                length=length,
+                content_type=content_type or "application/octet-stream",
+                part_size=FileService.STREAM_PART_SIZE,
+            )
+
+        try:
+            await asyncio.to_thread(_put)
+            logger.info(f"[FILE] Successfully uploaded to MinIO: {file_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"[FILE] MinIO upload failed for {file_path}: {e}")
+            return False
+
     @staticmethod
     async def _delete_from_minio(file_path: str) -> bool:
         """Delete file from MinIO"""
@@ -566,6 +620,27 @@ class FileService:
             logger.error(f"[FILE] Disk upload failed for {file_path}: {e}")
             return False
 
+    @staticmethod
+    async def _upload_stream_to_disk(file_path: str, stream: BinaryIO) -> bool:
+        """Copy a file object to disk storage in chunks"""
+        try:
+            full_path = FileService._get_disk_storage_path(file_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+            async with aiofiles.open(full_path, "wb") as f:
+                while True:
+                    chunk = stream.read(FileService.STREAM_PART_SIZE)
+                    if not chunk:
+                        break
+                    await f.write(chunk)
+
+            logger.info(f"[FILE] Successfully uploaded to disk: {full_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"[FILE] Disk upload failed for {file_path}: {e}")
+            return False
+
     @staticmethod
     async def _delete_from_disk(file_path: str) -> bool:
         """Delete file from disk storage"""
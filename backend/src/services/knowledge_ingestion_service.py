@@ -0,0 +1,457 @@
+"""
+Knowledge Ingestion Service
+
+Durable queue of knowledge ingestion jobs. An upload stores its files, records
+a job in the ``knowledgeJobs`` collection and returns the job id right away.
+Each process runs a dispatcher that claims queued jobs from MongoDB and indexes
+their files on a bounded thread pool, with a cap on the files of one tenant in
+flight. Jobs record per-file status, chunk counts and errors as they go, and a
+job whose worker stopped renewing its lease is picked up again by any process.
+A job also holds a lease on its knowledge collection (``knowledgeJobLocks``),
+so only one job at a time writes a collection's index and manifest; deleting
+files from a collection is queued as a job too for that reason.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from ..utils.log import logger
+from ..utils.mongo_storage import MongoStorageService
+
+
+def _now_ms() -> int:
+    return int(datetime.utcnow().timestamp() * 1000)
+
+
+class KnowledgeIngestionService:
+    """Service for queueing knowledge ingestion jobs and running them in the background"""
+
+    COLLECTION = "knowledgeJobs"
+    # One lease document per knowledge collection, held by the job indexing it
+    LOCKS = "knowledgeJobLocks"
+
+    # Files indexed at once by this process, across all tenants
+    WORKERS = int(os.getenv("KNOWLEDGE_INGEST_WORKERS", 4))
+    # Files of one tenant indexed at once by this process
+    TENANT_CONCURRENCY = int(os.getenv("KNOWLEDGE_INGEST_TENANT_CONCURRENCY", 2))
+    # How often the dispatcher looks for jobs queued by other processes
+    POLL_SECONDS = float(os.getenv("KNOWLEDGE_INGEST_POLL_SECONDS", 5))
+    # A running job whose lease isn't renewed for this long is claimed again
+    LEASE_SECONDS = int(os.getenv("KNOWLEDGE_INGEST_LEASE_SECONDS", 120))
+    MAX_ATTEMPTS = int(os.getenv("KNOWLEDGE_INGEST_MAX_ATTEMPTS", 3))
+
+    # File states after which a file isn't processed again
+    FINISHED_FILE_STATES = {"indexed", "skipped", "deleted", "failed"}
+
+    _worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _dispatcher: Optional[asyncio.Task] = None
+    _wakeup: Optional[asyncio.Event] = None
+    # job_id -> (tenant_id, task) of the jobs this process is running
+    _jobs: Dict[str, Any] = {}
+    _tenant_slots: Dict[str, asyncio.Semaphore] = {}
+
+    # ------------------------------------------------------------------
+    # Queue API
+    # ------------------------------------------------------------------
+    @classmethod
+    async def enqueue(cls, user: dict, collection: str, payload: dict, files: List[Dict[str, Any]],
+                      op: str = "ingest") -> Dict[str, Any]:
+        """Queue stored files ({"filename", "key", "size"}) for indexing, or with op="delete" for
+        removal from the collection's index and manifest; returns the job"""
+        tenant_id = user.get("tenantId")
+        user_id = user.get("id") or user.get("userId")
+        now = _now_ms()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "tenantId": tenant_id,
+            "userId": user_id,
+            "collection": collection,
+            "op": op,
+            "payload": payload,
+            "status": "queued",
+            "attempts": 0,
+            "worker": None,
+            "lease_until": 0,
+            "error": None,
+            "created_at": now,
+            "started_at": None,
+            "finished_at": None,
+            "total_files": len(files),
+            "total_bytes": sum(f.get("size", 0) for f in files),
+            "files_done": 0,
+            "files_failed": 0,
+            "bytes_done": 0,
+            "chunks": 0,
+            "embedded": 0,
+            "files": [
+                {
+                    "name": f["filename"],
+                    "key": f["key"],
+                    "size": f.get("size", 0),
+                    "status": "queued",
+                    "chunks": 0,
+                    "embedded": 0,
+                    "error": None,
+                    "duration_ms": None,
+                }
+                for f in files
+            ],
+        }
+        await MongoStorageService.insert_one(cls.COLLECTION, dict(job), tenant_id=tenant_id)
+        logger.info(f"[KNOWLEDGE] Queued {op} job {job['job_id']} ({len(files)} files) for collection {collection}")
+
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+        return cls._view(job)
+
+    @classmethod
+    async def get_job(cls, job_id: str, user: dict) -> Dict[str, Any]:
+        """Status, per-file progress and throughput of one of the tenant's jobs"""
+        job = await MongoStorageService.find_one(
+            cls.COLLECTION, {"job_id": job_id, "tenantId": user.get("tenantId")}
+        )
+        if not job:
+            raise HTTPException(status_code=404, detail="Ingestion job not found")
+        return cls._view(job)
+
+    @classmethod
+    async def list_jobs(cls, user: dict, collection: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """The tenant's most recent jobs, newest first, without their file lists"""
+        query = {"tenantId": user.get("tenantId")}
+        if collection:
+            query["collection"] = collection
+        jobs = await MongoStorageService.find_many(
+            cls.COLLECTION, query, projection={"files": 0, "payload": 0},
+            sort_field="created_at", sort_order=-1, limit=limit,
+        )
+        return [cls._view(job) for job in jobs]
+
+    @staticmethod
+    def _view(job: Dict[str, Any]) -> Dict[str, Any]:
+        started = job.get("started_at")
+        elapsed = ((job.get("finished_at") or _now_ms()) - started) / 1000 if started else 0
+        total_files = job.get("total_files", 0)
+        view = {
+            "job_id": job["job_id"],
+            "collection": job.get("collection"),
+            "op": job.get("op", "ingest"),
+            "status": job.get("status"),
+            "error": job.get("error"),
+            "attempts": job.get("attempts", 0),
+            "created_at": job.get("created_at"),
+            "started_at": started,
+            "finished_at": job.get("finished_at"),
+            "progress": {
+                "files_total": total_files,
+                "files_done": job.get("files_done", 0),
+                "files_failed": job.get("files_failed", 0),
+                "bytes_total": job.get("total_bytes", 0),
+                "bytes_done": job.get("bytes_done", 0),
+                "chunks": job.get("chunks", 0),
+                "embedded": job.get("embedded", 0),
+                "percent": round(100 * job.get("files_done", 0) / total_files, 1) if total_files else 100.0,
+            },
+            "throughput": {
+                "elapsed_seconds": round(elapsed, 3),
+                "files_per_second": round(job.get("files_done", 0) / elapsed, 3) if elapsed else None,
+                "bytes_per_second": round(job.get("bytes_done", 0) / elapsed, 1) if elapsed else None,
+                "chunks_per_second": round(job.get("chunks", 0) / elapsed, 2) if elapsed else None,
+            },
+        }
+        if "files" in job:
+            view["files"] = [
+                {key: entry.get(key) for key in ("name", "size", "status", "chunks", "embedded", "error", "duration_ms")}
+                for entry in job["files"]
+            ]
+        return view
+
+    # ------------------------------------------------------------------
+    # Worker lifecycle
+    # ------------------------------------------------------------------
+    @classmethod
+    def start(cls) -> None:
+        """Start this process's dispatcher; call from the running event loop"""
+        if cls._dispatcher is not None:
+            return
+        cls._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=cls.WORKERS,
+            thread_name_prefix="knowledge-ingest",
+        )
+        cls._wakeup = asyncio.Event()
+        cls._dispatcher = asyncio.create_task(cls._dispatch())
+        logger.info(
+            f"[KNOWLEDGE] Ingestion workers started ({cls.WORKERS} workers, "
+            f"{cls.TENANT_CONCURRENCY} per tenant, worker id {cls._worker_id})"
+        )
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Stop claiming jobs and hand this process's running jobs back to the queue"""
+        if cls._dispatcher is None:
+            return
+        cls._dispatcher.cancel()
+        for _, task in list(cls._jobs.values()):
+            task.cancel()
+        await asyncio.gather(cls._dispatcher, *(task for _, task in cls._jobs.values()), return_exceptions=True)
+        cls._dispatcher = None
+        cls._jobs.clear()
+
+        try:
+            # Interrupted attempts don't count against the job
+            await MongoStorageService.update_many(
+                cls.COLLECTION,
+                {"status": "running", "worker": cls._worker_id},
+                {"$set": {"status": "queued", "worker": None, "lease_until": 0}, "$inc": {"attempts": -1}},
+            )
+            await MongoStorageService.update_many(
+                cls.LOCKS, {"worker": cls._worker_id}, {"$set": {"job_id": None, "worker": None, "lease_until": 0}}
+            )
+        except Exception as e:
+            logger.error(f"[KNOWLEDGE] Failed to requeue running ingestion jobs: {e}")
+
+        cls._executor.shutdown(wait=False, cancel_futures=True)
+        cls._executor = None
+        logger.info("[KNOWLEDGE] Ingestion workers stopped")
+
+    @classmethod
+    async def _dispatch(cls) -> None:
+        while True:
+            try:
+                await cls._fail_abandoned()
+                while len(cls._jobs) < cls.WORKERS:
+                    job = await cls._claim()
+                    if job is None:
+                        break
+                    task = asyncio.create_task(cls._run(job))
+                    cls._jobs[job["job_id"]] = (job["tenantId"], task)
+                    task.add_done_callback(lambda _, job_id=job["job_id"]: cls._finished(job_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[KNOWLEDGE] Ingestion dispatcher error: {e}")
+
+            try:
+                await asyncio.wait_for(cls._wakeup.wait(), timeout=cls.POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            cls._wakeup.clear()
+
+    @classmethod
+    def _finished(cls, job_id: str) -> None:
+        cls._jobs.pop(job_id, None)
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    @classmethod
+    async def _fail_abandoned(cls) -> None:
+        """Fail jobs whose workers kept dying on them instead of claiming them forever"""
+        await MongoStorageService.update_many(
+            cls.COLLECTION,
+            {"status": "running", "lease_until": {"$lt": _now_ms()}, "attempts": {"$gte": cls.MAX_ATTEMPTS}},
+            {"$set": {"status": "failed", "error": "Ingestion worker stopped responding", "finished_at": _now_ms()}},
+        )
+
+    @classmethod
+    async def _claim(cls) -> Optional[Dict[str, Any]]:
+        """Atomically take the oldest runnable job, if any"""
+        now = _now_ms()
+        running = {}
+        for tenant_id, _ in cls._jobs.values():
+            running[tenant_id] = running.get(tenant_id, 0) + 1
+
+        query: Dict[str, Any] = {
+            "$or": [{"status": "queued"}, {"status": "running", "lease_until": {"$lt": now}}],
+            "attempts": {"$lt": cls.MAX_ATTEMPTS},
+        }
+        busy = [tenant_id for tenant_id, count in running.items() if count >= cls.TENANT_CONCURRENCY]
+        if busy:
+            query["tenantId"] = {"$nin": busy}
+
+        candidates = await MongoStorageService.find_many(
+            cls.COLLECTION, query,
+            projection={"job_id": 1, "tenantId": 1, "userId": 1, "collection": 1, "status": 1, "lease_until": 1},
+            sort_field="created_at", sort_order=1, limit=cls.WORKERS * 4,
+        )
+        for candidate in candidates:
+            # One job per collection at a time, so runs don't overwrite each other's manifest
+            if not await cls._lock_collection(candidate, now):
+                continue
+
+            job = await MongoStorageService.find_one_and_update(
+                cls.COLLECTION,
+                {"job_id": candidate["job_id"], "status": candidate["status"], "lease_until": candidate["lease_until"]},
+                {
+                    "$set": {"status": "running", "worker": cls._worker_id, "lease_until": now + cls.LEASE_SECONDS * 1000},
+                    "$inc": {"attempts": 1},
+                },
+            )
+            if job is not None:
+                return job
+            await cls._unlock_collection(candidate)
+        return None
+
+    @staticmethod
+    def _lock_key(job: Dict[str, Any]) -> Dict[str, Any]:
+        return {"tenantId": job["tenantId"], "userId": job["userId"], "collection": job["collection"]}
+
+    @classmethod
+    async def _lock_collection(cls, job: Dict[str, Any], now: int) -> bool:
+        """Atomically take the lease on the job's collection; False if another live job holds it"""
+        key = cls._lock_key(job)
+        # Create the lease document up front, so taking it below never races an insert
+        await MongoStorageService.update_one(
+            cls.LOCKS, dict(key), {"$setOnInsert": {"job_id": None, "worker": None, "lease_until": 0}}, upsert=True
+        )
+        lease = await MongoStorageService.find_one_and_update(
+            cls.LOCKS,
+            {**key, "$or": [{"lease_until": {"$lt": now}}, {"job_id": job["job_id"], "worker": cls._worker_id}]},
+            {"$set": {"job_id": job["job_id"], "worker": cls._worker_id, "lease_until": now + cls.LEASE_SECONDS * 1000}},
+        )
+        return lease is not None
+
+    @classmethod
+    async def _unlock_collection(cls, job: Dict[str, Any]) -> None:
+        await MongoStorageService.update_one(
+            cls.LOCKS,
+            {**cls._lock_key(job), "job_id": job["job_id"], "worker": cls._worker_id},
+            {"$set": {"job_id": None, "worker": None, "lease_until": 0}},
+        )
+
+    # ------------------------------------------------------------------
+    # Job execution
+    # ------------------------------------------------------------------
+    @classmethod
+    async def _heartbeat(cls, job: Dict[str, Any]) -> None:
+        while True:
+            await asyncio.sleep(cls.LEASE_SECONDS / 3)
+            lease = {"$set": {"lease_until": _now_ms() + cls.LEASE_SECONDS * 1000}}
+            await MongoStorageService.update_one(
+                cls.COLLECTION, {"job_id": job["job_id"], "worker": cls._worker_id}, dict(lease)
+            )
+            await MongoStorageService.update_one(
+                cls.LOCKS, {**cls._lock_key(job), "job_id": job["job_id"], "worker": cls._worker_id}, dict(lease)
+            )
+
+    @classmethod
+    async def _run(cls, job: Dict[str, Any]) -> None:
+        from .vector_service import VectorService
+
+        job_id = job["job_id"]
+        tenant_id = job["tenantId"]
+        user = {"id": job["userId"], "tenantId": tenant_id}
+        logger.info(f"[KNOWLEDGE] Running ingestion job {job_id} (attempt {job['attempts']})")
+        if not job.get("started_at"):
+            await MongoStorageService.update_one(cls.COLLECTION, {"job_id": job_id}, {"$set": {"started_at": _now_ms()}})
+
+        heartbeat = asyncio.create_task(cls._heartbeat(job))
+        try:
+            if job.get("op") == "delete":
+                await cls._delete_files(job, user)
+            else:
+                vector_db, manifest = await VectorService.open_ingestion(user, job["collection"], job["payload"] or {})
+                slots = cls._tenant_slots.setdefault(tenant_id, asyncio.Semaphore(cls.TENANT_CONCURRENCY))
+                manifest_lock = asyncio.Lock()
+                await asyncio.gather(*(
+                    cls._run_file(job_id, index, entry, vector_db, manifest, slots, manifest_lock)
+                    for index, entry in enumerate(job["files"])
+                    if entry.get("status") not in cls.FINISHED_FILE_STATES
+                ))
+
+            final = await MongoStorageService.find_one(cls.COLLECTION, {"job_id": job_id}, projection={"files_failed": 1})
+            status = "completed_with_errors" if final and final.get("files_failed") else "completed"
+            await cls._finish(job, status)
+            logger.info(f"[KNOWLEDGE] Ingestion job {job_id} {status}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[KNOWLEDGE] Ingestion job {job_id} failed: {e}")
+            await cls._finish(job, "failed", str(e))
+        finally:
+            heartbeat.cancel()
+
+    @classmethod
+    async def _finish(cls, job: Dict[str, Any], status: str, error: Optional[str] = None) -> None:
+        await MongoStorageService.update_one(
+            cls.COLLECTION,
+            {"job_id": job["job_id"], "worker": cls._worker_id},
+            {"$set": {"status": status, "error": error, "finished_at": _now_ms(), "lease_until": 0}},
+        )
+        await cls._unlock_collection(job)
+
+    @classmethod
+    async def _delete_files(cls, job: Dict[str, Any], user: dict) -> None:
+        """Remove the job's files from the collection, one at a time under the collection lease"""
+        from .vector_service import VectorService
+
+        for index, entry in enumerate(job["files"]):
+            if entry.get("status") in cls.FINISHED_FILE_STATES:
+                continue
+            started = time.monotonic()
+            deleted = await VectorService.delete_document(user, job["collection"], entry["key"])
+            await MongoStorageService.update_one(cls.COLLECTION, {"job_id": job["job_id"]}, {
+                "$set": {
+                    f"files.{index}.status": "deleted" if deleted else "failed",
+                    f"files.{index}.error": None if deleted else "Failed to delete the file's chunks",
+                    f"files.{index}.duration_ms": int((time.monotonic() - started) * 1000),
+                },
+                "$inc": {"files_done": 1, "files_failed": int(not deleted)},
+            })
+
+    @classmethod
+    async def _run_file(cls, job_id: str, index: int, entry: Dict[str, Any], vector_db, manifest,
+                        slots: asyncio.Semaphore, manifest_lock: asyncio.Lock) -> None:
+        from .file_service import FileService
+        from .vector_service import VectorService
+
+        async with slots:
+            prefix = f"files.{index}"
+            await MongoStorageService.update_one(
+                cls.COLLECTION, {"job_id": job_id}, {"$set": {f"{prefix}.status": "running"}}
+            )
+            started = time.monotonic()
+            result = None
+            error = None
+            try:
+                content = await FileService.get_file_content_from_path(entry["key"])
+                if not content and entry.get("size"):
+                    raise FileNotFoundError(f"{entry['key']} is missing from storage")
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    cls._executor, VectorService.index_file, vector_db, manifest, entry["name"], content
+                )
+                del content
+            except Exception as e:
+                error = str(e) or e.__class__.__name__
+                logger.error(f"[KNOWLEDGE] Failed to index {entry['name']} in job {job_id}: {error}")
+
+            if result is not None:
+                # Persist the manifest per file, so a restarted job skips what is already indexed
+                async with manifest_lock:
+                    await manifest.save()
+
+            update = {
+                "$set": {
+                    f"{prefix}.status": "failed" if result is None else ("skipped" if result["skipped"] else "indexed"),
+                    f"{prefix}.error": error,
+                    f"{prefix}.chunks": result["chunks"] if result else 0,
+                    f"{prefix}.embedded": result["embedded"] if result else 0,
+                    f"{prefix}.duration_ms": int((time.monotonic() - started) * 1000),
+                },
+                "$inc": {
+                    "files_done": 1,
+                    "files_failed": int(result is None),
+                    "bytes_done": entry.get("size", 0),
+                    "chunks": result["chunks"] if result else 0,
+                    "embedded": result["embedded"] if result else 0,
+                },
+            }
+            await MongoStorageService.update_one(cls.COLLECTION, {"job_id": job_id}, update)
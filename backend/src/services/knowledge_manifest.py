@@ -0,0 +1,165 @@
+"""
+Knowledge Manifest
+
+Per-collection record of which uploaded files are indexed in the vector
+database: the SHA-256 of each file's content and the ids of the chunks it
+produced. Ingestion diffs a collection's files against it so only new or
+changed files are extracted, embedded and upserted, and chunks that a new
+version of a file no longer produces can be deleted.
+"""
+
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+
+from ..utils.log import logger
+from ..utils.mongo_storage import MongoStorageService
+
+
+class KnowledgeManifest:
+    """Indexed files of one (user, collection) pair, keyed by filename"""
+
+    COLLECTION = "knowledgeManifests"
+
+    def __init__(self, tenant_id: str, user_id: str, collection: str,
+                 model_id: Optional[str] = None, files: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.tenant_id = tenant_id
+        self.user_id = user_id
+        self.collection = collection
+        self.model_id = model_id
+        # filename -> {"hash": str, "size": int, "chunk_ids": [str], "indexed_at": int}
+        self.files: Dict[str, Dict[str, Any]] = files or {}
+        # Files of one ingestion may be indexed on several worker threads
+        self._lock = threading.RLock()
+        # filename -> chunk ids of a version being indexed, protected from stale-chunk deletion
+        self._pending: Dict[str, set] = {}
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @classmethod
+    async def load(cls, user: dict, collection: str, model_id: Optional[str] = None,
+                   any_embedder: bool = False) -> "KnowledgeManifest":
+        """Load the collection's manifest; an embedder change starts an empty one unless any_embedder"""
+        tenant_id = user.get("tenantId")
+        user_id = user.get("id") or user.get("userId")
+        doc = await MongoStorageService.find_one(
+            cls.COLLECTION,
+            {"userId": user_id, "collection": collection},
+            tenant_id=tenant_id,
+        )
+        if not doc:
+            return cls(tenant_id, user_id, collection, model_id)
+
+        if any_embedder:
+            model_id = doc.get("model_id")
+        elif doc.get("model_id") != model_id:
+            # Vectors from another embedder can't be reused; every file is indexed again
+            logger.info(
+                f"[KNOWLEDGE] Embedder of collection {collection} changed "
+                f"({doc.get('model_id')} -> {model_id}); re-indexing all files"
+            )
+            return cls(tenant_id, user_id, collection, model_id)
+
+        # Stored as a list: filenames contain dots, which Mongo field names can't
+        files = {entry["name"]: entry for entry in doc.get("files", []) if entry.get("name")}
+        return cls(tenant_id, user_id, collection, model_id, files)
+
+    async def save(self) -> None:
+        with self._lock:
+            files = [dict(entry) for entry in self.files.values()]
+        await MongoStorageService.update_one(
+            self.COLLECTION,
+            {"userId": self.user_id, "collection": self.collection},
+            {
+                "$set": {
+                    "userId": self.user_id,
+                    "collection": self.collection,
+                    "model_id": self.model_id,
+                    "files": files,
+                }
+            },
+            tenant_id=self.tenant_id,
+            upsert=True,
+        )
+
+    @classmethod
+    async def delete(cls, user: dict, collection: str) -> None:
+        user_id = user.get("id") or user.get("userId")
+        await MongoStorageService.delete_one(
+            cls.COLLECTION,
+            {"userId": user_id, "collection": collection},
+            tenant_id=user.get("tenantId"),
+        )
+
+    def is_current(self, filename: str, content_hash: str) -> bool:
+        """Whether filename is already indexed with exactly this content"""
+        with self._lock:
+            entry = self.files.get(filename)
+        return entry is not None and entry.get("hash") == content_hash
+
+    def changed(self, contents: Dict[str, bytes]) -> Dict[str, str]:
+        """filename -> content hash for the files that are new or differ from the manifest"""
+        hashes = {name: self.content_hash(content) for name, content in contents.items()}
+        return {name: digest for name, digest in hashes.items() if not self.is_current(name, digest)}
+
+    def indexed_ids(self) -> set:
+        """Ids of every chunk indexed for the collection"""
+        with self._lock:
+            return {chunk_id for entry in self.files.values() for chunk_id in entry.get("chunk_ids", ())}
+
+    def reserve(self, filename: str, chunk_ids: Iterable[str]) -> set:
+        """Returns the chunk_ids the collection already holds, and keeps them from being deleted
+        as stale by other files until filename is recorded or released"""
+        chunk_ids = set(chunk_ids)
+        with self._lock:
+            self._pending[filename] = chunk_ids
+            return chunk_ids & self.indexed_ids()
+
+    def release(self, filename: str) -> None:
+        with self._lock:
+            self._pending.pop(filename, None)
+
+    def _referenced_elsewhere(self, filename: str) -> set:
+        referenced = set()
+        for name, entry in self.files.items():
+            if name != filename:
+                referenced.update(entry.get("chunk_ids", ()))
+        for name, pending in self._pending.items():
+            if name != filename:
+                referenced.update(pending)
+        return referenced
+
+    def stale_ids(self, filename: str, chunk_ids: Iterable[str] = ()) -> List[str]:
+        """Chunk ids indexed for filename that are not in chunk_ids and no other file produced.
+
+        Vector stores that derive ids from chunk content share one point between
+        identical chunks of different files, so those are kept.
+        """
+        with self._lock:
+            entry = self.files.get(filename)
+            if not entry:
+                return []
+            keep = set(chunk_ids) | self._referenced_elsewhere(filename)
+            return [chunk_id for chunk_id in entry.get("chunk_ids", ()) if chunk_id not in keep]
+
+    def record(self, filename: str, content_hash: str, size: int, chunk_ids: List[str]) -> None:
+        entry = {
+            "name": filename,
+            "hash": content_hash,
+            "size": size,
+            "chunk_ids": list(dict.fromkeys(chunk_ids)),
+            "indexed_at": int(datetime.utcnow().timestamp() * 1000),
+        }
+        with self._lock:
+            self.files[filename] = entry
+            self._pending.pop(filename, None)
+
+    def forget(self, filename: str) -> List[str]:
+        """Drop filename; returns the chunk ids that are no longer referenced"""
+        with self._lock:
+            stale = self.stale_ids(filename)
+            self.files.pop(filename, None)
+        return stale
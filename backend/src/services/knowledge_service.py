@@ -16,6 +16,7 @@ from ..utils.mongo_storage import MongoStorageService
 from ..utils.component_discovery import discover_components, get_detailed_class_info
 from .file_service import FileService
 from .vector_service import VectorService
+from .knowledge_ingestion_service import KnowledgeIngestionService
 from .model_config_service import ModelConfigService
 
 
@@ -250,6 +251,9 @@ class KnowledgeService:
             if not result:
                 raise HTTPException(status_code=404, detail="Knowledge configuration not found")
             
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(tenant_id=tenant_id)
+            
             logger.info(f"[KNOWLEDGE] Successfully updated config '{collection_name}'")
             return {"message": "Knowledge configuration updated"}
             
@@ -283,6 +287,9 @@ class KnowledgeService:
             # Delete vector collection
             await cls._delete_vector_collection(tenant_id, user_id, name)
             
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(tenant_id=tenant_id)
+            
             logger.info(f"[KNOWLEDGE] Successfully deleted config '{name}'")
             return {"message": f"Knowledge configuration '{name}' deleted"}
             
@@ -437,6 +444,8 @@ class KnowledgeService:
         
         # Delete from MongoDB
         result = await MongoStorageService.delete_one("knowledgeConfig", {"name": name}, tenant_id=tenant_id)
+        from .agent_runtime_service import AgentRuntimeService
+        AgentRuntimeService.invalidate_agent_templates(tenant_id=tenant_id)
         
         # Delete vector collection
         try:
@@ -749,6 +758,9 @@ class KnowledgeService:
             tenant_id=tenant_id,
             upsert=True
         )
+        if doc:
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(doc.get("_id"), tenant_id=tenant_id)
 
         return {"ok": True, "collection": collection_name}
 
@@ -784,6 +796,8 @@ class KnowledgeService:
         )
         if not result:
             raise HTTPException(status_code=404, detail="collection not found")
+        from .agent_runtime_service import AgentRuntimeService
+        AgentRuntimeService.invalidate_agent_templates(collection_info.get("_id") if collection_info else None, tenant_id=tenant_id)
 
         # Delete all files from MinIO storage
         file_deletion_result = {"deleted_files": [], "failed_files": [], "deleted_count": 0, "failed_count": 0}
@@ -838,8 +852,11 @@ class KnowledgeService:
                 logger.error(f"[KNOWLEDGE] Failed to delete file '{filename}' from MinIO at path: {file_path}")
                 raise HTTPException(status_code=500, detail=f"Failed to delete file: {filename}")
             
-            # TODO: Also remove the file's embeddings from the vector database
-            # This would require identifying and deleting specific vectors based on file metadata
+            # Remove the file's chunks from the vector database and the collection manifest; queued so it
+            # waits for any ingestion job holding the collection
+            job = await KnowledgeIngestionService.enqueue(
+                user, collection_name, {}, [{"filename": filename, "key": file_path, "size": 0}], op="delete"
+            )
             
             # Remove the file from the MongoDB collection's files array
             await MongoStorageService.update_one(
@@ -850,7 +867,7 @@ class KnowledgeService:
             )
             
             logger.info(f"[KNOWLEDGE] Successfully deleted file '{filename}' from collection '{collection_name}'")
-            return {"deleted": True, "filename": filename, "collection": collection_name}
+            return {"deleted": True, "filename": filename, "collection": collection_name, "job_id": job["job_id"]}
             
         except HTTPException:
             raise
@@ -860,9 +877,7 @@ class KnowledgeService:
     
     @classmethod
     async def upload_knowledge_files(cls, files: List[UploadFile], user: dict, payload: dict) -> Dict[str, Any]:
-        """Upload files to MinIO under uploads/tenantId/userId/collection/ and index them"""
-        from io import BytesIO
-        
+        """Upload files to MinIO under uploads/userId/collection/ and queue an ingestion job for them"""
         if not files:
             raise HTTPException(status_code=400, detail="No files provided")
 
@@ -890,7 +905,7 @@ class KnowledgeService:
         MAX_FILE_SIZE = 200 * 1024 * 1024
 
         try:
-            # First, upload all files to MinIO
+            # First, stream all files to storage
             results = []
             base_path = f"uploads/{user_id}/{collection_name}"
 
@@ -898,8 +913,8 @@ class KnowledgeService:
                 if f.content_type and f.content_type not in ALLOWED_TYPES:
                     raise HTTPException(status_code=400, detail=f"File type not allowed: {f.filename}")
 
-                content = await f.read()
-                if len(content) > MAX_FILE_SIZE:
+                size = cls._upload_size(f)
+                if size > MAX_FILE_SIZE:
                     raise HTTPException(status_code=400, detail=f"File too large: {f.filename}")
 
                 # Use plain filename without timestamp
@@ -912,14 +927,14 @@ class KnowledgeService:
                     warning_message = f"File '{f.filename}' already exists and will be overwritten"
                     logger.warning(f"[KNOWLEDGE] File '{f.filename}' already exists at {object_name}. Overwriting existing file.")
                 
-                # Upload file
-                await FileService.upload_file_content(object_name, content, f.content_type)
+                # Upload file from the request's spooled temp file, without reading it into memory
+                if not await FileService.upload_file_stream(object_name, f.file, size, f.content_type):
+                    raise HTTPException(status_code=500, detail=f"Failed to store file: {f.filename}")
 
                 result_item = {
                     "filename": f.filename,
-                    "size": len(content),
+                    "size": size,
                     "key": object_name,
-                    "content": content,  # Keep content for indexing
                 }
                 
                 if warning_message:
@@ -927,15 +942,7 @@ class KnowledgeService:
                     
                 results.append(result_item)
 
-            # Update the MongoDB collection with file information first (before indexing)
             vector_collection_name = f"{collection_name}_{user_id}"
-            try:
-                await VectorService.index_knowledge_files(user, collection_name, payload)
-                logger.info(f"[KNOWLEDGE] indexing done fo{vector_collection_name}")
-            except Exception as ve:
-                logger.error(f"[KNOWLEDGE] Failed to index collection config: {ve}")
-
-            #Update mongo even if vector indexing fails
             try:
                 await MongoStorageService.update_one(
                     "knowledgeConfig",
@@ -954,12 +961,30 @@ class KnowledgeService:
             except Exception as db_error:
                 logger.error(f"[KNOWLEDGE] Failed to update MongoDB collection config: {db_error}")
 
+            # Parse, chunk, embed and index in the background; progress is read through the job id
+            job = await KnowledgeIngestionService.enqueue(user, collection_name, payload, results)
+            return {
+                "message": f"Uploaded {len(results)} files; indexing queued",
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "files": results,
+            }
 
         except HTTPException:
             raise
         except Exception as e:
             logger.error(f"[KNOWLEDGE] Upload failed: {e}")
             raise HTTPException(status_code=500, detail="Upload failed")
+
+    @staticmethod
+    def _upload_size(f: UploadFile) -> int:
+        """Size of an uploaded file, measured on its spooled temp file when the request didn't say"""
+        if f.size is not None:
+            return f.size
+        f.file.seek(0, os.SEEK_END)
+        size = f.file.tell()
+        f.file.seek(0)
+        return size
     
     @classmethod
     async def get_diagnostics(cls) -> Dict[str, Any]:
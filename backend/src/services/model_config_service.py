@@ -336,6 +336,9 @@ class ModelConfigService:
             if not result:
                 raise HTTPException(status_code=404, detail="Model configuration not found")
             
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(tenant_id=tenant_id)
+            
             logger.info(f"[MODEL] Successfully updated model config '{config_name}'")
             return {"message": "Model configuration updated"}
             
@@ -375,6 +378,9 @@ class ModelConfigService:
             if not result:
                 raise HTTPException(status_code=404, detail="Model configuration not found")
             
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(tenant_id=tenant_id)
+            
             logger.info(f"[MODEL] Successfully deleted model config '{config_name}'")
             return {"message": f"Model configuration '{config_name}' deleted"}
             
@@ -418,6 +424,9 @@ class ModelConfigService:
             if not result:
                 raise HTTPException(status_code=404, detail="Model configuration not found")
             
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(config_id)
+            
             logger.info(f"[MODEL] Successfully updated model config '{config_id}'")
             return {"message": "Model configuration updated"}
             
@@ -468,6 +477,9 @@ class ModelConfigService:
             if not result:
                 raise HTTPException(status_code=404, detail="Model configuration not found")
             
+            from .agent_runtime_service import AgentRuntimeService
+            AgentRuntimeService.invalidate_agent_templates(config_id)
+            
             logger.info(f"[MODEL] Successfully deleted model config '{config_id}'")
             return {"message": f"Model configuration deleted"}
             
@@ -303,6 +303,9 @@ class ToolConfigService:
                 detail="Tool configuration not found"
             )
         
+        from .agent_runtime_service import AgentRuntimeService
+        AgentRuntimeService.invalidate_agent_templates(config_id)
+        
         logger.info(f"[TOOL] Successfully updated tool config '{config_id}' for tenant: {tenant_id}")
         return {"message": "Tool configuration updated successfully"}
 
@@ -332,6 +335,9 @@ class ToolConfigService:
                 detail="Tool configuration not found"
             )
         
+        from .agent_runtime_service import AgentRuntimeService
+        AgentRuntimeService.invalidate_agent_templates(config_id)
+        
         logger.info(f"[TOOL] Successfully deleted tool config '{config_id}' for tenant: {tenant_id}")
         return {"message": "Tool configuration deleted successfully"}
         
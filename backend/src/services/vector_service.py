@@ -6,42 +6,21 @@ document indexing, search, and vector database configurations.
 """
 
 import os
-import ast
-import importlib
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from fastapi import HTTPException, status
 
 from ..utils.log import logger
-
-
-def module_loader(module_path: str):
-    if not module_path:
-        return None
-    try:
-        module = importlib.import_module(module_path)
-        module_file = getattr(module, "__file__", None)
-        class_name = None
-        if module_file and module_file.endswith(".py"):
-            with open(module_file, 'r', encoding='utf-8') as file:
-                tree = ast.parse(file.read())
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    class_name = node.name
-                    break
-        if class_name:
-            logger.info(f"[VECTOR] module_loader found class {class_name} in {module_path}")
-            return getattr(module, class_name)
-        else:
-            logger.error(f"[VECTOR] module_loader could not find any class in {module_path}")
-    except Exception as e:
-        logger.error(f"[VECTOR] module_loader failed for {module_path}: {e}")
-    return None
+from ..utils.strategy_registry import resolve_strategy
+from ..utils.embedding_cache import cached_embedder, embedding_cache_stats
 
 
 class VectorService:
     """Service for managing vector database operations"""
     
+    # Stored with a collection but never embedded
+    IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp', '.tiff', '.tif'}
+    
     @staticmethod
     def _get_vector_collection_name(user_id: str, payload: dict) -> str:
         """Generate vector collection name in format: userid_collectionname"""
@@ -66,10 +45,10 @@ class VectorService:
                     module_path = embedding_config.get("strategy")
                     params = embedding_config.get("params", {})
                     
-                    embedder_class = module_loader(module_path)
+                    embedder_class = resolve_strategy(module_path)
                     if embedder_class:
                         try:
-                            embedder_instance = embedder_class(**params)
+                            embedder_instance = cached_embedder(embedder_class(**params))
                             logger.info(f"[VECTOR] Successfully loaded embedder from model config {model_id}")
                         except Exception as e:
                             logger.error(f"[VECTOR] Failed to create embedder instance: {e}")
@@ -108,6 +87,11 @@ class VectorService:
             **qdrant_config
         )
     
+    @staticmethod
+    def get_embedding_cache_stats() -> Optional[Dict[str, Any]]:
+        """Hit rate of the shared embedding cache (None when it is disabled)"""
+        return embedding_cache_stats()
+
     @classmethod
     def get_vector_db_client_with_collection(cls, collection: str):
         """Get a vector database client for the specified collection"""
@@ -136,8 +120,10 @@ class VectorService:
             vector_collection_name = cls._get_vector_collection_name(user_id, payload)
             vector_db = await cls.get_vector_db_client(user, payload)
             
-            # Delete the collection
+            # Delete the collection, and the manifest of what it held
             vector_db.delete()
+            from .knowledge_manifest import KnowledgeManifest
+            await KnowledgeManifest.delete(user, collection)
             logger.info(f"[VECTOR] Deleted collection: {vector_collection_name}")
             return True
             
@@ -159,119 +145,151 @@ class VectorService:
             logger.error(f"[VECTOR] Failed to check collection existence for {collection}: {e}")
             return False
 
+    @staticmethod
+    def _build_knowledge_base(file_path: Path, vector_db):
+        """Create the knowledge base that reads a single file"""
+        from ai.knowledge.pdf import PDFKnowledgeBase
+        from ai.knowledge.text import TextKnowledgeBase
+        from ai.knowledge.docx import DocxKnowledgeBase
+        from ai.knowledge.combined import CombinedKnowledgeBase
+
+        filename = file_path.name
+        file_ext = file_path.suffix.lower()
+
+        path = str(file_path)
+        if file_ext in ['.pdf']:
+            try:
+                return PDFKnowledgeBase(path=path, vector_db=vector_db)
+            except Exception as e:
+                logger.warning(f"[VECTOR] PDF processing failed for {filename}, falling back to text processing: {e}")
+                return TextKnowledgeBase(path=path, vector_db=vector_db)
+        if file_ext in ['.docx', '.doc']:
+            return DocxKnowledgeBase(path=path, vector_db=vector_db)
+        if file_ext in ['.txt', '.py', '.js', '.json', '.csv']:
+            return TextKnowledgeBase(path=path, vector_db=vector_db)
+
+        # Use combined knowledge base for unknown types, but handle PDF failures gracefully
+        text_kb = TextKnowledgeBase(path=path, vector_db=vector_db)
+        docx_kb = DocxKnowledgeBase(path=path, vector_db=vector_db)
+        sources = [text_kb, docx_kb]
+        
+        try:
+            pdf_kb = PDFKnowledgeBase(path=path, vector_db=vector_db)
+            sources.insert(0, pdf_kb)  # Add PDF processing if available
+        except Exception as e:
+            logger.warning(f"[VECTOR] PDF processing not available for {filename}, using text/docx only: {e}")
+        
+        return CombinedKnowledgeBase(sources=sources, vector_db=vector_db)
+
+    @staticmethod
+    async def _read_collection_files(folder_path: str) -> Dict[str, bytes]:
+        """filename -> content of every file stored under folder_path"""
+        from ..services.file_service import FileService
+
+        contents = {}
+        file_keys = await FileService.list_files_at_path(folder_path)
+        for file_key in file_keys:
+            if file_key.endswith('/'):
+                continue
+            filename = Path(file_key).name
+            if filename:
+                contents[filename] = await FileService.get_file_content_from_path(file_key)
+        return contents
+
+    @classmethod
+    async def open_ingestion(cls, user: dict, collection: str, payload: dict):
+        """Open a collection's vector db and manifest for a run of index_file calls"""
+        from .knowledge_manifest import KnowledgeManifest
+
+        vector_db = await cls.get_vector_db_client(user, payload)
+        manifest = await KnowledgeManifest.load(user, collection, payload.get("model_id"))
+        return vector_db, manifest
+
     @classmethod
-    async def index_knowledge_files(cls, user: dict, collection: str, payload: dict) -> bool:
-        """Index files from MinIO bucket to the vector database"""
+    def index_file(cls, vector_db, manifest, filename: str, content: bytes) -> Dict[str, Any]:
+        """Index one file into an open collection, unless the manifest already has this content.
+
+        Only chunks the collection doesn't hold are embedded and upserted; chunks that
+        only the file's previous version produced are deleted afterwards. This blocks
+        on extraction and embedding, so run it off the event loop. Errors are raised
+        and leave the file out of the manifest, so the next ingestion retries it.
+
+        Returns {"chunks": total chunks, "embedded": chunks embedded, "skipped": bool}.
+        """
+        import tempfile
+
+        content_hash = manifest.content_hash(content)
+        if manifest.is_current(filename, content_hash):
+            return {"chunks": 0, "embedded": 0, "skipped": True}
+
+        if Path(filename).suffix.lower() in cls.IMAGE_EXTENSIONS:
+            logger.info(f"[VECTOR] Skipping vector indexing for image file: {filename}")
+            manifest.record(filename, content_hash, len(content), [])
+            return {"chunks": 0, "embedded": 0, "skipped": True}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / Path(filename).name
+            file_path.write_bytes(content)
+            try:
+                knowledge_base = cls._build_knowledge_base(file_path, vector_db)
+                logger.info(f"[VECTOR] Loading file {filename} using knowledge base")
+                documents = [document for document_list in knowledge_base.document_lists for document in document_list]
+
+                chunk_ids = [vector_db.doc_id(document) for document in documents]
+                # Chunks that an earlier version of the file (or another file) produced keep their vectors
+                existing = manifest.reserve(filename, chunk_ids)
+                new_documents = [
+                    document for document, chunk_id in zip(documents, chunk_ids) if chunk_id not in existing
+                ]
+                if new_documents:
+                    # Embedded in concurrent batches; the manifest already filtered out existing chunks
+                    knowledge_base.load_documents(new_documents, upsert=True, skip_existing=False)
+
+                # Delete chunks only the previous version of the file had, after the new ones are in
+                vector_db.delete_ids(manifest.stale_ids(filename, chunk_ids))
+                manifest.record(filename, content_hash, len(content), chunk_ids)
+            except Exception:
+                manifest.release(filename)
+                raise
+
+        logger.info(f"[VECTOR] Successfully indexed {filename}: {len(new_documents)} of {len(documents)} chunks embedded")
+        return {"chunks": len(documents), "embedded": len(new_documents), "skipped": False}
+
+    @classmethod
+    async def index_knowledge_files(
+        cls, user: dict, collection: str, payload: dict, files: Optional[Dict[str, bytes]] = None
+    ) -> bool:
+        """Index the new or changed files of a collection into the vector database.
+
+        ``files`` maps filename -> content of just-uploaded files. Without it every
+        file stored under the collection is diffed against the manifest, and files
+        that are no longer stored are removed from the index.
+        """
         try:
-            import tempfile
-            from pathlib import Path
-            from ..services.file_service import FileService
+            import asyncio
             
             user_id = user.get("id") or user.get("userId")
-            vector_db = await cls.get_vector_db_client(user, payload)
+            vector_db, manifest = await cls.open_ingestion(user, collection, payload)
             vector_collection_name = cls._get_vector_collection_name(user_id, payload)
             
-            logger.info(f"[VECTOR] Indexing files from MinIO to collection {vector_collection_name}")
+            if files is None:
+                files = await cls._read_collection_files(f"uploads/{user_id}/{collection}")
+                for filename in [name for name in manifest.files if name not in files]:
+                    vector_db.delete_ids(manifest.forget(filename))
+                    logger.info(f"[VECTOR] Removed deleted file {filename} from {vector_collection_name}")
             
-            # Use FileService to download files
-            folder_path = f"uploads/{user_id}/{collection}"
+            logger.info(f"[VECTOR] Indexing {len(files)} files to collection {vector_collection_name}")
+            indexed = 0
+            for filename, content in files.items():
+                try:
+                    result = await asyncio.to_thread(cls.index_file, vector_db, manifest, filename, content)
+                    indexed += not result["skipped"]
+                except Exception as e:
+                    logger.error(f"[VECTOR] Failed to load knowledge base for {filename}: {e}")
+            logger.info(f"[VECTOR] {indexed} of {len(files)} files were new or changed in {vector_collection_name}")
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Download all files using FileService
-                file_keys = await FileService.list_files_at_path(folder_path)
-                file_keys = [key for key in file_keys if not key.endswith('/')]
-                for file_key in file_keys:
-                    filename = Path(file_key).name
-                    if filename:
-                        file_content = await FileService.get_file_content_from_path(file_key)
-                        (temp_path / filename).write_bytes(file_content)
-                
-                # Process each downloaded file with knowledge base modules
-                for temp_file_path in temp_path.iterdir():
-                    if temp_file_path.is_file():
-                        filename = temp_file_path.name
-                        file_ext = temp_file_path.suffix.lower()
-                        
-                        # Import knowledge base classes
-                        from ai.knowledge.pdf import PDFKnowledgeBase
-                        from ai.knowledge.text import TextKnowledgeBase
-                        from ai.knowledge.docx import DocxKnowledgeBase
-                        from ai.knowledge.combined import CombinedKnowledgeBase
-                        
-                        # Load chunking strategy if present
-                        chunking_strategy = None
-                        # TODO semnatic chunking
-                        # if payload and isinstance(payload, dict) and 'embedder' in payload:
-                        #     embedder_config = payload['embedder']
-                            
-                        #     # Load embedder for chunking
-                        #     embedder_instance = None
-                        #     embedder_module_path = embedder_config.get("strategy")
-                        #     embedder_params = embedder_config.get("params", {})
-                        #     embedder_class = module_loader(embedder_module_path)
-                        #     if embedder_class:
-                        #         try:
-                        #             embedder_instance = embedder_class(**embedder_params)
-                        #         except Exception as e:
-                        #             embedder_instance = None
-                            
-                        #     if 'chunk' in embedder_config:
-                        #         chunk_config = embedder_config['chunk']
-                        #         chunk_module_path = chunk_config.get("strategy")
-                        #         chunk_params = chunk_config.get("params", {})
-                        #         chunk_class = module_loader(chunk_module_path)
-                        #         if chunk_class and embedder_instance:
-                        #             try:
-                        #                 chunking_strategy = chunk_class(embedder=embedder_instance, **chunk_params)
-                        #             except Exception as e:
-                        #                 chunking_strategy = None
-                        
-                        # Create appropriate knowledge base based on file type
-                        knowledge_base = None
-                        
-                        # Skip vector indexing for image files
-                        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp', '.tiff', '.tif'}
-                        if file_ext in image_extensions:
-                            logger.info(f"[VECTOR] Skipping vector indexing for image file: {filename}")
-                            continue
-                        
-                        if file_ext in ['.pdf']:
-                            try:
-                                knowledge_base = PDFKnowledgeBase(path=str(temp_path), vector_db=vector_db)
-                            except Exception as e:
-                                logger.warning(f"[VECTOR] PDF processing failed for {filename}, falling back to text processing: {e}")
-                                knowledge_base = TextKnowledgeBase(path=str(temp_path), vector_db=vector_db)
-                        elif file_ext in ['.docx', '.doc']:
-                            knowledge_base = DocxKnowledgeBase(path=str(temp_path), vector_db=vector_db)
-                        elif file_ext in ['.txt', '.py', '.js', '.json', '.csv']:
-                            knowledge_base = TextKnowledgeBase(path=str(temp_path), vector_db=vector_db)
-                        else:
-                            # Use combined knowledge base for unknown types, but handle PDF failures gracefully
-                            text_kb = TextKnowledgeBase(path=str(temp_path), vector_db=vector_db)
-                            docx_kb = DocxKnowledgeBase(path=str(temp_path), vector_db=vector_db)
-                            sources = [text_kb, docx_kb]
-                            
-                            try:
-                                pdf_kb = PDFKnowledgeBase(path=str(temp_path), vector_db=vector_db)
-                                sources.insert(0, pdf_kb)  # Add PDF processing if available
-                            except Exception as e:
-                                logger.warning(f"[VECTOR] PDF processing not available for {filename}, using text/docx only: {e}")
-                            
-                            knowledge_base = CombinedKnowledgeBase(sources=sources, vector_db=vector_db)
-                        
-                        if knowledge_base:
-                            try:
-                                logger.info(f"[VECTOR] Loading file {filename} using knowledge base")
-                                knowledge_base.load(recreate=False, upsert=True)
-                                logger.info(f"[VECTOR] Successfully indexed {filename}")
-                            except Exception as e:
-                                logger.error(f"[VECTOR] Failed to load knowledge base for {filename}: {e}")
-                        else:
-                            logger.error(f"[VECTOR] No suitable knowledge base found for {filename}")
-                
-                return True
+            await manifest.save()
+            return True
                 
         except Exception as e:
             logger.error(f"[VECTOR] Failed to index files: {e}")
@@ -313,20 +331,29 @@ class VectorService:
     
     @classmethod
     async def delete_document(cls, user: dict, collection: str, file_path: str) -> bool:
-        """Delete a specific document from the vector database"""
+        """Delete every chunk of a specific document from the vector database.
+
+        Rewrites the collection's manifest, so it runs as a deletion job holding the collection
+        lease (see ``KnowledgeIngestionService.enqueue``) rather than alongside an ingestion.
+        """
         try:
+            from .knowledge_manifest import KnowledgeManifest
+
             user_id = user.get("id") or user.get("userId")
+            filename = Path(file_path).name
             # Create payload dictionary for get_vector_db_client
             payload = {"collection": collection}
             vector_db = await cls.get_vector_db_client(user, payload)
             
-            # Delete document by file_path (used as document ID)
-            # Note: This depends on the vector DB implementation supporting document deletion
-            # For now, we'll log the operation
             logger.info(f"[VECTOR] Deleting document {file_path} from collection {user_id}_{collection}")
-            
-            # TODO: Implement actual document deletion based on Qdrant capabilities
-            # vector_db.delete_document(file_path)
+
+            manifest = await KnowledgeManifest.load(user, collection, any_embedder=True)
+            if filename in manifest.files:
+                vector_db.delete_ids(manifest.forget(filename))
+                await manifest.save()
+            else:
+                # Indexed before the collection had a manifest; points are named after the file
+                vector_db.delete_documents_by_filename([filename])
             
             return True
             
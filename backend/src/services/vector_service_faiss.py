@@ -6,47 +6,276 @@ document indexing, search, and vector database configurations.
 """
 
 import os
-import ast
+import asyncio
 import json
 import pickle
+import hashlib
 import shutil
-import importlib
+import threading
+import weakref
+from collections import OrderedDict
 import faiss
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable
 
 from fastapi import HTTPException, status
 
 from ..utils.log import logger
+from ..utils.strategy_registry import resolve_strategy
+from ..utils.embedding_cache import cached_embedder, embedding_cache_stats
+
+
+def stable_doc_id(doc_id: str) -> int:
+    """Map a string document id to a stable, non-negative int64 FAISS id.
+
+    Python's built-in ``hash()`` is salted per process, so ids derived from it
+    cannot be matched against an index written by another process.
+    """
+    digest = hashlib.blake2b(doc_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") & 0x7FFFFFFFFFFFFFFF
 
 
 # ----------------------------------------------------------------------
-# Helper – load embedder exactly like the original code
+# Process-wide cache of open collections
 # ----------------------------------------------------------------------
-def module_loader(module_path: str):
-    """Load a module and return the first class found in it"""
-    if not module_path:
-        return None
-    try:
-        module = importlib.import_module(module_path)
-        module_file = getattr(module, "__file__", None)
-        class_name = None
-        if module_file and module_file.endswith(".py"):
-            with open(module_file, 'r', encoding='utf-8') as file:
-                tree = ast.parse(file.read())
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    class_name = node.name
-                    break
-        if class_name:
-            logger.info(f"[FAISS] module_loader found class {class_name} in {module_path}")
-            return getattr(module, class_name)
+class _ClientCache:
+    """Thread-safe LRU cache of open FAISS clients, one client per collection folder.
+
+    Every caller gets the same client for a folder, so appends to its log and
+    compactions are serialized by that client's lock. Clients evicted from the
+    LRU stay registered while a request still holds them, so a folder is never
+    opened twice.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._clients: "OrderedDict[Path, Any]" = OrderedDict()
+        # Every open client, including evicted ones that are still referenced
+        self._live: "weakref.WeakValueDictionary[Path, Any]" = weakref.WeakValueDictionary()
+        # Per-folder locks so a folder is loaded from disk once
+        self._opening: Dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, folder: Path, count: bool = True):
+        """Return the open client of ``folder``, or None; ``count=False`` leaves the hit/miss counters alone"""
+        with self._lock:
+            client = self._clients.get(folder) or self._live.get(folder)
+            if client is None:
+                self.misses += count
+                return None
+            self._put(folder, client)
+            self.hits += count
+            return client
+
+    def open(self, folder: Path, factory: Callable[[], Any], count: bool = True):
+        """Return the client of ``folder``, creating it with ``factory`` if none is open"""
+        client = self.get(folder, count=count)
+        if client is not None:
+            return client
+        with self._lock:
+            opening = self._opening.setdefault(folder, threading.Lock())
+        with opening:
+            with self._lock:
+                client = self._clients.get(folder) or self._live.get(folder)
+                if client is not None:
+                    self._put(folder, client)
+                    return client
+            try:
+                client = factory()
+                with self._lock:
+                    self._put(folder, client)
+                return client
+            finally:
+                with self._lock:
+                    self._opening.pop(folder, None)
+
+    def _put(self, folder: Path, client) -> None:
+        self._live[folder] = client
+        if self.max_size <= 0:
+            return
+        self._clients[folder] = client
+        self._clients.move_to_end(folder)
+        while len(self._clients) > self.max_size:
+            evicted_folder, _ = self._clients.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"[FAISS] Evicted cached collection {evicted_folder.name}")
+
+    def invalidate(self, folder: Path) -> bool:
+        """Forget the client of ``folder`` (e.g. once the collection is deleted); returns whether one was open"""
+        with self._lock:
+            cached = self._clients.pop(folder, None)
+            live = self._live.pop(folder, None)
+            return cached is not None or live is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._live.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._clients),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class _EmbedderBoundClient:
+    """A request's handle on a shared FAISS client that embeds with the request's own embedder.
+
+    Everything except embedding goes to the shared client, so the index, its lock and its
+    log are still used through one object per folder.
+    """
+
+    def __init__(self, client, embedder, model_id: Optional[str]):
+        self.client = client
+        self.embedder = embedder
+        self.model_id = model_id
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def upsert(self, texts: List[str], ids: List[str], metas: List[dict]):
+        self.client.upsert(texts, ids, metas, embedder=self.embedder)
+
+    def search(self, query: str, limit: int = 5, nprobe: Optional[int] = None, ef_search: Optional[int] = None):
+        return self.client.search(query, limit, nprobe=nprobe, ef_search=ef_search, embedder=self.embedder)
+
+
+# ----------------------------------------------------------------------
+# Size-adaptive index management
+# ----------------------------------------------------------------------
+class _IndexManager:
+    """Chooses, builds and migrates FAISS index types as a collection grows.
+
+    Collections start on an exact flat index and move to an approximate index
+    once they cross ``IVF_THRESHOLD`` vectors (IVF-Flat, or HNSW when
+    ``FAISS_ANN_KIND=hnsw``), then to IVF-PQ past ``IVFPQ_THRESHOLD``.
+    """
+
+    IVF_THRESHOLD = int(os.getenv("FAISS_IVF_THRESHOLD", 20_000))
+    IVFPQ_THRESHOLD = int(os.getenv("FAISS_IVFPQ_THRESHOLD", 500_000))
+    ANN_KIND = os.getenv("FAISS_ANN_KIND", "ivf").lower()
+    DEFAULT_NPROBE = int(os.getenv("FAISS_NPROBE", 16))
+    DEFAULT_EF_SEARCH = int(os.getenv("FAISS_EF_SEARCH", 64))
+    HNSW_M = 32
+    # Training points per IVF centroid (FAISS warns below 39)
+    TRAIN_POINTS_PER_LIST = 64
+
+    RANK = {"flat": 0, "ivf": 1, "hnsw": 1, "ivfpq": 2}
+
+    @classmethod
+    def supports_remove(cls, index: faiss.Index) -> bool:
+        """HNSW graphs cannot drop vectors; deletes there are tombstoned until a rebuild"""
+        return cls.kind_of(index) != "hnsw"
+
+    @classmethod
+    def target_kind(cls, count: int) -> str:
+        if count < cls.IVF_THRESHOLD:
+            return "flat"
+        if cls.ANN_KIND == "hnsw":
+            return "hnsw"
+        if count < cls.IVFPQ_THRESHOLD:
+            return "ivf"
+        return "ivfpq"
+
+    @staticmethod
+    def kind_of(index: faiss.Index) -> str:
+        if isinstance(index, faiss.IndexIDMap2):
+            inner = faiss.downcast_index(index.index)
+            return "hnsw" if isinstance(inner, faiss.IndexHNSW) else "flat"
+        if isinstance(index, faiss.IndexIVFPQ):
+            return "ivfpq"
+        if isinstance(index, faiss.IndexIVF):
+            return "ivf"
+        return "flat"
+
+    @classmethod
+    def should_migrate(cls, index: faiss.Index) -> bool:
+        target = cls.target_kind(index.ntotal)
+        return cls.RANK[target] > cls.RANK[cls.kind_of(index)]
+
+    @classmethod
+    def build(cls, kind: str, dim: int, training_vectors: Optional[np.ndarray] = None) -> faiss.Index:
+        """Create an empty index of ``kind``, trained on a sample of ``training_vectors`` if needed"""
+        if kind == "flat":
+            return faiss.IndexIDMap2(faiss.IndexFlatL2(dim))
+        if kind == "hnsw":
+            hnsw = faiss.IndexHNSWFlat(dim, cls.HNSW_M)
+            hnsw.hnsw.efSearch = cls.DEFAULT_EF_SEARCH
+            return faiss.IndexIDMap2(hnsw)
+
+        count = len(training_vectors)
+        nlist = int(4 * np.sqrt(count))
+        nlist = max(1, min(nlist, count // cls.TRAIN_POINTS_PER_LIST))
+        quantizer = faiss.IndexFlatL2(dim)
+        if kind == "ivf":
+            index = faiss.IndexIVFFlat(quantizer, dim, nlist)
         else:
-            logger.error(f"[FAISS] module_loader could not find any class in {module_path}")
-    except Exception as e:
-        logger.error(f"[FAISS] module_loader failed for {module_path}: {e}")
-    return None
+            m = next(m for m in (64, 48, 32, 24, 16, 12, 8, 4, 2, 1) if dim % m == 0)
+            index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, 8)
+        index.nprobe = min(cls.DEFAULT_NPROBE, nlist)
+
+        sample_size = min(count, nlist * 256)
+        rng = np.random.default_rng(0)
+        sample = training_vectors[rng.choice(count, size=sample_size, replace=False)]
+        logger.info(f"[FAISS] Training {kind} index (nlist={nlist}) on {sample_size} of {count} vectors")
+        index.train(sample)
+        return index
+
+    @classmethod
+    def extract(cls, index: faiss.Index) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (ids, vectors) for every vector stored in ``index``"""
+        if isinstance(index, faiss.IndexIDMap2):
+            ids = faiss.vector_to_array(index.id_map).astype(np.int64)
+            return ids, index.index.reconstruct_n(0, index.ntotal)
+
+        ivf = faiss.extract_index_ivf(index)
+        invlists = ivf.invlists
+        id_chunks = []
+        for list_no in range(ivf.nlist):
+            size = invlists.list_size(list_no)
+            if size:
+                id_chunks.append(faiss.rev_swig_ptr(invlists.get_ids(list_no), size).copy())
+        ids = np.concatenate(id_chunks).astype(np.int64) if id_chunks else np.empty(0, dtype=np.int64)
+        ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+        return ids, index.reconstruct_batch(ids)
+
+    @classmethod
+    def migrate(cls, index: faiss.Index, dim: int) -> faiss.Index:
+        """Rebuild ``index`` as the index type suited to its current size"""
+        kind = cls.target_kind(index.ntotal)
+        ids, vectors = cls.extract(index)
+        new_index = cls.build(kind, dim, vectors)
+        new_index.add_with_ids(vectors, ids)
+        logger.info(f"[FAISS] Migrated {cls.kind_of(index)} index to {kind} ({len(ids)} vectors)")
+        return new_index
+
+    @classmethod
+    def search_params(cls, index: faiss.Index, nprobe: Optional[int] = None, ef_search: Optional[int] = None):
+        """Per-query recall/latency knobs; None keeps the index defaults"""
+        kind = cls.kind_of(index)
+        if nprobe and kind in ("ivf", "ivfpq"):
+            return faiss.SearchParametersIVF(nprobe=nprobe)
+        if ef_search and kind == "hnsw":
+            return faiss.SearchParametersHNSW(efSearch=ef_search)
+        return None
+
+
+class _DummyEmbedder:
+    """Placeholder for clients used only for admin operations (delete, stats)"""
+
+    def encode(self, *args, **kwargs):
+        raise RuntimeError("Dummy embedder – not meant for real operations")
 
 
 # ----------------------------------------------------------------------
@@ -55,12 +284,18 @@ def module_loader(module_path: str):
 class VectorService:
     """Service for managing FAISS vector database operations"""
     
+    # Stored with a collection but never embedded
+    IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp', '.tiff', '.tif'}
+    
     # ------------------------------------------------------------------
     # Disk layout configuration
     # ------------------------------------------------------------------
     ROOT = Path("./faiss_collections")
     ROOT.mkdir(parents=True, exist_ok=True)
 
+    # Open collections (index + metadata + embedder) shared across requests
+    _client_cache = _ClientCache(int(os.getenv("FAISS_CLIENT_CACHE_SIZE", 32)))
+
     # ------------------------------------------------------------------
     # Helper methods
     # ------------------------------------------------------------------
@@ -93,10 +328,10 @@ class VectorService:
                     module_path = embedding_config.get("strategy")
                     params = embedding_config.get("params", {})
                     
-                    embedder_class = module_loader(module_path)
+                    embedder_class = resolve_strategy(module_path)
                     if embedder_class:
                         try:
-                            embedder_instance = embedder_class(**params)
+                            embedder_instance = cached_embedder(embedder_class(**params))
                             logger.info(f"[FAISS] Successfully loaded embedder from model config {model_id}")
                         except Exception as e:
                             logger.error(f"[FAISS] Failed to create embedder instance: {e}")
@@ -124,146 +359,463 @@ class VectorService:
     class _FAISSClient:
         """Internal FAISS client for managing index and metadata"""
         
-        def __init__(self, folder: Path, embedder):
+        # Upsert batches appended to meta.log before a snapshot is rewritten
+        COMPACT_EVERY = int(os.getenv("FAISS_COMPACT_EVERY", 64))
+        # Dead vectors, as a fraction of the index, that trigger a background rebuild
+        REBUILD_RATIO = float(os.getenv("FAISS_REBUILD_RATIO", 0.2))
+
+        def __init__(self, folder: Path, embedder, model_id: Optional[str] = None):
             self.folder = folder
             self.folder.mkdir(parents=True, exist_ok=True)
             self.index_path = folder / "index.faiss"
             self.meta_path = folder / "meta.pkl"
+            self.log_path = folder / "meta.log"
             self.embedder = embedder
+            # Model config the embedder was built from; None for clients opened without one
+            self.model_id = model_id
             self.dim = None
             self.index: Optional[faiss.Index] = None
+            # int64 FAISS id -> {"id": str, "text": str, "meta": dict}
+            self.docs: Dict[int, Dict[str, Any]] = {}
+            # Deleted ids whose vectors are still stored in a non-removable index
+            self.tombstones: set = set()
+            # Live ids that also keep superseded vectors in a non-removable index
+            self.replaced: set = set()
+            # Snapshot generation; log records from older generations are already compacted
+            self.generation = 0
+            self.pending_records = 0
+            # Set when the in-memory index changed type and must be snapshotted
+            self._needs_compaction = False
+            # Cached clients are shared between requests
+            self._lock = threading.RLock()
+            # Bumped on every in-memory change so a background rebuild can detect races
+            self._version = 0
+            self._rebuilding = False
+            # Set for collections saved in the legacy layout until their vectors are rebuilt
+            self.needs_reindex = False
             self._load_or_create()
 
         def _load_or_create(self):
-            """Load existing index or prepare to create new one"""
+            """Load the snapshot index and id → document mapping, then replay the append-only log"""
             if self.index_path.exists():
                 try:
                     self.index = faiss.read_index(str(self.index_path))
                     with open(self.meta_path, "rb") as f:
                         meta = pickle.load(f)
                     self.dim = meta["dim"]
-                    logger.info(f"[FAISS] Loaded index {self.folder.name} ({meta['count']} vectors, dim={self.dim})")
+                    self.docs = self._normalize_docs(meta.get("docs", {}))
+                    if self.needs_reindex:
+                        # Its vectors are stored under ids no document maps to; see reindex_legacy
+                        self.index = None
+                    self.generation = meta.get("generation", 0)
+                    self.tombstones = set(meta.get("tombstones", ()))
+                    self.replaced = set(meta.get("replaced", ()))
+                    # Older snapshots tombstoned re-upserted ids that are live again
+                    self._mark_replaced(self.tombstones & self.docs.keys())
                 except Exception as e:
                     logger.error(f"[FAISS] Failed to load existing index: {e}")
                     self.index = None
                     self.dim = None
-            else:
-                # First time – we will create index on first upsert
-                self.index = None
-                self.dim = None
+                    self.docs = {}
+                    self.tombstones = set()
+                    self.replaced = set()
+            # Otherwise the index is created on first upsert (or first replayed record)
 
-        def _ensure_index(self, dim: int):
-            """Create FAISS index if it doesn't exist"""
+            self._replay_log()
             if self.index is not None:
+                logger.info(
+                    f"[FAISS] Loaded index {self.folder.name} ({len(self.docs)} vectors, dim={self.dim}, "
+                    f"{self.pending_records} uncompacted batches)"
+                )
+
+        @staticmethod
+        def _read_log(log_path: Path):
+            """Yield (record, end_offset) for every complete record in an append-only log"""
+            if not log_path.exists():
                 return
-            
-            # Use IVF-PQ for fast & compact indexing
-            # For small collections, start with simpler flat index
-            nlist = max(100, int(np.sqrt(10_000)))  # heuristic for nlist
-            m = 8  # number of subquantizers
-            quantizer = faiss.IndexFlatL2(dim)
-            self.index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, 8)
-            self.index.nprobe = 10  # trade-off speed/accuracy
-            self.dim = dim
-            logger.info(f"[FAISS] Created new IVF-PQ index with dim={dim}, nlist={nlist}")
-
-        def upsert(self, texts: List[str], ids: List[str], metas: List[dict]):
-            """Add or update vectors in the index"""
+            with open(log_path, "rb") as f:
+                while True:
+                    try:
+                        record = pickle.load(f)
+                    except EOFError:
+                        return
+                    except Exception as e:
+                        logger.warning(f"[FAISS] Ignoring truncated record in {log_path}: {e}")
+                        return
+                    yield record, f.tell()
+
+        def _replay_log(self):
+            """Apply upsert and delete batches appended since the last snapshot"""
+            good_offset = 0
+            for record, offset in self._read_log(self.log_path):
+                good_offset = offset
+                if record.get("generation", 0) < self.generation:
+                    continue
+                if record.get("op") == "delete":
+                    self._apply_delete(record["ids"])
+                else:
+                    self._apply(record["vectors"], record["ids"], record["docs"])
+                self.pending_records += 1
+
+            # Drop a partially written tail so later appends stay readable
+            if self.log_path.exists() and self.log_path.stat().st_size > good_offset:
+                with open(self.log_path, "r+b") as f:
+                    f.truncate(good_offset)
+
+            # Persist a migration triggered by the replayed records
+            if self._needs_compaction:
+                self.compact()
+
+        def _normalize_docs(self, docs: Dict[Any, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+            """Return the docs mapping keyed by int64 id, upgrading the legacy str-keyed layout"""
+            if not docs or all(isinstance(key, int) for key in docs):
+                return docs
+            logger.warning(
+                f"[FAISS] Collection {self.folder.name} uses legacy string-keyed metadata; "
+                "its vectors will be rebuilt from the stored documents on first use"
+            )
+            self.needs_reindex = True
+            return {
+                stable_doc_id(doc_id): {"id": doc_id, "text": data.get("text", ""), "meta": data.get("meta", {})}
+                for doc_id, data in docs.items()
+            }
+
+        def reindex_legacy(self, embedder=None):
+            """Rebuild the vectors of a legacy collection from its stored documents.
+
+            The legacy layout stored vectors under ids from Python's per-process ``hash()``, which
+            can't be mapped back to documents, so every stored text is embedded again (with
+            ``embedder``, default: the client's) and the collection is saved in the current layout.
+            """
+            with self._lock:
+                if not self.needs_reindex:
+                    return
+                id_ints = np.fromiter(self.docs.keys(), dtype=np.int64, count=len(self.docs))
+                if len(id_ints):
+                    logger.info(f"[FAISS] Re-embedding {len(id_ints)} legacy documents of {self.folder.name}")
+                    vectors = self._encode([self.docs[int(id_int)].get("text", "") for id_int in id_ints], embedder)
+                    faiss.normalize_L2(vectors)
+                    self.dim = vectors.shape[1]
+                    self.index = _IndexManager.build(_IndexManager.target_kind(len(id_ints)), self.dim, vectors)
+                    self.index.add_with_ids(vectors, id_ints)
+                    self.tombstones = set()
+                    self.replaced = set()
+                    self._version += 1
+                    self._needs_compaction = True
+                    self.compact()
+                self.needs_reindex = False
+                logger.info(f"[FAISS] Migrated legacy collection {self.folder.name}")
+
+        def upsert(self, texts: List[str], ids: List[str], metas: List[dict], embedder=None):
+            """Add or update vectors in the index, embedding with ``embedder`` (default: the client's)"""
             if not texts:
                 return
 
-            # Embed texts
-            vectors = self.embedder.encode(texts, batch_size=64, show_progress_bar=False)
-            vectors = np.array(vectors).astype("float32")
-            
-            if self.dim is None:
-                self.dim = vectors.shape[1]
-                self._ensure_index(self.dim)
+            vectors = self._encode(texts, embedder)
+
+            with self._lock:
+                self._add_vectors(vectors, texts, ids, metas)
+
+        def adopt_embedder(self, embedder, model_id: str):
+            """Make ``embedder`` the client's own if it was opened without one; returns the client's model_id"""
+            with self._lock:
+                if self.model_id is None:
+                    self.embedder = embedder
+                    self.model_id = model_id
+                return self.model_id
 
-            # Train index if needed
-            if not self.index.is_trained:
-                logger.info(f"[FAISS] Training index with {len(vectors)} vectors")
-                self.index.train(vectors)
+        def with_embedder(self, embedder, model_id: Optional[str]) -> "_EmbedderBoundClient":
+            """A handle on this client that embeds with ``embedder`` instead of the client's own"""
+            return _EmbedderBoundClient(self, embedder, model_id)
 
+        def _encode(self, texts: List[str], embedder=None) -> np.ndarray:
+            """Embed texts in batches, through the batch API of ai embedders or a sentence-transformers encode"""
+            embedder = embedder or self.embedder
+            if hasattr(embedder, "get_embeddings"):
+                vectors = embedder.get_embeddings(texts)
+            else:
+                vectors = embedder.encode(texts, batch_size=64, show_progress_bar=False)
+            return np.array(vectors).astype("float32")
+
+        def _add_vectors(self, vectors: np.ndarray, texts: List[str], ids: List[str], metas: List[dict]):
+            """Append the batch to the log, apply it in memory and compact periodically"""
             # Normalize vectors (helps with cosine similarity)
             faiss.normalize_L2(vectors)
             
-            # Convert string IDs to integers for FAISS
-            id_ints = np.array([hash(id_str) % (2**63) for id_str in ids], dtype=np.int64)
-            
-            # Add vectors to index
+            # Convert string IDs to stable int64 ids for FAISS
+            id_ints = np.array([stable_doc_id(id_str) for id_str in ids], dtype=np.int64)
+            docs = {
+                id_int: {"id": id_str, "text": txt, "meta": meta}
+                for id_int, id_str, txt, meta in zip(id_ints.tolist(), ids, texts, metas)
+            }
+
+            # Persist only this batch; the snapshot is rewritten on compaction
+            with open(self.log_path, "ab") as f:
+                pickle.dump(
+                    {"generation": self.generation, "ids": id_ints, "vectors": vectors, "docs": docs},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            self._apply(vectors, id_ints, docs)
+            self.pending_records += 1
+            logger.info(f"[FAISS] Upserted {len(texts)} chunks → {self.folder.name}")
+
+            if self._needs_compaction or self.pending_records >= self.COMPACT_EVERY:
+                self.compact()
+            self._maybe_schedule_rebuild()
+
+        def _apply(self, vectors: np.ndarray, id_ints: np.ndarray, docs: Dict[int, Dict[str, Any]]):
+            """Add normalized vectors and their documents to the in-memory index"""
+            if self.index is None:
+                # New collections start exact; no training needed
+                self.dim = vectors.shape[1]
+                self.index = _IndexManager.build("flat", self.dim)
+                logger.info(f"[FAISS] Created new flat index with dim={self.dim}")
+
+            # Re-upserted ids replace their previous vector instead of duplicating it
+            readded = [id_int for id_int in docs if id_int in self.docs or id_int in self.tombstones]
+            self._remove_vectors(readded, readded=True)
+
             self.index.add_with_ids(vectors, id_ints)
+            self.docs.update(docs)
+            self._version += 1
 
-            # Persist metadata
-            existing = {}
-            if self.meta_path.exists():
-                with open(self.meta_path, "rb") as f:
-                    existing = pickle.load(f).get("docs", {})
+            if _IndexManager.should_migrate(self.index):
+                self.index = _IndexManager.migrate(self.index, self.dim)
+                self._needs_compaction = True
 
-            for id_str, txt, meta in zip(ids, texts, metas):
-                existing[id_str] = {"text": txt, "meta": meta}
+        def _remove_vectors(self, id_ints: List[int], readded: bool = False):
+            """Drop vectors from the index, or mark them dead where the index cannot remove
 
-            with open(self.meta_path, "wb") as f:
-                pickle.dump({"dim": self.dim, "count": len(existing), "docs": existing}, f)
+            In a non-removable index, deleted ids are tombstoned; ``readded`` ids get a new vector
+            under the same id, so they are marked replaced instead and search rescores them.
+            """
+            if not id_ints or self.index is None:
+                return
+            if _IndexManager.supports_remove(self.index):
+                self.index.remove_ids(np.asarray(id_ints, dtype=np.int64))
+            elif readded:
+                self._mark_replaced(id_ints)
+            else:
+                self.replaced.difference_update(id_ints)
+                self.tombstones.update(id_ints)
 
-            # Save index to disk
-            faiss.write_index(self.index, str(self.index_path))
-            logger.info(f"[FAISS] Upserted {len(texts)} chunks → {self.folder.name}")
+        def _mark_replaced(self, id_ints):
+            self.tombstones.difference_update(id_ints)
+            self.replaced.update(id_ints)
+
+        def _apply_delete(self, id_ints):
+            """Remove documents and their vectors from the in-memory state"""
+            present = [int(id_int) for id_int in id_ints if int(id_int) in self.docs]
+            self._remove_vectors(present)
+            for id_int in present:
+                del self.docs[id_int]
+            self._version += 1
+
+        def delete_ids(self, id_ints: List[int]) -> int:
+            """Delete documents by FAISS id; returns the number removed"""
+            with self._lock:
+                present = [id_int for id_int in id_ints if id_int in self.docs]
+                if not present:
+                    return 0
+
+                with open(self.log_path, "ab") as f:
+                    pickle.dump(
+                        {"op": "delete", "generation": self.generation, "ids": present},
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+
+                self._apply_delete(present)
+                self.pending_records += 1
+                logger.info(f"[FAISS] Deleted {len(present)} chunks from {self.folder.name}")
+
+                if self.pending_records >= self.COMPACT_EVERY:
+                    self.compact()
+                self._maybe_schedule_rebuild()
+                return len(present)
+
+        def delete_by_source(self, source: str, keep_ids: Optional[List[str]] = None) -> int:
+            """Delete every chunk whose metadata source is ``source``, except ``keep_ids``"""
+            keep = {stable_doc_id(id_str) for id_str in keep_ids or ()}
+            with self._lock:
+                stale = [
+                    id_int for id_int, doc in self.docs.items()
+                    if doc.get("meta", {}).get("source") == source and id_int not in keep
+                ]
+                return self.delete_ids(stale)
+
+        def _maybe_schedule_rebuild(self):
+            """Start a background rebuild once dead (deleted or superseded) vectors pass REBUILD_RATIO"""
+            if self._rebuilding or self.index is None:
+                return
+            dead = self.index.ntotal - len(self.docs)
+            if not dead or dead < self.REBUILD_RATIO * max(self.index.ntotal, 1):
+                return
+            self._rebuilding = True
+            threading.Thread(
+                target=self.rebuild, name=f"faiss-rebuild-{self.folder.name}", daemon=True
+            ).start()
+
+        def rebuild(self):
+            """Rebuild the index from live vectors only, dropping deleted and superseded entries"""
+            try:
+                with self._lock:
+                    if self.index is None:
+                        return
+                    version = self._version
+                    kind = _IndexManager.kind_of(self.index)
+                    ids, vectors = _IndexManager.extract(self.index)
+                    live = np.fromiter(self.docs.keys(), dtype=np.int64, count=len(self.docs))
+
+                # Keep the most recently added vector of every live id
+                _, last_from_end = np.unique(ids[::-1], return_index=True)
+                keep = len(ids) - 1 - last_from_end
+                keep = np.sort(keep[np.isin(ids[keep], live)])
+                new_index = _IndexManager.build(kind, self.dim, vectors[keep])
+                new_index.add_with_ids(vectors[keep], ids[keep])
 
-        def search(self, query: str, limit: int = 5) -> List[Dict]:
-            """Search for similar vectors"""
+                with self._lock:
+                    if self._version != version:
+                        logger.info(f"[FAISS] {self.folder.name} changed during rebuild; will retry later")
+                        return
+                    self.index = new_index
+                    self.tombstones = set()
+                    self.replaced = set()
+                    self._needs_compaction = True
+                    self.compact()
+                    logger.info(f"[FAISS] Rebuilt {self.folder.name} without tombstoned vectors")
+            except Exception as e:
+                logger.error(f"[FAISS] Rebuild failed for {self.folder.name}: {e}")
+            finally:
+                self._rebuilding = False
+
+        def compact(self):
+            """Write a full index + metadata snapshot and truncate the append-only log"""
+            with self._lock:
+                if self.index is None or not (self.pending_records or self._needs_compaction):
+                    return
+
+                generation = self.generation + 1
+                tmp_index = self.index_path.with_name(self.index_path.name + ".tmp")
+                tmp_meta = self.meta_path.with_name(self.meta_path.name + ".tmp")
+                faiss.write_index(self.index, str(tmp_index))
+                with open(tmp_meta, "wb") as f:
+                    pickle.dump(
+                        {
+                            "dim": self.dim,
+                            "count": len(self.docs),
+                            "docs": self.docs,
+                            "generation": generation,
+                            "index_type": _IndexManager.kind_of(self.index),
+                            "tombstones": self.tombstones,
+                            "replaced": self.replaced,
+                        },
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+
+                # Index first: a crash before the meta swap replays the log again,
+                # a crash after it skips the now-stale generation.
+                os.replace(tmp_index, self.index_path)
+                os.replace(tmp_meta, self.meta_path)
+                self.log_path.unlink(missing_ok=True)
+
+                self.generation = generation
+                self.pending_records = 0
+                self._needs_compaction = False
+                logger.info(f"[FAISS] Compacted {self.folder.name} ({len(self.docs)} vectors)")
+
+        @classmethod
+        def read_metadata(cls, folder: Path) -> Dict[str, Any]:
+            """Read dim and documents (snapshot + log) without loading the FAISS index"""
+            meta_path = folder / "meta.pkl"
+            meta = {"dim": None, "docs": {}, "generation": 0}
+            if meta_path.exists():
+                with open(meta_path, "rb") as f:
+                    meta.update(pickle.load(f))
+            for record, _ in cls._read_log(folder / "meta.log"):
+                if record.get("generation", 0) < meta["generation"]:
+                    continue
+                if record.get("op") == "delete":
+                    for id_int in record["ids"]:
+                        meta["docs"].pop(id_int, None)
+                    continue
+                meta["docs"].update(record["docs"])
+                if meta["dim"] is None:
+                    meta["dim"] = record["vectors"].shape[1]
+            meta["count"] = len(meta["docs"])
+            return meta
+
+        def search(
+            self,
+            query: str,
+            limit: int = 5,
+            nprobe: Optional[int] = None,
+            ef_search: Optional[int] = None,
+            embedder=None,
+        ) -> List[Dict]:
+            """Search for similar vectors; nprobe/ef_search tune recall vs latency for IVF/HNSW indexes"""
             if self.index is None or self.dim is None:
                 logger.warning(f"[FAISS] No index available for search in {self.folder.name}")
                 return []
 
             # Embed query
-            q_vec = np.array(self.embedder.encode([query])).astype("float32")
+            q_vec = self._encode([query], embedder)
             faiss.normalize_L2(q_vec)
             
-            # Search
-            D, I = self.index.search(q_vec, limit)
+            # Search and build results from the in-memory id → document mapping
+            results = []
+            with self._lock:
+                if not self.index.ntotal:
+                    return []
+                # Over-fetch so hits on dead vectors filtered below don't shrink the result set
+                k = min(limit + self.index.ntotal - len(self.docs), self.index.ntotal)
+                params = _IndexManager.search_params(self.index, nprobe, ef_search)
+                D, I = self.index.search(q_vec, k, params=params)
 
-            # Load metadata
-            if not self.meta_path.exists():
-                return []
-                
-            with open(self.meta_path, "rb") as f:
-                meta_data = pickle.load(f)
-                docs = meta_data.get("docs", {})
+                hits = []
+                seen = set()
+                for dist, idx in zip(D[0], I[0]):
+                    idx = int(idx)
+                    if idx == -1 or idx in seen:
+                        continue
 
-            # Build results
-            results = []
-            for dist, idx in zip(D[0], I[0]):
-                if idx == -1:
-                    continue
-                
-                # Find the document by reverse-hashing (store mapping in meta)
-                found = False
-                for doc_id, doc_data in docs.items():
-                    if hash(doc_id) % (2**63) == idx:
-                        results.append({
-                            "content": doc_data.get("text", ""),
-                            "metadata": doc_data.get("meta", {}),
-                            "name": doc_data.get("meta", {}).get("source", ""),
-                            "score": float(dist),
-                        })
-                        found = True
-                        break
-                
-                if not found:
-                    logger.warning(f"[FAISS] Could not find document for index {idx}")
+                    if idx not in self.docs:
+                        # Deleted document still present in a non-removable index
+                        continue
+                    seen.add(idx)
+                    if idx in self.replaced:
+                        # The hit may be a superseded vector; score the id's current one
+                        # (IndexIDMap2 reconstructs the vector added last under an id)
+                        current = self.index.reconstruct(idx)
+                        dist = np.sum((q_vec[0] - current) ** 2)
+                    hits.append((float(dist), idx))
+                if self.replaced:
+                    hits.sort(key=lambda hit: hit[0])
+
+                for dist, idx in hits[:limit]:
+                    doc_data = self.docs[idx]
+                    results.append({
+                        "content": doc_data.get("text", ""),
+                        "metadata": doc_data.get("meta", {}),
+                        "name": doc_data.get("meta", {}).get("source", ""),
+                        "score": dist,
+                    })
             
             return results
 
         def delete(self):
             """Delete the entire collection"""
+            VectorService._client_cache.invalidate(self.folder)
             if self.folder.exists():
                 shutil.rmtree(self.folder)
                 logger.info(f"[FAISS] Deleted collection folder {self.folder.name}")
 
         def exists(self) -> bool:
             """Check if collection exists"""
-            return self.folder.exists() and self.index_path.exists()
+            return self.folder.exists() and (self.index_path.exists() or self.log_path.exists())
 
     # ------------------------------------------------------------------
     # Public API (matches original Qdrant-based VectorService)
@@ -274,21 +826,46 @@ class VectorService:
         """Get a FAISS vector database client for the specified user and collection"""
         user_id = user.get("id") or user.get("userId")
         folder = cls._coll_path(user_id, payload['collection'])
+        model_id = payload.get('model_id')
+
+        # Callers without a model_id (e.g. search) use whichever embedder the collection is open with
+        client = cls._client_cache.get(folder)
+        if client is not None and client.model_id is not None and model_id in (None, client.model_id):
+            return await cls._reindexed(client)
 
         embedder = await cls._get_embedder_config(user, payload)
-        return cls._FAISSClient(folder, embedder)
+        if client is None:
+            # The lookup above already counted this miss
+            client = cls._client_cache.open(
+                folder, lambda: cls._FAISSClient(folder, embedder, model_id), count=False
+            )
+        # The shared client keeps its embedder; other models only apply to this request
+        if client.adopt_embedder(embedder, model_id) != model_id:
+            client = client.with_embedder(embedder, model_id)
+        return await cls._reindexed(client)
+
+    @staticmethod
+    async def _reindexed(client):
+        """Rebuild a legacy collection's vectors before its first use with a real embedder"""
+        if client.needs_reindex:
+            await asyncio.to_thread(client.reindex_legacy, client.embedder)
+        return client
+
+    @classmethod
+    def get_client_cache_stats(cls) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy of the open-collection cache"""
+        return cls._client_cache.stats()
+
+    @staticmethod
+    def get_embedding_cache_stats() -> Optional[Dict[str, Any]]:
+        """Hit rate of the shared embedding cache (None when it is disabled)"""
+        return embedding_cache_stats()
     
     @classmethod
     def get_vector_db_client_with_collection(cls, collection: str):
         """Get a FAISS vector database client for the specified collection (no embedder)"""
         folder = cls.ROOT / collection
-        
-        # Dummy embedder for admin operations that don't need embedding
-        class _DummyEmbedder:
-            def encode(self, *args, **kwargs):
-                raise RuntimeError("Dummy embedder – not meant for real operations")
-        
-        return cls._FAISSClient(folder, _DummyEmbedder())
+        return cls._client_cache.open(folder, lambda: cls._FAISSClient(folder, _DummyEmbedder()))
     
     @classmethod
     async def delete_collection(cls, user: dict, collection: str) -> bool:
@@ -296,10 +873,14 @@ class VectorService:
         try:
             user_id = user.get("id") or user.get("userId")
             folder = cls._coll_path(user_id, collection)
+            cls._client_cache.invalidate(folder)
             
             if folder.exists():
                 shutil.rmtree(folder)
                 logger.info(f"[FAISS] Deleted collection: {folder.name}")
+
+            from .knowledge_manifest import KnowledgeManifest
+            await KnowledgeManifest.delete(user, collection)
             return True
             
         except Exception as e:
@@ -313,119 +894,180 @@ class VectorService:
         try:
             user_id = user.get("id") or user.get("userId")
             folder = cls._coll_path(user_id, collection)
-            return folder.exists() and (folder / "index.faiss").exists()
+            return folder.exists() and ((folder / "index.faiss").exists() or (folder / "meta.log").exists())
         except Exception as e:
             logger.error(f"[FAISS] Failed to check collection existence for {collection}: {e}")
             return False
 
+    @staticmethod
+    def _build_knowledge_base(file_path: Path):
+        """Create the knowledge base that reads a single file"""
+        from ai.knowledge.pdf import PDFKnowledgeBase
+        from ai.knowledge.text import TextKnowledgeBase
+        from ai.knowledge.docx import DocxKnowledgeBase
+        from ai.knowledge.combined import CombinedKnowledgeBase
+
+        filename = file_path.name
+        file_ext = file_path.suffix.lower()
+        path = str(file_path)
+
+        if file_ext in ['.pdf']:
+            try:
+                return PDFKnowledgeBase(path=path, vector_db=None)
+            except Exception as e:
+                logger.warning(f"[FAISS] PDF processing failed for {filename}, falling back to text processing: {e}")
+                return TextKnowledgeBase(path=path, vector_db=None)
+        if file_ext in ['.docx', '.doc']:
+            return DocxKnowledgeBase(path=path, vector_db=None)
+        if file_ext in ['.txt', '.py', '.js', '.json', '.csv']:
+            return TextKnowledgeBase(path=path, vector_db=None)
+
+        # Use combined knowledge base for unknown types
+        text_kb = TextKnowledgeBase(path=path, vector_db=None)
+        docx_kb = DocxKnowledgeBase(path=path, vector_db=None)
+        sources = [text_kb, docx_kb]
+        
+        try:
+            pdf_kb = PDFKnowledgeBase(path=path, vector_db=None)
+            sources.insert(0, pdf_kb)  # Add PDF processing if available
+        except Exception as e:
+            logger.warning(f"[FAISS] PDF processing not available for {filename}, using text/docx only: {e}")
+        
+        return CombinedKnowledgeBase(sources=sources, vector_db=None)
+
+    @staticmethod
+    async def _read_collection_files(folder_path: str) -> Dict[str, bytes]:
+        """filename -> content of every file stored under folder_path"""
+        from ..services.file_service import FileService
+
+        contents = {}
+        file_keys = await FileService.list_files_at_path(folder_path)
+        for file_key in file_keys:
+            if file_key.endswith('/'):
+                continue
+            filename = Path(file_key).name
+            if filename:
+                contents[filename] = await FileService.get_file_content_from_path(file_key)
+        return contents
+
+    @staticmethod
+    def chunk_id(filename: str, text: str) -> str:
+        """Document id of a chunk: the file plus a hash of its text, so unchanged chunks keep their id"""
+        return f"{filename}_{hashlib.md5(text.encode('utf-8')).hexdigest()}"
+
+    @classmethod
+    async def open_ingestion(cls, user: dict, collection: str, payload: dict):
+        """Open a collection's FAISS client and manifest for a run of index_file calls"""
+        from .knowledge_manifest import KnowledgeManifest
+
+        client = await cls.get_vector_db_client(user, payload)
+        manifest = await KnowledgeManifest.load(user, collection, payload.get("model_id"))
+        return client, manifest
+
     @classmethod
-    async def index_knowledge_files(cls, user: dict, collection: str, payload: dict) -> bool:
-        """Index files from MinIO bucket to the FAISS vector database"""
+    def index_file(cls, client: "VectorService._FAISSClient", manifest, filename: str, content: bytes) -> Dict[str, Any]:
+        """Index one file into an open collection, unless the manifest already has this content.
+
+        Only chunks the collection doesn't hold are embedded; chunks the file no longer
+        produces are dropped. This blocks on extraction and embedding, so run it off the
+        event loop. Errors are raised and leave the file out of the manifest.
+
+        Returns {"chunks": total chunks, "embedded": chunks embedded, "skipped": bool}.
+        """
+        import tempfile
+
+        content_hash = manifest.content_hash(content)
+        if manifest.is_current(filename, content_hash):
+            return {"chunks": 0, "embedded": 0, "skipped": True}
+
+        if Path(filename).suffix.lower() in cls.IMAGE_EXTENSIONS:
+            logger.info(f"[FAISS] Skipping vector indexing for image file: {filename}")
+            manifest.record(filename, content_hash, len(content), [])
+            return {"chunks": 0, "embedded": 0, "skipped": True}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / Path(filename).name
+            file_path.write_bytes(content)
+
+            knowledge_base = cls._build_knowledge_base(file_path)
+            logger.info(f"[FAISS] Loading file {filename} using knowledge base")
+            # Extract chunks; the knowledge base has no vector db of its own to load into
+            chunks = [document for document_list in knowledge_base.document_lists for document in document_list]
+
+        # Prepare data for FAISS
+        texts = [chunk.content for chunk in chunks]
+        ids = [cls.chunk_id(filename, text) for text in texts]
+        metas = [dict(chunk.meta_data) for chunk in chunks]
+        
+        # Add source filename to metadata
+        for meta in metas:
+            meta["source"] = filename
+
+        # Chunks an earlier version of the file already produced keep their vectors
+        new = [
+            (text, id_str, meta) for text, id_str, meta in zip(texts, ids, metas)
+            if stable_doc_id(id_str) not in client.docs
+        ]
+        if new:
+            new_texts, new_ids, new_metas = (list(column) for column in zip(*new))
+            client.upsert(new_texts, new_ids, new_metas)
+
+        # Drop chunks left over from a previous version of the file
+        client.delete_by_source(filename, keep_ids=ids)
+        manifest.record(filename, content_hash, len(content), ids)
+        logger.info(f"[FAISS] Successfully indexed {filename}: {len(new)} of {len(texts)} chunks embedded")
+        return {"chunks": len(texts), "embedded": len(new), "skipped": False}
+
+    @classmethod
+    async def index_knowledge_files(
+        cls, user: dict, collection: str, payload: dict, files: Optional[Dict[str, bytes]] = None
+    ) -> bool:
+        """Index the new or changed files of a collection into the FAISS vector database.
+
+        ``files`` maps filename -> content of just-uploaded files. Without it every
+        file stored under the collection is diffed against the manifest, and files
+        that are no longer stored are removed from the index.
+        """
         try:
-            import tempfile
-            from pathlib import Path as PPath
-            from ..services.file_service import FileService
+            import asyncio
             
             user_id = user.get("id") or user.get("userId")
-            client: VectorService._FAISSClient = await cls.get_vector_db_client(user, payload)
+            client, manifest = await cls.open_ingestion(user, collection, payload)
             
-            logger.info(f"[FAISS] Indexing files from MinIO to collection {user_id}_{collection}")
+            if files is None:
+                files = await cls._read_collection_files(f"uploads/{user_id}/{collection}")
+                for filename in [name for name in manifest.files if name not in files]:
+                    manifest.forget(filename)
+                    client.delete_by_source(filename)
+                    logger.info(f"[FAISS] Removed deleted file {filename} from {user_id}_{collection}")
             
-            # Use FileService to download files
-            folder_path = f"uploads/{user_id}/{collection}"
+            logger.info(f"[FAISS] Indexing {len(files)} files to collection {user_id}_{collection}")
+            indexed = 0
+            for filename, content in files.items():
+                try:
+                    result = await asyncio.to_thread(cls.index_file, client, manifest, filename, content)
+                    indexed += not result["skipped"]
+                except Exception as e:
+                    logger.error(f"[FAISS] Failed to load knowledge base for {filename}: {e}")
+            logger.info(f"[FAISS] {indexed} of {len(files)} files were new or changed in {user_id}_{collection}")
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = PPath(temp_dir)
-                
-                # Download all files using FileService
-                file_keys = await FileService.list_files_at_path(folder_path)
-                file_keys = [key for key in file_keys if not key.endswith('/')]
-                for file_key in file_keys:
-                    filename = PPath(file_key).name
-                    if filename:
-                        file_content = await FileService.get_file_content_from_path(file_key)
-                        (temp_path / filename).write_bytes(file_content)
-                
-                # Process each downloaded file with knowledge base modules
-                for temp_file_path in temp_path.iterdir():
-                    if not temp_file_path.is_file():
-                        continue
-                    
-                    filename = temp_file_path.name
-                    file_ext = temp_file_path.suffix.lower()
-                    
-                    # Import knowledge base classes
-                    from ai.knowledge.pdf import PDFKnowledgeBase
-                    from ai.knowledge.text import TextKnowledgeBase
-                    from ai.knowledge.docx import DocxKnowledgeBase
-                    from ai.knowledge.combined import CombinedKnowledgeBase
-                    
-                    # Skip vector indexing for image files
-                    image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp', '.tiff', '.tif'}
-                    if file_ext in image_extensions:
-                        logger.info(f"[FAISS] Skipping vector indexing for image file: {filename}")
-                        continue
-                    
-                    # Create appropriate knowledge base based on file type
-                    knowledge_base = None
-                    
-                    if file_ext in ['.pdf']:
-                        try:
-                            knowledge_base = PDFKnowledgeBase(path=str(temp_path), vector_db=None)
-                        except Exception as e:
-                            logger.warning(f"[FAISS] PDF processing failed for {filename}, falling back to text processing: {e}")
-                            knowledge_base = TextKnowledgeBase(path=str(temp_path), vector_db=None)
-                    elif file_ext in ['.docx', '.doc']:
-                        knowledge_base = DocxKnowledgeBase(path=str(temp_path), vector_db=None)
-                    elif file_ext in ['.txt', '.py', '.js', '.json', '.csv']:
-                        knowledge_base = TextKnowledgeBase(path=str(temp_path), vector_db=None)
-                    else:
-                        # Use combined knowledge base for unknown types
-                        text_kb = TextKnowledgeBase(path=str(temp_path), vector_db=None)
-                        docx_kb = DocxKnowledgeBase(path=str(temp_path), vector_db=None)
-                        sources = [text_kb, docx_kb]
-                        
-                        try:
-                            pdf_kb = PDFKnowledgeBase(path=str(temp_path), vector_db=None)
-                            sources.insert(0, pdf_kb)  # Add PDF processing if available
-                        except Exception as e:
-                            logger.warning(f"[FAISS] PDF processing not available for {filename}, using text/docx only: {e}")
-                        
-                        knowledge_base = CombinedKnowledgeBase(sources=sources, vector_db=None)
-                    
-                    if knowledge_base:
-                        try:
-                            logger.info(f"[FAISS] Loading file {filename} using knowledge base")
-                            # Load and extract chunks
-                            chunks = knowledge_base.load(recreate=False, upsert=False)
-                            
-                            # Prepare data for FAISS
-                            texts = [c.get("page_content", "") for c in chunks]
-                            # Use deterministic IDs: <filename>_<chunk_index>
-                            ids = [f"{filename}_{i}" for i in range(len(texts))]
-                            metas = [c.get("metadata", {}) for c in chunks]
-                            
-                            # Add source filename to metadata
-                            for meta in metas:
-                                meta["source"] = filename
-                            
-                            # Upsert to FAISS
-                            client.upsert(texts, ids, metas)
-                            logger.info(f"[FAISS] Successfully indexed {len(texts)} chunks from {filename}")
-                            
-                        except Exception as e:
-                            logger.error(f"[FAISS] Failed to load knowledge base for {filename}: {e}")
-                    else:
-                        logger.error(f"[FAISS] No suitable knowledge base found for {filename}")
-                
-                return True
+            await manifest.save()
+            return True
                 
         except Exception as e:
             logger.error(f"[FAISS] Failed to index files: {e}")
             return False
 
     @classmethod
-    async def search(cls, user: dict, collection: str, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    async def search(
+        cls,
+        user: dict,
+        collection: str,
+        query: str,
+        limit: int = 5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """Search for documents in the FAISS vector database"""
         try:
             user_id = user.get("id") or user.get("userId")
@@ -434,7 +1076,7 @@ class VectorService:
             client: VectorService._FAISSClient = await cls.get_vector_db_client(user, payload)
             
             # Perform search
-            results = client.search(query, limit)
+            results = client.search(query, limit, nprobe=nprobe, ef_search=ef_search)
             
             logger.info(f"[FAISS] Found {len(results)} results for query in collection {user_id}_{collection}")
             return results
@@ -449,20 +1091,30 @@ class VectorService:
     @classmethod
     async def delete_document(cls, user: dict, collection: str, file_path: str) -> bool:
         """
-        Delete a specific document from the FAISS vector database.
-        Note: FAISS does not support per-document deletion without rebuilding the index.
-        This is a placeholder for future implementation.
+        Delete every chunk of a specific document from the FAISS vector database.
+        Vectors are removed from the index directly where supported, otherwise
+        tombstoned and dropped by a background rebuild.
+        It rewrites the collection's manifest, so it runs as a deletion job holding
+        the collection lease rather than alongside an ingestion.
         """
         try:
             user_id = user.get("id") or user.get("userId")
-            logger.warning(f"[FAISS] Per-document delete not fully implemented for {file_path} in collection {user_id}_{collection}")
-            logger.warning("[FAISS] Document deletion would require rebuilding the entire index")
-            
-            # TODO: Implement by:
-            # 1. Loading all metadata
-            # 2. Filtering out documents matching file_path
-            # 3. Rebuilding the index with remaining documents
-            
+            folder = cls._coll_path(user_id, collection)
+            if not folder.exists():
+                return True
+
+            # Deleting needs no embedder; an already open client keeps its own
+            client = cls._client_cache.open(folder, lambda: cls._FAISSClient(folder, _DummyEmbedder()))
+            filename = Path(file_path).name
+            removed = client.delete_by_source(filename)
+
+            from .knowledge_manifest import KnowledgeManifest
+            manifest = await KnowledgeManifest.load(user, collection, any_embedder=True)
+            if filename in manifest.files:
+                manifest.forget(filename)
+                await manifest.save()
+
+            logger.info(f"[FAISS] Deleted {removed} chunks of {file_path} from collection {user_id}_{collection}")
             return True
             
         except Exception as e:
@@ -482,23 +1134,21 @@ class VectorService:
                     "exists": False
                 }
             
-            meta_path = folder / "meta.pkl"
-            if not meta_path.exists():
+            if not (folder / "meta.pkl").exists() and not (folder / "meta.log").exists():
                 return {
                     "collection_name": f"{user_id}_{collection}",
                     "exists": True,
                     "vector_count": 0
                 }
             
-            with open(meta_path, "rb") as f:
-                meta = pickle.load(f)
+            meta = cls._FAISSClient.read_metadata(folder)
             
             stats = {
                 "collection_name": f"{user_id}_{collection}",
                 "exists": True,
                 "vector_count": meta.get("count", 0),
                 "dimension": meta.get("dim"),
-                "index_type": "FAISS IVF-PQ"
+                "index_type": f"FAISS {meta.get('index_type', 'ivfpq')}"
             }
             
             return stats
@@ -468,6 +468,9 @@ class WorkflowConfigService:
                     detail="Workflow configuration not found"
                 )
             
+            from .workflow_service_persistent import WorkflowServicePersistent
+            WorkflowServicePersistent.invalidate_workflow_spec(config_id, tenant_id)
+            
             response = {
                 "id": config_id,
                 "message": "Workflow configuration updated successfully"
@@ -525,6 +528,9 @@ class WorkflowConfigService:
                     detail="Workflow configuration not found"
                 )
             
+            from .workflow_service_persistent import WorkflowServicePersistent
+            WorkflowServicePersistent.invalidate_workflow_spec(config_id, tenant_id)
+            
             response = {
                 "id": config_id,
                 "message": "Workflow configuration deleted successfully"
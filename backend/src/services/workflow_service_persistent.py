@@ -9,10 +9,15 @@ import sys
 import json
 import os
 import uuid
+import hashlib
 import importlib
 import inspect
 import asyncio
-from typing import Any, Dict, Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timezone
 from fastapi import HTTPException, status
 
@@ -26,6 +31,7 @@ from spiffworkflow.bpmn.parser.BpmnParser import BpmnParser
 from spiffworkflow.bpmn.serializer import BpmnWorkflowSerializer
 from spiffworkflow.bpmn.script_engine import PythonScriptEngine
 from spiffworkflow.util.task import TaskState
+from spiffworkflow.util.task_data import TaskData
 from bson import ObjectId
 
 from ..utils.log import logger
@@ -36,11 +42,25 @@ from .workflow_notification_service import TaskNotificationService
 
 
 def _clean_data_for_serialization(data):
-    """Recursively clean data to make it JSON serializable - convert ObjectId to string"""
+    """Recursively clean data to make it JSON serializable - convert ObjectId to string
+
+    Dicts and lists that need no conversion are returned as they are, so task data
+    keeps sharing its values with the tasks it was inherited from.
+    """
     if isinstance(data, dict):
-        return {k: _clean_data_for_serialization(v) for k, v in data.items()}
+        cleaned = {k: _clean_data_for_serialization(v) for k, v in dict.items(data)}
+        if all(cleaned[k] is v for k, v in dict.items(data)):
+            return data
+        if isinstance(data, TaskData):
+            # A rebuilt container holds the same values as before, so it is shared with other tasks
+            # exactly when its key was; marking the task's own values shared would copy them needlessly
+            shared = [k for k in dict.keys(data) if data.is_shared(k)]
+            cleaned = TaskData(cleaned)
+            cleaned.share(shared)
+        return cleaned
     elif isinstance(data, list):
-        return [_clean_data_for_serialization(item) for item in data]
+        cleaned = [_clean_data_for_serialization(item) for item in data]
+        return data if all(new is old for new, old in zip(cleaned, data)) else cleaned
     elif isinstance(data, ObjectId):
         return str(data)
     elif isinstance(data, datetime):
@@ -49,6 +69,318 @@ def _clean_data_for_serialization(data):
         return data
 
 
+def _digest(payload: Any) -> bytes:
+    """Order-independent fingerprint of a JSON-compatible value"""
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True).encode("utf-8"), digest_size=16).digest()
+
+
+class _WorkflowDeltaTracker:
+    """Remembers what was last written for a workflow instance so saves only send what changed.
+
+    For every persisted (sub)workflow it keeps, per task, the state, the
+    ``last_state_change`` timestamp and a digest of the serialized task.
+    Finished tasks whose state hasn't moved are skipped without being
+    serialized; all other tasks are serialized and compared by digest.
+    Changes are written as ``$set``/``$unset`` on ``serialized_data`` paths,
+    and every ``SNAPSHOT_EVERY`` saves the whole workflow is rewritten.
+    """
+
+    ENABLED = os.getenv("WORKFLOW_DELTA_PERSISTENCE", "true").lower() == "true"
+    SNAPSHOT_EVERY = int(os.getenv("WORKFLOW_SNAPSHOT_EVERY", 50))
+    MAX_TRACKED = int(os.getenv("WORKFLOW_DELTA_TRACKED", 256))
+
+    _trackers: "OrderedDict[str, _WorkflowDeltaTracker]" = OrderedDict()
+
+    def __init__(self, workflow):
+        self.workflow_ref = weakref.ref(workflow)
+        # Serializes saves of one instance so deltas reach MongoDB in order
+        self.lock = asyncio.Lock()
+        # "serialized_data[.subprocesses.<id>]" -> {task_id: (state, last_state_change, digest)}
+        self.tasks: Dict[str, Dict[str, Tuple[int, float, bytes]]] = {}
+        self.saves_since_snapshot = 0
+        self.synced = False
+
+    @classmethod
+    def get(cls, instance_id: str, workflow) -> "_WorkflowDeltaTracker":
+        """Tracker for ``instance_id``; a fresh one if the instance was reloaded into a new workflow object"""
+        tracker = cls._trackers.get(instance_id)
+        if tracker is None or tracker.workflow_ref() is not workflow:
+            tracker = cls(workflow)
+            cls._trackers[instance_id] = tracker
+        cls._trackers.move_to_end(instance_id)
+        while len(cls._trackers) > cls.MAX_TRACKED:
+            cls._trackers.popitem(last=False)
+        return tracker
+
+    @classmethod
+    def discard(cls, instance_id: str) -> None:
+        cls._trackers.pop(instance_id, None)
+
+    def needs_snapshot(self) -> bool:
+        return not self.synced or self.saves_since_snapshot >= self.SNAPSHOT_EVERY
+
+    def record_snapshot(self, serialized_data: Dict[str, Any]) -> None:
+        """Reset the baseline to a full serialization that was just written"""
+        self.tasks = {"serialized_data": self._signatures(serialized_data["tasks"])}
+        for sp_id, sp_data in serialized_data.get("subprocesses", {}).items():
+            self.tasks[f"serialized_data.subprocesses.{sp_id}"] = self._signatures(sp_data["tasks"])
+        self.saves_since_snapshot = 0
+        self.synced = True
+
+    @staticmethod
+    def _signatures(tasks: Dict[str, Any]) -> Dict[str, Tuple[int, float, bytes]]:
+        return {
+            task_id: (task["state"], task["last_state_change"], _digest(task))
+            for task_id, task in tasks.items()
+        }
+
+    @staticmethod
+    def _workflow_fields(serializer, workflow) -> Dict[str, Any]:
+        """Workflow-level attributes, as written by the serializer's WorkflowConverter"""
+        registry = serializer.registry
+        return {
+            "data": registry.convert(registry.clean(workflow.data)),
+            "correlations": workflow.correlations,
+            "last_task": str(workflow.last_task.id) if workflow.last_task is not None else None,
+            "success": workflow.success,
+            "completed": workflow.completed,
+            "root": str(workflow.task_tree.id),
+        }
+
+    def _diff_tasks(self, serializer, workflow, prefix, set_ops, unset_ops, baseline):
+        known = self.tasks.get(prefix, {})
+        current = {}
+        for task_id, task in workflow.tasks.items():
+            key = str(task_id)
+            previous = known.get(key)
+            if (
+                previous is not None
+                and task.state & TaskState.FINISHED_MASK
+                and previous[0] == task.state
+                and previous[1] == task.last_state_change
+            ):
+                current[key] = previous
+                continue
+            task.data = _clean_data_for_serialization(task.data)
+            task_dict = json.loads(json.dumps(serializer.to_dict(task), cls=serializer.json_encoder_cls))
+            digest = _digest(task_dict)
+            current[key] = (task.state, task.last_state_change, digest)
+            if previous is None or previous[2] != digest:
+                set_ops[f"{prefix}.tasks.{key}"] = task_dict
+        for key in known.keys() - current.keys():
+            unset_ops[f"{prefix}.tasks.{key}"] = ""
+        baseline[prefix] = current
+
+    def build_delta(self, serializer, workflow) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Return ($set, $unset, new baseline) covering everything changed since the last save"""
+        set_ops: Dict[str, Any] = {}
+        unset_ops: Dict[str, Any] = {}
+        baseline: Dict[str, Any] = {}
+
+        root = "serialized_data"
+        fields = self._workflow_fields(serializer, workflow)
+        fields["bpmn_events"] = serializer.registry.convert(workflow.bpmn_events)
+        for name, value in json.loads(json.dumps(fields, cls=serializer.json_encoder_cls)).items():
+            set_ops[f"{root}.{name}"] = value
+        self._diff_tasks(serializer, workflow, root, set_ops, unset_ops, baseline)
+
+        current_subprocesses = set()
+        for sp_id, subprocess in workflow.subprocesses.items():
+            prefix = f"{root}.subprocesses.{sp_id}"
+            current_subprocesses.add(prefix)
+            if prefix not in self.tasks:
+                # New subprocess: write it whole, but still record its task baseline
+                self._diff_tasks(serializer, subprocess, prefix, {}, {}, baseline)
+                set_ops[prefix] = json.loads(json.dumps(serializer.to_dict(subprocess), cls=serializer.json_encoder_cls))
+                continue
+            sp_fields = self._workflow_fields(serializer, subprocess)
+            for name, value in json.loads(json.dumps(sp_fields, cls=serializer.json_encoder_cls)).items():
+                set_ops[f"{prefix}.{name}"] = value
+            self._diff_tasks(serializer, subprocess, prefix, set_ops, unset_ops, baseline)
+
+        for prefix in self.tasks.keys() - current_subprocesses - {root}:
+            unset_ops[prefix] = ""
+
+        return set_ops, unset_ops, baseline
+
+    def commit_delta(self, baseline: Dict[str, Any]) -> None:
+        self.tasks = baseline
+        self.saves_since_snapshot += 1
+
+
+class _WorkflowSpecStore:
+    """Content-addressed storage of serialized workflow specs.
+
+    Instances of one BPMN definition share a single ``workflowSpecs`` document,
+    keyed by the SHA-256 of its serialization, and reference it by ``spec_hash``.
+    Restored spec objects are cached per process; specs aren't modified by
+    running workflows, so every instance restored from a hash shares them.
+    """
+
+    COLLECTION = "workflowSpecs"
+    ENABLED = os.getenv("WORKFLOW_SEPARATE_SPECS", "true").lower() == "true"
+    MAX_CACHED = int(os.getenv("WORKFLOW_SPEC_CACHE_SIZE", 64))
+
+    # spec object -> (tenant_id, spec_hash) of a stored copy
+    _hashes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    # (tenant_id, spec_hash) -> (stored spec document, restored spec, restored subprocess specs)
+    _cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], Any, Dict[str, Any]]]" = OrderedDict()
+
+    @classmethod
+    def _remember(cls, key: Tuple[str, str], entry) -> None:
+        cls._cache[key] = entry
+        cls._cache.move_to_end(key)
+        while len(cls._cache) > cls.MAX_CACHED:
+            cls._cache.popitem(last=False)
+
+    @classmethod
+    async def save(cls, serializer, workflow, tenant_id) -> str:
+        """Store the workflow's specs if this process hasn't already; returns their hash"""
+        known = cls._hashes.get(workflow.spec)
+        if known is not None and known[0] == tenant_id:
+            return known[1]
+
+        spec_json = serializer.serialize_spec_json(workflow)
+        spec_hash = hashlib.sha256(spec_json.encode("utf-8")).hexdigest()
+        spec_data = json.loads(spec_json)
+        await MongoStorageService.update_one(
+            cls.COLLECTION,
+            {"spec_hash": spec_hash},
+            {"$setOnInsert": {"spec_hash": spec_hash, "spec_data": spec_data, "created_at": datetime.now(timezone.utc)}},
+            tenant_id,
+            upsert=True,
+        )
+        cls._hashes[workflow.spec] = (tenant_id, spec_hash)
+        cls._remember((tenant_id, spec_hash), (spec_data, workflow.spec, workflow.subprocess_specs))
+        logger.info(f"[WORKFLOW] Stored workflow spec {spec_hash[:12]}")
+        return spec_hash
+
+    @classmethod
+    async def _get(cls, spec_hash: str, tenant_id):
+        key = (tenant_id, spec_hash)
+        entry = cls._cache.get(key)
+        if entry is not None:
+            cls._cache.move_to_end(key)
+            return entry
+
+        doc = await MongoStorageService.find_one(cls.COLLECTION, {"spec_hash": spec_hash}, tenant_id=tenant_id)
+        if not doc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Workflow spec {spec_hash} not found",
+            )
+        spec, subprocess_specs = BpmnWorkflowSerializer.shared().deserialize_spec_json(json.dumps(doc["spec_data"]))
+        entry = (doc["spec_data"], spec, subprocess_specs)
+        cls._hashes[spec] = key
+        cls._remember(key, entry)
+        return entry
+
+    @classmethod
+    async def load(cls, spec_hash: str, tenant_id) -> Tuple[Any, Dict[str, Any]]:
+        """Restored (spec, subprocess_specs) for ``spec_hash``"""
+        _, spec, subprocess_specs = await cls._get(spec_hash, tenant_id)
+        return spec, subprocess_specs
+
+    @classmethod
+    async def load_serialized(cls, spec_hash: str, tenant_id) -> Dict[str, Any]:
+        """Stored serialization (``spec`` / ``subprocess_specs``) for ``spec_hash``"""
+        spec_data, _, _ = await cls._get(spec_hash, tenant_id)
+        return spec_data
+
+
+class _ParsedSpecCache:
+    """Process-wide cache of parsed BPMN definitions.
+
+    Entries map ``(tenant_id, workflow_id)`` to the SHA-256 of the BPMN XML and
+    the ``(spec, subprocess_specs)`` parsed from it. A hit within ``TTL`` seconds
+    skips both the file fetch and the parse; an older entry re-fetches the XML
+    and only re-parses when its hash changed. Updating or deleting a workflow
+    config drops its entry.
+    """
+
+    ENABLED = os.getenv("WORKFLOW_PARSE_CACHE", "true").lower() == "true"
+    MAX_SIZE = int(os.getenv("WORKFLOW_PARSE_CACHE_SIZE", 128))
+    TTL = float(os.getenv("WORKFLOW_PARSE_CACHE_TTL", 300))
+
+    # (tenant_id, workflow_id) -> (xml_hash, spec, subprocess_specs, checked_at)
+    _entries: "OrderedDict[Tuple[str, str], Tuple[str, Any, Dict[str, Any], float]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, tenant_id, workflow_id: str, xml_hash: Optional[str] = None):
+        """Cached (spec, subprocess_specs), or None.
+
+        Without ``xml_hash`` only entries checked within ``TTL`` are returned;
+        with it, any entry parsed from the same content is.
+        """
+        key = (tenant_id, workflow_id)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            cached_hash, spec, subprocess_specs, checked_at = entry
+            if xml_hash is None:
+                if time.monotonic() - checked_at > cls.TTL:
+                    return None
+            elif xml_hash != cached_hash:
+                return None
+            else:
+                cls._entries[key] = (cached_hash, spec, subprocess_specs, time.monotonic())
+            cls._entries.move_to_end(key)
+            return spec, subprocess_specs
+
+    @classmethod
+    def put(cls, tenant_id, workflow_id: str, xml_hash: str, spec, subprocess_specs) -> None:
+        key = (tenant_id, workflow_id)
+        with cls._lock:
+            cls._entries[key] = (xml_hash, spec, subprocess_specs, time.monotonic())
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.MAX_SIZE:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, workflow_id: Optional[str] = None, tenant_id=None) -> int:
+        """Drop entries for a workflow, a tenant, or everything; returns how many were dropped"""
+        with cls._lock:
+            keys = [
+                key for key in cls._entries
+                if (workflow_id is None or key[1] == workflow_id) and (tenant_id is None or key[0] == tenant_id)
+            ]
+            for key in keys:
+                del cls._entries[key]
+        return len(keys)
+
+
+def _parse_bpmn(bpmn_xml: str) -> Tuple[Any, Dict[str, Any]]:
+    """Parse BPMN XML with the enhanced task parsers; returns (spec, subprocess_specs) of the first process"""
+    from spiffworkflow.bpmn.parser.util import full_tag
+    from spiffworkflow.bpmn.specs.defaults import (
+        UserTask, ManualTask, ServiceTask, ScriptTask, NoneTask
+    )
+
+    parser = BpmnParser()
+
+    # Register our enhanced task parser for all task types
+    parser.OVERRIDE_PARSER_CLASSES.update({
+        full_tag('userTask'): (EnhancedBpmnTaskParser, UserTask),
+        full_tag('manualTask'): (EnhancedBpmnTaskParser, ManualTask),
+        full_tag('serviceTask'): (EnhancedBpmnTaskParser, ServiceTask),
+        full_tag('scriptTask'): (EnhancedBpmnTaskParser, ScriptTask),
+        full_tag('task'): (EnhancedBpmnTaskParser, NoneTask),
+    })
+
+    clean_bpmn = bpmn_xml.replace('<?xml version="1.0" encoding="UTF-8"?>', "").strip()
+    parser.add_bpmn_str(clean_bpmn)
+
+    process_ids = parser.get_process_ids()
+    if not process_ids:
+        raise HTTPException(status_code=400, detail="No processes found in BPMN")
+
+    spec = parser.get_spec(process_ids[0])
+    subprocess_specs = parser.get_subprocess_specs(process_ids[0], specs={})
+    return spec, subprocess_specs
+
+
 class WorkflowServicePersistent:
     """Service for handling BPMN workflow execution and management with state persistence"""
     @classmethod
@@ -392,9 +724,8 @@ class WorkflowServicePersistent:
         
         try:
             # Get workflow from MongoDB
-            instance = await cls.get_workflow_instance(workflow_id, instance_id, tenant_id)
-            serializer = BpmnWorkflowSerializer()
-            workflow = serializer.deserialize_json(json.dumps(instance["serialized_data"]))
+            instance = await cls.get_workflow_instance(workflow_id, instance_id, tenant_id, include_spec=False)
+            workflow = await cls._deserialize_workflow(instance, tenant_id)
             
             # Find current task and complete it
             ready_tasks = [t for t in workflow.get_tasks() if t.state == TaskState.READY or t.state == TaskState.STARTED or t.state == TaskState.ERROR]
@@ -450,13 +781,13 @@ class WorkflowServicePersistent:
             # Clean workflow data before serialization
             workflow.data = _clean_data_for_serialization(workflow.data)
 
-            serializer = BpmnWorkflowSerializer()
-            serialized_json = serializer.serialize_json(workflow)
+            serialized_data, spec_hash = await WorkflowServicePersistent._serialize_workflow(workflow, tenant_id)
 
             data = {
                 "workflow_id": workflow_id,
                 "instance_id": instance_id,
-                "serialized_data": json.loads(serialized_json),
+                "serialized_data": serialized_data,
+                "spec_hash": spec_hash,
                 "user_task": [],
             }
 
@@ -468,6 +799,7 @@ class WorkflowServicePersistent:
                 "$set": {
                     "workflow_id": workflow_id,
                     "serialized_data": data["serialized_data"],
+                    "spec_hash": data["spec_hash"],
                     "user_task": data["user_task"],
                 },
                 "$setOnInsert": {
@@ -482,6 +814,8 @@ class WorkflowServicePersistent:
                 tenant_id, 
                 upsert=True
             )
+            if _WorkflowDeltaTracker.ENABLED:
+                _WorkflowDeltaTracker.get(instance_id, workflow).record_snapshot(data["serialized_data"])
             logger.info(f"[WORKFLOW] Workflow state upserted to MongoDB - instance: {instance_id}")
             return instance_id
 
@@ -504,7 +838,51 @@ class WorkflowServicePersistent:
 
     @staticmethod
     async def update_workflow_instance(workflow, instance_id, tenant_id=None):
-        """Update existing workflow instance in MongoDB"""
+        """Update existing workflow instance in MongoDB, writing only what changed when possible"""
+        if not _WorkflowDeltaTracker.ENABLED:
+            return await WorkflowServicePersistent._write_workflow_snapshot(workflow, instance_id, tenant_id)
+
+        tracker = _WorkflowDeltaTracker.get(instance_id, workflow)
+        async with tracker.lock:
+            if tracker.needs_snapshot():
+                serialized_data = await WorkflowServicePersistent._write_workflow_snapshot(workflow, instance_id, tenant_id)
+                tracker.record_snapshot(serialized_data)
+                return
+
+            try:
+                # Clean workflow data before serialization (task data is cleaned per changed task)
+                workflow.data = _clean_data_for_serialization(workflow.data)
+
+                serializer = BpmnWorkflowSerializer.shared()
+                set_ops, unset_ops, baseline = tracker.build_delta(serializer, workflow)
+                set_ops.update({
+                    "user_task": [],
+                    "updated_at": datetime.now(timezone.utc),
+                })
+                update_data = {"$set": set_ops}
+                if unset_ops:
+                    update_data["$unset"] = unset_ops
+
+                await MongoStorageService.update_one(
+                    "workflowInstances", {"instance_id": instance_id}, update_data, tenant_id
+                )
+                tracker.commit_delta(baseline)
+                logger.info(
+                    f"[WORKFLOW] Workflow instance delta saved - instance: {instance_id}, "
+                    f"paths set: {len(set_ops)}, unset: {len(unset_ops)}"
+                )
+            except Exception as e:
+                # The stored document may now be behind; the next save rewrites it whole
+                _WorkflowDeltaTracker.discard(instance_id)
+                logger.error(f"[WORKFLOW] Failed to update workflow instance '{instance_id}': {e}", exc_info=True)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to update workflow instance: {str(e)}",
+                )
+
+    @staticmethod
+    async def _write_workflow_snapshot(workflow, instance_id, tenant_id=None) -> Dict[str, Any]:
+        """Serialize the whole workflow and replace the instance's serialized_data"""
         try:
             # Clean workflow data before serialization
             workflow.data = _clean_data_for_serialization(workflow.data)
@@ -513,11 +891,11 @@ class WorkflowServicePersistent:
             for task in workflow.get_tasks():
                 task.data = _clean_data_for_serialization(task.data)
             
-            serializer = BpmnWorkflowSerializer()
-            serialized_json = serializer.serialize_json(workflow)
+            serialized_data, spec_hash = await WorkflowServicePersistent._serialize_workflow(workflow, tenant_id)
 
             update_data = {
-                "serialized_data": json.loads(serialized_json),
+                "serialized_data": serialized_data,
+                "spec_hash": spec_hash,
                 "user_task": [],
                 "updated_at": datetime.now(timezone.utc),
             }
@@ -526,6 +904,7 @@ class WorkflowServicePersistent:
                 "workflowInstances", {"instance_id": instance_id}, update_data, tenant_id
             )
             logger.info(f"[WORKFLOW] Workflow instance updated in MongoDB - instance: {instance_id}")
+            return update_data["serialized_data"]
         except Exception as e:
             logger.error(f"[WORKFLOW] Failed to update workflow instance '{instance_id}': {e}", exc_info=True)
             raise HTTPException(
@@ -533,6 +912,29 @@ class WorkflowServicePersistent:
                 detail=f"Failed to update workflow instance: {str(e)}",
             )
 
+    @staticmethod
+    async def _serialize_workflow(workflow, tenant_id=None) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Serialize a workflow for an instance document; returns (serialized_data, spec_hash)
+
+        With separate spec storage the specs go to the shared spec store and
+        serialized_data only holds runtime state; otherwise the spec is inline.
+        """
+        serializer = BpmnWorkflowSerializer.shared()
+        if not _WorkflowSpecStore.ENABLED:
+            return json.loads(serializer.serialize_json(workflow)), None
+        spec_hash = await _WorkflowSpecStore.save(serializer, workflow, tenant_id)
+        return json.loads(serializer.serialize_state_json(workflow)), spec_hash
+
+    @staticmethod
+    async def _deserialize_workflow(instance: Dict[str, Any], tenant_id=None):
+        """Restore the workflow of an instance document stored with either an inline or a shared spec"""
+        serializer = BpmnWorkflowSerializer.shared()
+        serialized_data = instance["serialized_data"]
+        if "spec" in serialized_data or not instance.get("spec_hash"):
+            return serializer.deserialize_json(json.dumps(serialized_data))
+        spec, subprocess_specs = await _WorkflowSpecStore.load(instance["spec_hash"], tenant_id)
+        return serializer.deserialize_state_json(json.dumps(serialized_data), spec, subprocess_specs)
+
     @staticmethod
     async def list_workflows_paginated(workflow_id: str, page: int = 1, size: int = 8, status: str = "all", user: dict = None):
         """List workflows with pagination and status filter"""
@@ -586,8 +988,12 @@ class WorkflowServicePersistent:
             )
 
     @staticmethod
-    async def get_workflow_instance(workflow_id: str, instance_id: str, tenant_id: Optional[str] = None, user: dict = None):
-        """Get specific workflow instance by instance_id"""
+    async def get_workflow_instance(workflow_id: str, instance_id: str, tenant_id: Optional[str] = None, user: dict = None, include_spec: bool = True):
+        """Get specific workflow instance by instance_id
+
+        With ``include_spec`` the shared spec is merged back into ``serialized_data``
+        so callers see the same document shape as for instances stored with an inline spec.
+        """
         try:
             query = {"workflow_id": workflow_id, "instance_id": instance_id}
             instance = await MongoStorageService.find_one("workflowInstances", query, tenant_id=tenant_id)
@@ -598,6 +1004,11 @@ class WorkflowServicePersistent:
                     detail=f"Workflow instance {instance_id} not found",
                 )
 
+            if include_spec and instance.get("spec_hash") and "spec" not in instance.get("serialized_data", {}):
+                spec_data = await _WorkflowSpecStore.load_serialized(instance["spec_hash"], tenant_id)
+                instance["serialized_data"]["spec"] = spec_data["spec"]
+                instance["serialized_data"]["subprocess_specs"] = spec_data.get("subprocess_specs", {})
+
             # Convert ObjectId to string for JSON serialization
             if "_id" in instance:
                 instance["_id"] = str(instance["_id"])
@@ -635,6 +1046,7 @@ class WorkflowServicePersistent:
                     detail=f"Workflow instance {instance_id} not found",
                 )
 
+            _WorkflowDeltaTracker.discard(instance_id)
             logger.info(f"[WORKFLOW] Successfully deleted workflow instance: {instance_id}")
             return True
 
@@ -737,9 +1149,8 @@ class WorkflowServicePersistent:
         tenant_id = await cls.validate_tenant_access(user)
         
         try:
-            instance = await cls.get_workflow_instance(workflow_id, instance_id, tenant_id)
-            serializer = BpmnWorkflowSerializer()
-            workflow = serializer.deserialize_json(json.dumps(instance["serialized_data"]))
+            instance = await cls.get_workflow_instance(workflow_id, instance_id, tenant_id, include_spec=False)
+            workflow = await cls._deserialize_workflow(instance, tenant_id)
             
             # Determine status string
             workflow_status = cls._determine_workflow_status(workflow)
@@ -763,38 +1174,7 @@ class WorkflowServicePersistent:
         logger.info(f"[WORKFLOW] Starting new workflow {workflow_id}")
         
         try:
-            # Get BPMN XML
-            bpmn_xml = await cls.get_bpmn_xml(workflow_id, user)
-            
-            # Create workflow with disabled script engine (we handle scripts manually)
-            parser = BpmnParser()
-            
-            # Register our enhanced task parser for all task types
-            from spiffworkflow.bpmn.parser.util import full_tag
-            from spiffworkflow.bpmn.specs.defaults import (
-                UserTask, ManualTask, ServiceTask, ScriptTask, NoneTask
-            )
-            
-            enhanced_parsers = {
-                full_tag('userTask'): (EnhancedBpmnTaskParser, UserTask),
-                full_tag('manualTask'): (EnhancedBpmnTaskParser, ManualTask),
-                full_tag('serviceTask'): (EnhancedBpmnTaskParser, ServiceTask),
-                full_tag('scriptTask'): (EnhancedBpmnTaskParser, ScriptTask),
-                full_tag('task'): (EnhancedBpmnTaskParser, NoneTask),
-            }
-            
-            # Update the parser's override classes
-            parser.OVERRIDE_PARSER_CLASSES.update(enhanced_parsers)
-            
-            clean_bpmn = bpmn_xml.replace('<?xml version="1.0" encoding="UTF-8"?>', "").strip()
-            parser.add_bpmn_str(clean_bpmn)
-            
-            process_ids = parser.get_process_ids()
-            if not process_ids:
-                raise HTTPException(status_code=400, detail="No processes found in BPMN")
-                
-            spec = parser.get_spec(process_ids[0])
-            subprocess_specs = parser.get_subprocess_specs(process_ids[0], specs={})
+            spec, subprocess_specs = await cls.get_workflow_spec(workflow_id, user)
             
             workflow = BpmnWorkflow(spec, subprocess_specs=subprocess_specs)
             
@@ -819,6 +1199,37 @@ class WorkflowServicePersistent:
             logger.error(f"[WORKFLOW] Failed to start workflow: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
 
+    @classmethod
+    async def get_workflow_spec(cls, workflow_id: str, user: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """Parsed (spec, subprocess_specs) for a workflow config, served from the parse cache when possible"""
+        tenant_id = await cls.validate_tenant_access(user)
+        if _ParsedSpecCache.ENABLED:
+            cached = _ParsedSpecCache.get(tenant_id, workflow_id)
+            if cached is not None:
+                return cached
+
+        bpmn_xml = await cls.get_bpmn_xml(workflow_id, user)
+        if not _ParsedSpecCache.ENABLED:
+            return _parse_bpmn(bpmn_xml)
+
+        xml_hash = hashlib.sha256(bpmn_xml.encode("utf-8")).hexdigest()
+        cached = _ParsedSpecCache.get(tenant_id, workflow_id, xml_hash)
+        if cached is not None:
+            return cached
+
+        spec, subprocess_specs = _parse_bpmn(bpmn_xml)
+        _ParsedSpecCache.put(tenant_id, workflow_id, xml_hash, spec, subprocess_specs)
+        logger.info(f"[WORKFLOW] Parsed and cached BPMN for workflow {workflow_id}")
+        return spec, subprocess_specs
+
+    @staticmethod
+    def invalidate_workflow_spec(workflow_id: Optional[str] = None, tenant_id: Optional[str] = None) -> int:
+        """Forget cached parsed BPMN for a workflow config (or a tenant / everything)"""
+        dropped = _ParsedSpecCache.invalidate(workflow_id, tenant_id)
+        if dropped:
+            logger.info(f"[WORKFLOW] Invalidated {dropped} cached BPMN spec(s)")
+        return dropped
+
     @classmethod
     async def get_bpmn_xml(cls, workflow_id: str, user: Dict[str, Any]):
         """Get BPMN XML content from file storage"""
@@ -0,0 +1,62 @@
+"""
+Embedding Cache
+
+One process-wide cache of chunk and query embeddings, shared by every embedder
+built from a model config. Re-indexed, moved or re-uploaded files and repeated
+queries are served from memory, or from a SQLite file when one is configured,
+instead of the model.
+
+Settings:
+
+- ``EMBEDDING_CACHE_ENABLED`` - "false" disables the cache (default "true")
+- ``EMBEDDING_CACHE_PATH`` - SQLite file of the persistent tier (default unset: memory only);
+  the file is never pruned, so only point it at storage sized for it
+- ``EMBEDDING_CACHE_MEMORY_ENTRIES`` - embeddings kept in the in-memory LRU (default 10000)
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from .log import logger
+
+_cache = None
+_lock = threading.Lock()
+
+
+def _enabled() -> bool:
+    return os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+
+
+def get_embedding_cache():
+    """The shared EmbeddingCache, created on first use; None when disabled"""
+    global _cache
+    if not _enabled():
+        return None
+    with _lock:
+        if _cache is None:
+            from ai.embedder.cache import EmbeddingCache
+
+            path = os.getenv("EMBEDDING_CACHE_PATH", "")
+            max_entries = int(os.getenv("EMBEDDING_CACHE_MEMORY_ENTRIES", 10000))
+            _cache = EmbeddingCache(path or None, max_memory_entries=max_entries)
+            logger.info(f"[EMBEDDING] Cache enabled (memory entries={max_entries}, path={path or 'none'})")
+        return _cache
+
+
+def cached_embedder(embedder: Any) -> Any:
+    """Wrap an ai embedder so it goes through the shared cache; anything else is returned as is"""
+    from ai.embedder.base import Embedder
+    from ai.embedder.cache import CachedEmbedder
+
+    if not isinstance(embedder, Embedder) or isinstance(embedder, CachedEmbedder):
+        return embedder
+    cache = get_embedding_cache()
+    if cache is None:
+        return embedder
+    return CachedEmbedder(embedder=embedder, cache=cache)
+
+
+def embedding_cache_stats() -> Optional[Dict[str, Any]]:
+    """Hit/miss counters of the shared cache, or None when it isn't in use"""
+    return _cache.stats() if _cache is not None else None
@@ -26,8 +26,8 @@ class MongoStorageService:
         # Collections that are tenant-isolated
         tenant_collections = {
             'roles', 'userRoles', 'modelConfig', 'toolConfig', 'embedderConfig',
-            'knowledgeConfig', 'agents', 'conversations', 'agent_runs',
-            'workflowConfig', 'projects', 'projectActivities', 'activityNotifications'
+            'knowledgeConfig', 'knowledgeManifests', 'agents', 'conversations', 'agent_runs',
+            'workflowConfig', 'workflowSpecs', 'projects', 'projectActivities', 'activityNotifications'
         }
         
         # Special handling for users collection during OAuth flows
@@ -49,8 +49,8 @@ class MongoStorageService:
         # Collections that are tenant-isolated
         tenant_collections = {
             'roles', 'userRoles', 'modelConfig', 'toolConfig', 'embedderConfig',
-            'knowledgeConfig', 'agents', 'conversations', 'agent_runs',
-            'workflowConfig', 'projects', 'projectActivities', 'activityNotifications'
+            'knowledgeConfig', 'knowledgeManifests', 'agents', 'conversations', 'agent_runs',
+            'workflowConfig', 'workflowSpecs', 'projects', 'projectActivities', 'activityNotifications'
         }
         
         # Special handling for users collection during OAuth flows  
@@ -0,0 +1,108 @@
+"""
+Strategy Resolution Registry
+
+Model, tool and embedder configs name their implementation by a ``strategy``
+path. This module resolves those paths to classes once per process and caches
+the result, so request handlers never re-import modules or read Python source.
+
+Accepted strategy forms:
+
+- ``"package.module:ClassName"`` / ``"package.module.ClassName"`` - explicit class
+- ``"package.module"`` - the first class defined in that module
+- any path registered with :func:`register_strategy`
+"""
+
+import importlib
+import inspect
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from .log import logger
+
+# Explicit strategy -> class overrides, checked before any import
+_registry: Dict[str, Any] = {}
+# Resolved strategies
+_cache: Dict[str, Any] = {}
+_lock = threading.RLock()
+
+
+def register_strategy(strategy: str, cls: Any) -> None:
+    """Map ``strategy`` to ``cls`` explicitly (takes precedence over import-based resolution)"""
+    with _lock:
+        _registry[strategy] = cls
+        _cache[strategy] = cls
+
+
+def _first_defined_class(module) -> Optional[Any]:
+    """First class defined (not imported) in ``module``, in definition order"""
+    for value in vars(module).values():
+        if inspect.isclass(value) and value.__module__ == module.__name__:
+            return value
+    return None
+
+
+def _resolve(strategy: str) -> Optional[Any]:
+    if ":" in strategy:
+        module_path, class_name = strategy.split(":", 1)
+        return getattr(importlib.import_module(module_path), class_name)
+
+    try:
+        module = importlib.import_module(strategy)
+    except ModuleNotFoundError as e:
+        # "package.module.ClassName" - the last segment names a class, not a module
+        module_path, _, class_name = strategy.rpartition(".")
+        if not module_path or e.name != strategy:
+            raise
+        cls = getattr(importlib.import_module(module_path), class_name, None)
+        if inspect.isclass(cls):
+            return cls
+        raise
+    return _first_defined_class(module)
+
+
+def resolve_strategy(strategy: str) -> Optional[Any]:
+    """Return the class for ``strategy``, or None when it can't be resolved"""
+    if not strategy:
+        return None
+
+    cls = _cache.get(strategy)
+    if cls is not None:
+        return cls
+
+    with _lock:
+        cls = _cache.get(strategy) or _registry.get(strategy)
+        if cls is not None:
+            return cls
+        try:
+            cls = _resolve(strategy)
+        except Exception as e:
+            logger.error(f"[STRATEGY] Failed to resolve {strategy}: {e}")
+            return None
+        if cls is None:
+            logger.error(f"[STRATEGY] Could not find any class in {strategy}")
+            return None
+        _cache[strategy] = cls
+        logger.info(f"[STRATEGY] Resolved {strategy} -> {cls.__name__}")
+        return cls
+
+
+def warm_strategies(strategies: Optional[Iterable[str]] = None) -> int:
+    """
+    Resolve strategies ahead of time; returns how many resolved.
+
+    Defaults to the comma-separated ``STRATEGY_WARMUP`` environment variable.
+    """
+    if strategies is None:
+        strategies = [s.strip() for s in os.getenv("STRATEGY_WARMUP", "").split(",") if s.strip()]
+    resolved = sum(1 for strategy in strategies if resolve_strategy(strategy) is not None)
+    if resolved:
+        logger.info(f"[STRATEGY] Warmed {resolved} strategy class(es)")
+    return resolved
+
+
+def clear_strategy_cache() -> None:
+    """Forget resolved strategies (explicit registrations are kept)"""
+    with _lock:
+        _cache.clear()
+        _cache.update(_registry)
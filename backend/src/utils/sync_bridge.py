@@ -0,0 +1,99 @@
+"""
+Sync → Async Bridge
+
+This module runs blocking callables and synchronous generators (e.g. ``agent.run``)
+on a bounded worker pool so they never stall the FastAPI event loop, and streams
+generator items back through an asyncio queue with backpressure and cancellation.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import os
+import threading
+from typing import Any, AsyncGenerator, Callable, Iterator, Optional
+
+from .log import logger
+
+# Bounded pool shared by every blocking agent run in this process
+AGENT_WORKER_POOL_SIZE = int(os.getenv("AGENT_WORKER_POOL_SIZE", 32))
+# Items a worker may run ahead of a slow consumer before it blocks
+AGENT_STREAM_BUFFER = int(os.getenv("AGENT_STREAM_BUFFER", 64))
+
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=AGENT_WORKER_POOL_SIZE,
+    thread_name_prefix="agent-worker",
+)
+
+_DONE = object()
+
+
+async def run_sync(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking callable on the agent worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+async def iterate_sync_generator(
+    factory: Callable[[], Iterator[Any]],
+    buffer_size: Optional[int] = None,
+) -> AsyncGenerator[Any, None]:
+    """
+    Consume a synchronous generator on the worker pool and yield its items asynchronously.
+
+    ``factory`` is called inside the worker thread, so any blocking setup it does
+    (opening HTTP streams, reading storage) also stays off the event loop.
+
+    - Backpressure: the worker blocks once ``buffer_size`` items are waiting.
+    - Cancellation: closing this async generator (client disconnect, task
+      cancellation, ``break``) stops the worker at its next item and closes
+      the underlying generator so its cleanup code runs.
+    - Errors raised by the generator are re-raised in the consumer.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size or AGENT_STREAM_BUFFER)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        """Hand an item to the event loop, waiting while the queue is full; False once stopped."""
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stop.is_set():
+            try:
+                future.result(timeout=0.1)
+                return True
+            except concurrent.futures.TimeoutError:
+                continue
+        future.cancel()
+        return False
+
+    def _produce():
+        generator = None
+        try:
+            generator = factory()
+            for item in generator:
+                if stop.is_set() or not _put((item, None)):
+                    break
+            else:
+                _put((_DONE, None))
+        except BaseException as e:
+            _put((_DONE, e))
+        finally:
+            if generator is not None and hasattr(generator, "close"):
+                try:
+                    generator.close()
+                except Exception as e:
+                    logger.warning(f"[BRIDGE] Error closing generator: {e}")
+
+    worker = loop.run_in_executor(_executor, _produce)
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        stop.set()
+        # Don't leave an exception from an abandoned worker unretrieved
+        worker.add_done_callback(lambda f: f.exception())
@@ -0,0 +1,151 @@
+"""
+Agent time-to-first-token benchmark
+
+Drives N concurrent simulated chat sessions through
+AgentRuntimeService.run_agent_stream against a local mock OpenAI-compatible
+server and reports p50/p99 time-to-first-token and total wall time for the
+worker-pool (sync agent.run) and native async (agent.arun) execution paths.
+
+Usage:
+    python benchmarks/agent_ttft.py --sessions 200 --first-token-ms 300 --tokens 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "backend"))
+
+
+# ----------------------------------------------------------------------
+# Mock OpenAI chat.completions streaming server
+# ----------------------------------------------------------------------
+class MockOpenAIServer:
+    """Minimal HTTP server streaming chat.completion.chunk SSE events"""
+
+    def __init__(self, first_token_ms: float, token_interval_ms: float, tokens: int):
+        self.first_token = first_token_ms / 1000
+        self.token_interval = token_interval_ms / 1000
+        self.tokens = tokens
+        self.port = None
+        self._ready = threading.Event()
+        self._loop = None
+
+    def start(self):
+        threading.Thread(target=self._run, name="mock-openai", daemon=True).start()
+        self._ready.wait()
+        return self
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        server = self._loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    @staticmethod
+    def _chunk(delta=None, usage=None) -> bytes:
+        body = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": "mock",
+            "choices": [] if delta is None else [{"index": 0, "delta": delta, "finish_reason": None}],
+        }
+        if usage is not None:
+            body["usage"] = usage
+        return f"data: {json.dumps(body)}\n\n".encode()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        headers = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in headers.decode().split("\r\n"):
+            if line.lower().startswith("content-length:"):
+                length = int(line.split(":", 1)[1])
+        if length:
+            await reader.readexactly(length)
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        await asyncio.sleep(self.first_token)
+        writer.write(self._chunk({"role": "assistant", "content": "tok "}))
+        for _ in range(self.tokens - 1):
+            await asyncio.sleep(self.token_interval)
+            writer.write(self._chunk({"content": "tok "}))
+            await writer.drain()
+        usage = {"prompt_tokens": 10, "completion_tokens": self.tokens, "total_tokens": 10 + self.tokens}
+        writer.write(self._chunk(usage=usage))
+        writer.write(b"data: [DONE]\n\n")
+        await writer.drain()
+        writer.close()
+
+
+# ----------------------------------------------------------------------
+# Load generator
+# ----------------------------------------------------------------------
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_session(base_url: str) -> float:
+    """Run one chat session; returns seconds until the first content chunk"""
+    from ai.agent.agent import Agent
+    from ai.model.openai.chat import OpenAIChat
+    from src.services.agent_runtime_service import AgentRuntimeService
+
+    agent = Agent(model=OpenAIChat(id="mock", api_key="mock", base_url=base_url, max_retries=0))
+    started = time.perf_counter()
+    ttft = None
+    async for event in AgentRuntimeService.run_agent_stream(agent, "Hello", user={}, conv_id=None):
+        if event["type"] == "agent_chunk" and ttft is None:
+            ttft = time.perf_counter() - started
+        elif event["type"] == "error":
+            raise RuntimeError(event["error"])
+    return ttft if ttft is not None else float("nan")
+
+
+async def run_mode(mode: str, sessions: int, base_url: str):
+    from src.services.agent_runtime_service import AgentRuntimeService
+
+    AgentRuntimeService.ASYNC_EXECUTION = mode == "async"
+    started = time.perf_counter()
+    ttfts = await asyncio.gather(*(run_session(base_url) for _ in range(sessions)))
+    wall = time.perf_counter() - started
+    print(
+        f"{mode:>6}: sessions={sessions} "
+        f"ttft_p50={statistics.median(ttfts) * 1000:.1f}ms "
+        f"ttft_p99={percentile(ttfts, 99) * 1000:.1f}ms "
+        f"wall={wall:.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--first-token-ms", type=float, default=300)
+    parser.add_argument("--token-interval-ms", type=float, default=10)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--modes", nargs="+", default=["pool", "async"], choices=["pool", "async"])
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(args.first_token_ms, args.token_interval_ms, args.tokens).start()
+    base_url = f"http://127.0.0.1:{server.port}/v1"
+    for mode in args.modes:
+        asyncio.run(run_mode(mode, args.sessions, base_url))
+
+
+if __name__ == "__main__":
+    main()
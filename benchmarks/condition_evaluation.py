@@ -0,0 +1,70 @@
+"""
+Condition evaluation benchmark
+
+Evaluates --evaluations gateway-style conditions (``len(documents) > 0``) through
+the script engine for each of --tasks tasks whose data carries a --payload-kb
+list of documents, and reports the time per evaluation. With copy-on-write
+TaskData every task inherits the payload from its parent, and conditions read it
+without copying it. The "dict" mode evaluates against plain dictionaries for comparison.
+
+Usage:
+    python benchmarks/condition_evaluation.py --tasks 20 --evaluations 200 --payload-kb 1024
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.task_data_memory import build_payload  # noqa: E402
+
+CONDITION = "len(documents) > 0"
+
+
+def run(mode: str, tasks: int, evaluations: int, payload):
+    from spiffworkflow.bpmn.script_engine.python_engine import PythonScriptEngine
+    from spiffworkflow.util.task_data import TaskData
+
+    script_engine = PythonScriptEngine()
+    parent = TaskData(n=0, documents=deepcopy(payload))
+
+    started = time.perf_counter()
+    for _ in range(tasks):
+        if mode == "dict":
+            data = dict(dict.items(parent))
+        else:
+            data = TaskData()
+            data.update(parent)
+        task = SimpleNamespace(data=data)
+        for _ in range(evaluations):
+            assert script_engine.evaluate(task, CONDITION)
+    elapsed = time.perf_counter() - started
+
+    count = tasks * evaluations
+    print(f"{mode:>10}: evaluations={count} time={elapsed:6.2f}s ({elapsed / count * 1e6:8.1f}us each)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--evaluations", type=int, default=200)
+    parser.add_argument("--payload-kb", type=int, default=1024)
+    parser.add_argument("--modes", nargs="+", default=["dict", "task-data"], choices=["dict", "task-data"])
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    payload = build_payload(args.payload_kb)
+    print(f"payload={len(json.dumps(payload)) / 1024:.0f}KB documents={len(payload)}")
+    for mode in args.modes:
+        run(mode, args.tasks, args.evaluations, payload)
+
+
+if __name__ == "__main__":
+    main()
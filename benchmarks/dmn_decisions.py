@@ -0,0 +1,133 @@
+"""
+DMN decision table benchmark
+
+Builds a --rules row decision table (a string column matched by literal, a
+numeric column matched by range expressions and a wildcard-heavy boolean
+column) and reports the per-decision cost of the interpreted engine (each cell
+rewritten, parsed and evaluated through the script engine) against the
+compiled table, plus the per-row cost of DMNEngine.results for bulk input.
+
+Usage:
+    python benchmarks/dmn_decisions.py --rules 1000 --decisions 200
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+BPMN = b"""<?xml version="1.0" encoding="UTF-8"?>
+<bpmn:definitions xmlns:bpmn="http://www.omg.org/spec/BPMN/20100524/MODEL" id="defs" targetNamespace="http://bpmn.io/schema/bpmn">
+  <bpmn:process id="decide" isExecutable="true">
+    <bpmn:startEvent id="start"><bpmn:outgoing>f0</bpmn:outgoing></bpmn:startEvent>
+    <bpmn:sequenceFlow id="f0" sourceRef="start" targetRef="end"/>
+    <bpmn:endEvent id="end"><bpmn:incoming>f0</bpmn:incoming></bpmn:endEvent>
+  </bpmn:process>
+</bpmn:definitions>
+"""
+
+RANGES = ["-", "< 100", ">= 100", "50 < ? < 500", " in [1, 2, 3]", "> 900"]
+
+
+def build_dmn(rules: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    rows = []
+    for row in range(rules):
+        cells = (f'"sku-{rng.randrange(rules // 2)}"', rng.choice(RANGES), rng.choice(["-", "-", "True", "False"]))
+        entries = "".join(
+            f'<inputEntry id="in_{row}_{col}"><text>{escape(text)}</text></inputEntry>' for col, text in enumerate(cells)
+        )
+        rows.append(
+            f'<rule id="rule_{row}">{entries}'
+            f'<outputEntry id="out_{row}"><text>"tier-{row % 7}"</text></outputEntry>'
+            f'<outputEntry id="discount_{row}"><text>{row % 30} / 100</text></outputEntry></rule>'
+        )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="https://www.omg.org/spec/DMN/20191111/MODEL/" id="pricing" name="Pricing" namespace="benchmark">
+  <decision id="pricing_decision" name="Pricing">
+    <decisionTable id="pricing_table" hitPolicy="UNIQUE">
+      <input id="sku" label="SKU"><inputExpression id="sku_expr" typeRef="string"><text>sku</text></inputExpression></input>
+      <input id="quantity" label="Quantity"><inputExpression id="quantity_expr" typeRef="integer"><text>quantity</text></inputExpression></input>
+      <input id="member" label="Member"><inputExpression id="member_expr" typeRef="boolean"><text>member</text></inputExpression></input>
+      <output id="tier" label="Tier" name="tier" typeRef="string"/>
+      <output id="discount" label="Discount" name="discount" typeRef="number"/>
+      {"".join(rows)}
+    </decisionTable>
+  </decision>
+</definitions>""".encode("utf-8")
+
+
+def make_task():
+    from spiffworkflow.bpmn.parser.BpmnParser import BpmnParser
+    from spiffworkflow.bpmn.workflow import BpmnWorkflow
+
+    parser = BpmnParser()
+    parser.add_bpmn_str(BPMN)
+    workflow = BpmnWorkflow(parser.get_spec("decide"))
+    return workflow.get_tasks()[-1]
+
+
+def report(label: str, samples, unit: str = "decision"):
+    print(
+        f"{label:>22}: mean={statistics.fmean(samples):10.1f}us "
+        f"p50={statistics.median(samples):10.1f}us per {unit}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, default=1000)
+    parser.add_argument("--decisions", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    from spiffworkflow.dmn.parser.BpmnDmnParser import BpmnDmnParser
+
+    dmn_parser = BpmnDmnParser()
+    dmn_parser.add_dmn_str(build_dmn(args.rules, args.seed))
+    started = time.perf_counter()
+    engine = dmn_parser.get_engine("pricing_decision", None)
+    print(f"rules={args.rules} compile={(time.perf_counter() - started) * 1000:.1f}ms "
+          f"indexed_columns={len(engine.compiled_table.indexes)}")
+
+    rng = random.Random(args.seed)
+    inputs = [
+        {"sku": f"sku-{rng.randrange(args.rules)}", "quantity": rng.randrange(1000), "member": rng.random() < 0.5}
+        for _ in range(max(args.decisions, args.batch))
+    ]
+    task = make_task()
+
+    results = {}
+    for label, compiled in (("interpreted", False), ("compiled", True)):
+        if not compiled:
+            engine._evaluation_globals = lambda task: None
+        else:
+            del engine._evaluation_globals
+        samples, outputs = [], []
+        for data in inputs[:args.decisions]:
+            task.data = data
+            started = time.perf_counter()
+            outputs.append(engine.result(task))
+            samples.append((time.perf_counter() - started) * 1e6)
+        results[label] = outputs
+        report(label, samples)
+    assert results["interpreted"] == results["compiled"], "compiled table disagrees with the interpreted engine"
+
+    rows = [dict(data) for data in inputs[:args.batch]]
+    started = time.perf_counter()
+    engine.results(rows)
+    elapsed = time.perf_counter() - started
+    report(f"results() x{len(rows)}", [elapsed / len(rows) * 1e6], unit="row")
+
+
+if __name__ == "__main__":
+    main()
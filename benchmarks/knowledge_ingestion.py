@@ -0,0 +1,150 @@
+"""
+Knowledge ingestion benchmark
+
+Loads --files documents of --chunks chunks each into an in-memory vector db
+through an embedder that simulates a remote backend: every request costs
+--latency-ms plus --per-text-ms per input text. Reports the wall time of the
+previous loader (one embedding request per chunk, one file at a time) against
+the staged pipeline (batched requests, --workers embedding batches in flight).
+
+Usage:
+    python benchmarks/knowledge_ingestion.py --files 20 --chunks 50 --latency-ms 40
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ai.document import Document  # noqa: E402
+from ai.embedder.base import Embedder  # noqa: E402
+from ai.knowledge.agent import AgentKnowledge  # noqa: E402
+from ai.vectordb.base import VectorDb  # noqa: E402
+
+
+class SimulatedEmbedder(Embedder):
+    dimensions: int = 8
+    latency_ms: float = 40.0
+    per_text_ms: float = 0.2
+    requests: int = 0
+
+    def _request(self, texts: List[str]) -> List[List[float]]:
+        self.requests += 1
+        time.sleep((self.latency_ms + self.per_text_ms * len(texts)) / 1000)
+        return [[float(len(text) % (i + 2)) for i in range(self.dimensions)] for text in texts]
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self._request([text])[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        for batch in self.batches(texts):
+            embeddings.extend(self._request(batch))
+        return embeddings, None
+
+
+class MemoryVectorDb(VectorDb):
+    def __init__(self, embedder: Embedder):
+        self.embedder = embedder
+        self.rows: Dict[str, Document] = {}
+        self._lock = threading.Lock()
+
+    def create(self) -> None:
+        pass
+
+    def doc_exists(self, document: Document) -> bool:
+        return document.content in self.rows
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def insert(self, documents: List[Document], filters=None) -> None:
+        Document.embed_documents(documents, self.embedder)
+        with self._lock:
+            self.rows.update((document.content, document) for document in documents)
+
+    def upsert(self, documents: List[Document], filters=None) -> None:
+        self.insert(documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters=None) -> List[Document]:
+        return []
+
+    def drop(self) -> None:
+        self.rows.clear()
+
+    def exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        self.rows.clear()
+        return True
+
+
+class GeneratedKnowledgeBase(AgentKnowledge):
+    files: int = 20
+    chunks: int = 50
+
+    @property
+    def document_lists(self):
+        for file in range(self.files):
+            yield [
+                Document(name=f"file-{file}", content=f"file {file} chunk {chunk} " + "lorem ipsum " * 40)
+                for chunk in range(self.chunks)
+            ]
+
+
+def serial_load(knowledge_base: GeneratedKnowledgeBase) -> int:
+    """The previous AgentKnowledge.load: each chunk embedded by its own request"""
+    vector_db = knowledge_base.vector_db
+    loaded = 0
+    for document_list in knowledge_base.document_lists:
+        documents = [document for document in document_list if not vector_db.doc_exists(document)]
+        for document in documents:
+            document.embed(embedder=vector_db.embedder)
+        vector_db.insert(documents)
+        loaded += len(documents)
+    return loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--chunks", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--per-text-ms", type=float, default=0.2)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    for mode in ("serial", "pipeline"):
+        embedder = SimulatedEmbedder(
+            latency_ms=args.latency_ms, per_text_ms=args.per_text_ms, batch_size=args.batch_size
+        )
+        knowledge_base = GeneratedKnowledgeBase(
+            vector_db=MemoryVectorDb(embedder), files=args.files, chunks=args.chunks, embed_workers=args.workers
+        )
+        started = time.perf_counter()
+        if mode == "serial":
+            loaded = serial_load(knowledge_base)
+        else:
+            knowledge_base.load()
+            loaded = len(knowledge_base.vector_db.rows)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{mode:>9}: chunks={loaded} requests={embedder.requests} "
+            f"time={elapsed:6.2f}s ({loaded / elapsed:8.1f} chunks/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
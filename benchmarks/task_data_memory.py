@@ -0,0 +1,131 @@
+"""
+Task data memory benchmark
+
+Runs a looping script-task workflow of roughly --tasks tasks whose data carries
+a --payload-kb JSON payload (a list of documents, as produced by retrieval or
+LLM steps) and reports the memory the finished workflow holds, comparing the
+previous inheritance (every child task deep copies its parent's data) with
+copy-on-write TaskData (values are shared until a task modifies them). The
+gateway condition reads the payload at every iteration, so reads that copied
+shared values would show up in both the memory and the time.
+
+Usage:
+    python benchmarks/task_data_memory.py --tasks 1000 --payload-kb 1024
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+BPMN = """<?xml version="1.0" encoding="UTF-8"?>
+<bpmn:definitions xmlns:bpmn="http://www.omg.org/spec/BPMN/20100524/MODEL" id="defs" targetNamespace="http://bpmn.io/schema/bpmn">
+  <bpmn:process id="payload_loop" isExecutable="true">
+    <bpmn:startEvent id="start"><bpmn:outgoing>f0</bpmn:outgoing></bpmn:startEvent>
+    <bpmn:sequenceFlow id="f0" sourceRef="start" targetRef="count"/>
+    <bpmn:scriptTask id="count">
+      <bpmn:incoming>f0</bpmn:incoming><bpmn:incoming>again</bpmn:incoming><bpmn:outgoing>f1</bpmn:outgoing>
+      <bpmn:script>n = n + 1</bpmn:script>
+    </bpmn:scriptTask>
+    <bpmn:sequenceFlow id="f1" sourceRef="count" targetRef="summarize"/>
+    <bpmn:scriptTask id="summarize">
+      <bpmn:incoming>f1</bpmn:incoming><bpmn:outgoing>f2</bpmn:outgoing>
+      <bpmn:script>summary = f"step {n}"</bpmn:script>
+    </bpmn:scriptTask>
+    <bpmn:sequenceFlow id="f2" sourceRef="summarize" targetRef="more"/>
+    <bpmn:exclusiveGateway id="more" default="done">
+      <bpmn:incoming>f2</bpmn:incoming><bpmn:outgoing>again</bpmn:outgoing><bpmn:outgoing>done</bpmn:outgoing>
+    </bpmn:exclusiveGateway>
+    <bpmn:sequenceFlow id="again" sourceRef="more" targetRef="count">
+      <bpmn:conditionExpression>n &lt; iterations and len(documents) &gt; 0</bpmn:conditionExpression>
+    </bpmn:sequenceFlow>
+    <bpmn:sequenceFlow id="done" sourceRef="more" targetRef="end"/>
+    <bpmn:endEvent id="end"><bpmn:incoming>done</bpmn:incoming></bpmn:endEvent>
+  </bpmn:process>
+</bpmn:definitions>
+"""
+
+# count, summarize and the gateway run once per iteration
+TASKS_PER_ITERATION = 3
+
+
+def build_payload(size_kb: int):
+    """A list of retrieved documents whose JSON encoding is about size_kb kilobytes"""
+    documents = []
+    size = 0
+    while size < size_kb * 1024:
+        document = {
+            "id": len(documents),
+            "text": f"chunk {len(documents)} " + "lorem ipsum dolor sit amet " * 12,
+            "metadata": {"source": "handbook.pdf", "page": len(documents) // 4, "tags": ["policy", "hr"]},
+            "scores": [0.91, 0.87, 0.55],
+        }
+        size += len(json.dumps(document))
+        documents.append(document)
+    return documents
+
+
+def deepcopy_inherit_data(task):
+    """The previous Task._inherit_data"""
+    task.set_data(**deepcopy(dict(dict.items(task.parent.data))))
+
+
+def run(mode: str, tasks: int, payload):
+    from spiffworkflow.bpmn.parser.BpmnParser import BpmnParser
+    from spiffworkflow.bpmn.workflow import BpmnWorkflow
+    from spiffworkflow.task import Task
+    from spiffworkflow.util.task import TaskState
+
+    parser = BpmnParser()
+    parser.add_bpmn_str(BPMN.encode("utf-8"))
+    workflow = BpmnWorkflow(parser.get_spec("payload_loop"))
+
+    inherit_data = Task._inherit_data
+    if mode == "deepcopy":
+        Task._inherit_data = deepcopy_inherit_data
+    try:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        first = workflow.get_tasks(state=TaskState.READY)[0]
+        first.data.update(n=0, iterations=max(1, tasks // TASKS_PER_ITERATION), documents=deepcopy(payload))
+        workflow.do_engine_steps()
+        elapsed = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        Task._inherit_data = inherit_data
+
+    assert workflow.is_completed()
+    print(
+        f"{mode:>14}: tasks={len(workflow.tasks)} "
+        f"retained={(current - baseline) / 2**20:8.1f}MB "
+        f"peak={(peak - baseline) / 2**20:8.1f}MB "
+        f"time={elapsed:6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--payload-kb", type=int, default=1024)
+    parser.add_argument("--modes", nargs="+", default=["deepcopy", "copy-on-write"], choices=["deepcopy", "copy-on-write"])
+    args = parser.parse_args()
+
+    # Per-task logging would dominate both the timings and the traced allocations
+    logging.disable(logging.CRITICAL)
+    payload = build_payload(args.payload_kb)
+    print(f"payload={len(json.dumps(payload)) / 1024:.0f}KB documents={len(payload)}")
+    for mode in args.modes:
+        run(mode, args.tasks, payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Workflow serializer overhead benchmark
+
+Measures the per-save cost of serializing a BPMN workflow the way the
+workflow service does, comparing a fresh BpmnWorkflowSerializer per save
+(configure() + every DEFAULT_CONFIG converter instantiated each time) with
+the process-wide BpmnWorkflowSerializer.shared() instance.
+
+Usage:
+    python benchmarks/workflow_serializer.py --bpmn processes/query1.bpmn --iterations 2000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def build_workflow(bpmn_path: str):
+    from spiffworkflow.bpmn.parser.BpmnParser import BpmnParser
+    from spiffworkflow.bpmn.workflow import BpmnWorkflow
+
+    parser = BpmnParser()
+    parser.add_bpmn_file(bpmn_path)
+    process_id = parser.get_process_ids()[0]
+    return BpmnWorkflow(parser.get_spec(process_id), parser.get_subprocess_specs(process_id))
+
+
+def time_calls(func, iterations: int):
+    """Per-call durations in microseconds"""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def report(label: str, samples):
+    print(
+        f"{label:>24}: mean={statistics.fmean(samples):8.1f}us "
+        f"p50={statistics.median(samples):8.1f}us "
+        f"min={min(samples):8.1f}us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bpmn", default=str(ROOT / "processes" / "query1.bpmn"))
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    from spiffworkflow.bpmn.serializer import BpmnWorkflowSerializer
+
+    workflow = build_workflow(args.bpmn)
+    shared = BpmnWorkflowSerializer.shared()
+
+    # Warm up both paths
+    BpmnWorkflowSerializer().serialize_json(workflow)
+    shared.serialize_json(workflow)
+
+    results = {
+        "construct only": time_calls(BpmnWorkflowSerializer, args.iterations),
+        "fresh serializer/save": time_calls(lambda: BpmnWorkflowSerializer().serialize_json(workflow), args.iterations),
+        "shared serializer/save": time_calls(lambda: shared.serialize_json(workflow), args.iterations),
+        "shared state-only/save": time_calls(lambda: shared.serialize_state_json(workflow), args.iterations),
+    }
+    print(f"workflow={Path(args.bpmn).name} tasks={len(workflow.tasks)} iterations={args.iterations}")
+    for label, samples in results.items():
+        report(label, samples)
+    saved = statistics.fmean(results["fresh serializer/save"]) - statistics.fmean(results["shared serializer/save"])
+    print(f"{'saved per save':>24}: {saved:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
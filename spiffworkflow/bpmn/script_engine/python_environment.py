@@ -20,11 +20,18 @@
 
 import copy
 import os
+import pickle
 import re
 import sys
 import textwrap
 import types
 import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from uuid import UUID
+
+from spiffworkflow.util.task_data import TaskData
 
 # Add project root to path to import logger
 _current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -35,6 +42,200 @@ if _project_root not in sys.path:
 from logger.logger import get_logger
 logger = get_logger("spiffworkflow.python_environment")
 
+# Number of compiled expressions / scripts kept; the caches are shared by every environment in the process
+COMPILED_CODE_CACHE_SIZE = 1024
+
+
+def _clean_markdown_code(script):
+    """Strip markdown code fences (```python ... ```) from a script"""
+    if not script:
+        return script
+        
+    # Remove markdown code block markers - handle all variations
+    cleaned = re.sub(r'^```[a-zA-Z]*\s*', '', script.strip(), flags=re.MULTILINE)
+    
+    # Remove closing ``` at end
+    cleaned = re.sub(r'\s*```\s*$', '', cleaned, flags=re.MULTILINE)
+    
+    # Remove any standalone ``` lines
+    cleaned = re.sub(r'^\s*```\s*$', '', cleaned, flags=re.MULTILINE)
+    
+    # Remove lines that are just ```
+    lines = cleaned.split('\n')
+    lines = [line for line in lines if line.strip() != '```' and not line.strip().startswith('```')]
+    
+    return '\n'.join(lines).strip()
+
+
+# Values of these exact types can always be copied and serialized
+_SAFE_TYPES = frozenset((str, int, float, bool, type(None), bytes, date, datetime, time, timedelta, Decimal, UUID))
+_CONTAINER_TYPES = frozenset((list, tuple, set, frozenset))
+# Number of values inspected by type before falling back to pickling the whole object
+MAX_INSPECTED_VALUES = 10000
+
+# type name -> converter for values that must not stay in task data as-is
+_CONTEXT_CONVERTERS = {}
+# module prefix -> converter, used when no type name matches
+_CONTEXT_MODULE_CONVERTERS = {}
+
+
+def register_context_converter(name, converter, by_module=False):
+    """Convert script results of a type (or of any type from a module) before they are stored in task data.
+
+    Types are matched by name so that optional packages (pandas, numpy) don't need to be imported.
+
+    Arguments:
+        name (str): the class name, or a module prefix if `by_module` is set
+        converter: a function returning a JSON-serializable replacement for the value
+        by_module (bool): match on the module of the value's type rather than on the class name
+    """
+    (_CONTEXT_MODULE_CONVERTERS if by_module else _CONTEXT_CONVERTERS)[name] = converter
+
+
+def _find_context_converter(obj):
+    obj_type = type(obj)
+    converter = _CONTEXT_CONVERTERS.get(obj_type.__name__)
+    if converter is None:
+        module = getattr(obj_type, '__module__', None) or ''
+        for prefix, module_converter in _CONTEXT_MODULE_CONVERTERS.items():
+            if module.startswith(prefix):
+                return module_converter
+    return converter
+
+
+def _records_json(obj):
+    return json.loads(obj.to_json(orient='records'))
+
+
+def _convert_pandas(obj):
+    return json.loads(obj.to_json()) if hasattr(obj, 'to_json') else str(obj)
+
+
+def _convert_numpy(obj):
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    elif hasattr(obj, 'item'):
+        return obj.item()
+    return str(obj)
+
+
+register_context_converter('DataFrame', _records_json)
+register_context_converter('Series', _records_json)
+register_context_converter('ndarray', lambda obj: obj.tolist())
+register_context_converter('pandas', _convert_pandas, by_module=True)
+register_context_converter('numpy', _convert_numpy, by_module=True)
+
+
+def _pickles(obj):
+    try:
+        pickle.dumps(obj)
+        return True
+    except (TypeError, AttributeError, pickle.PicklingError):
+        return False
+
+
+def _contents(obj):
+    """Snapshot the objects held by the built-in containers in `obj`.
+
+    Returns a list of (container, items) pairs, or None if `obj` holds anything other than built-in
+    containers and `_SAFE_TYPES` values or more than `MAX_INSPECTED_VALUES` containers.  Two snapshots
+    of the same object match only if nothing in it was added, removed or replaced in place.
+    """
+    stack, contents = [obj], []
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type in _SAFE_TYPES:
+            continue
+        if item_type in _CONTAINER_TYPES:
+            items = list(item)
+        elif item_type is dict:
+            items = [*item.keys(), *item.values()]
+        else:
+            return None
+        if len(contents) >= MAX_INSPECTED_VALUES:
+            return None
+        contents.append((item, items))
+        stack.extend(items)
+    return contents
+
+
+def _unchanged(obj, contents):
+    """Whether `obj` still holds exactly the objects recorded by `_contents`"""
+    if contents is None:
+        return False
+    current = _contents(obj)
+    if current is None or len(current) != len(contents):
+        return False
+    for (container, items), (old_container, old_items) in zip(current, contents):
+        if container is not old_container or len(items) != len(old_items):
+            return False
+        if any(item is not old_item for item, old_item in zip(items, old_items)):
+            return False
+    return True
+
+
+# Stands in for the `_contents` of values a script doesn't name, so it can't have modified them
+_NOT_NAMED = object()
+# A script using these can reach values without naming them
+_DYNAMIC_LOOKUPS = frozenset(('globals', 'locals', 'vars', 'eval', 'exec'))
+
+
+@lru_cache(maxsize=COMPILED_CODE_CACHE_SIZE)
+def _code_names(code):
+    """The names used by compiled code, including the functions (lambdas, comprehensions) nested in it"""
+    names, stack = set(), [code]
+    while stack:
+        item = stack.pop()
+        names.update(item.co_names)
+        stack.extend(const for const in item.co_consts if isinstance(const, types.CodeType))
+    return frozenset(names)
+
+
+def _holds_name(d, names):
+    """Whether a nested dictionary has a key in `names` (`_flatten_dict` lifts these to the top level)"""
+    stack = [d]
+    while stack:
+        item = stack.pop()
+        if not names.isdisjoint(item):
+            return True
+        stack.extend(value for value in item.values() if isinstance(value, dict))
+    return False
+
+
+def copy_shared_reads(data, *codes):
+    """Give a task's `TaskData` its own copy of the shared values compiled `codes` might modify.
+
+    Reading task data doesn't copy anything, so this must be called before running code that may
+    change values in place (scripts).  The copies are kept in `data`.  A name found in a nested
+    dictionary copies the top-level dictionary holding it; code that can reach values without
+    naming them (`globals()`, `eval`, ...) copies every shared value.
+    """
+    if not isinstance(data, TaskData):
+        return
+    names = frozenset().union(*(_code_names(code) for code in codes))
+    dynamic = not _DYNAMIC_LOOKUPS.isdisjoint(names)
+    for key, value in list(dict.items(data)):
+        if data.is_shared(key) and (dynamic or key in names or isinstance(value, dict) and _holds_name(value, names)):
+            data.own(key)
+
+
+@lru_cache(maxsize=COMPILED_CODE_CACHE_SIZE)
+def compile_expression(expression):
+    """Compile an expression for `eval`, keyed by its source text"""
+    # Normalize whitespace to handle expressions with newlines and indentation
+    return compile(' '.join(expression.split()), '<string>', 'eval')
+
+
+@lru_cache(maxsize=COMPILED_CODE_CACHE_SIZE)
+def compile_script(script):
+    """Clean up and compile a script for `exec`, keyed by its source text"""
+    # Clean up markdown code blocks and backticks
+    cleaned_script = _clean_markdown_code(script)
+    # Remove common leading whitespace to handle indented scripts
+    cleaned_script = textwrap.dedent(cleaned_script).strip()
+    return compile(cleaned_script, '<string>', 'exec')
+
 
 class BasePythonScriptEngineEnvironment:
     def __init__(self, environment_globals=None):
@@ -53,13 +254,20 @@ class BasePythonScriptEngineEnvironment:
 class TaskDataEnvironment(BasePythonScriptEngineEnvironment):
 
     def evaluate(self, expression, context, external_context=None):
+        return eval(compile_expression(expression), self.evaluation_globals(context, external_context))
+
+    def evaluation_globals(self, context, external_context=None):
+        """The globals expressions are evaluated with.
+
+        Callers evaluating many compiled expressions against the same data (such as DMN tables)
+        can build these once and reuse them.  The values are not copied: expressions read task data
+        and must not modify it in place.
+        """
         my_globals = copy.copy(self.globals)  # else we pollute all later evals.
         self._prepare_context(context)
         my_globals.update(external_context or {})
-        my_globals.update(context)
-        # Normalize whitespace to handle expressions with newlines and indentation
-        expression = ' '.join(expression.split())
-        return eval(expression, my_globals)
+        my_globals.update(dict.items(context))
+        return my_globals
 
     def execute(self, script, context, external_context=None):
         self.check_for_overwrite(context, external_context or {})
@@ -70,68 +278,91 @@ class TaskDataEnvironment(BasePythonScriptEngineEnvironment):
         # Flatten nested dictionaries in context
         flattened_context = self._flatten_dict(context)
         context.clear()
-        context.update(flattened_context)
+        if isinstance(context, TaskData):
+            # Values the task already owned stay owned; update would mark all of them as shared
+            context.adopt(flattened_context)
+        else:
+            context.update(flattened_context)
         context.update(my_globals)
         
+        original = None
         try:
-            # Clean up markdown code blocks and backticks
-            cleaned_script = self._clean_markdown_code(script)
-            # Remove common leading whitespace to handle indented scripts
-            cleaned_script = textwrap.dedent(cleaned_script).strip()
-            exec(cleaned_script, context)
+            code = compile_script(script)
+            copy_shared_reads(context, code)
+            # Values the script neither replaces nor modifies were already cleaned when they were stored;
+            # only the ones it names can have been modified in place
+            names = _code_names(code)
+            named = (lambda k: True) if not _DYNAMIC_LOOKUPS.isdisjoint(names) else names.__contains__
+            original = {k: (v, _contents(v) if named(k) else _NOT_NAMED) for k, v in dict.items(context)}
+            exec(code, context)
         finally:
-            self._remove_globals_and_functions_from_context(context, external_context)
+            self._remove_globals_and_functions_from_context(context, external_context, original)
         return True
 
     def _clean_markdown_code(self, script):
-        if not script:
-            return script
-            
-        # Remove markdown code block markers - handle all variations
-        cleaned = re.sub(r'^```[a-zA-Z]*\s*', '', script.strip(), flags=re.MULTILINE)
-        
-        # Remove closing ``` at end
-        cleaned = re.sub(r'\s*```\s*$', '', cleaned, flags=re.MULTILINE)
-        
-        # Remove any standalone ``` lines
-        cleaned = re.sub(r'^\s*```\s*$', '', cleaned, flags=re.MULTILINE)
-        
-        # Remove lines that are just ```
-        lines = cleaned.split('\n')
-        lines = [line for line in lines if line.strip() != '```' and not line.strip().startswith('```')]
-        
-        return '\n'.join(lines).strip()
+        return _clean_markdown_code(script)
 
     def _flatten_dict(self, d, parent_key='', sep='_'):
-        items = []
-        for k, v in d.items():
+        items, shared = [], set()
+        for k, v in dict.items(d):
             if isinstance(v, dict):
                 # Recursively flatten nested dictionaries
-                items.extend(self._flatten_dict(v, parent_key=k, sep=sep).items())
+                nested = list(self._flatten_dict(v, parent_key=k, sep=sep).items())
+                items.extend(nested)
+                keys = [key for key, _ in nested]
             else:
                 # Keep non-dict values as-is
                 items.append((k, v))
+                keys = [k]
+            if isinstance(d, TaskData) and d.is_shared(k):
+                shared.update(keys)
+            else:
+                shared.difference_update(keys)
+        if isinstance(d, TaskData):
+            # The values were read without copying, so the ones still shared with other tasks have to be
+            # copied before they're modified
+            flattened = TaskData(items)
+            flattened.share(shared)
+            return flattened
         return dict(items)
 
     def _prepare_context(self, context):
         pass
 
     def _is_safe_for_deepcopy(self, obj):
-        """Check if an object is safe for deepcopy by testing common problematic attributes"""
-        try:
-            # Quick test - try to pickle the object (similar issue to deepcopy)
-            import pickle
-            pickle.dumps(obj)
-            return True
-        except (TypeError, AttributeError, pickle.PicklingError):
-            return False
+        """Check if an object is safe for deepcopy.
+
+        Primitive values and the contents of built-in containers are checked by type; anything else is
+        tested by pickling it (deepcopy fails on similar objects).  Values with more than
+        `MAX_INSPECTED_VALUES` items are pickled as a whole.
+        """
+        stack, inspected = [obj], 0
+        while stack:
+            item = stack.pop()
+            item_type = type(item)
+            if item_type in _SAFE_TYPES:
+                continue
+            inspected += 1
+            if inspected > MAX_INSPECTED_VALUES:
+                return _pickles(obj)
+            if item_type in _CONTAINER_TYPES:
+                stack.extend(item)
+            elif item_type is dict:
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif not _pickles(item):
+                return False
+        return True
 
-    def _remove_globals_and_functions_from_context(self, context, external_context=None):
+    def _remove_globals_and_functions_from_context(self, context, external_context=None, original=None):
         """When executing a script, don't leave the globals, functions,
         modules, and external methods in the context that we have modified.
-        Convert non-serializable objects (like DataFrames) to JSON."""
-        for k in list(context):
-            obj = context[k]
+        Convert non-serializable objects (like DataFrames) to JSON.
+
+        `original` maps each key of the context before the script ran to its value and the `_contents`
+        snapshot of it (`_NOT_NAMED` for values the script doesn't name); values the script left
+        untouched are kept without being inspected."""
+        for k, obj in list(dict.items(context)):
             
             # Remove builtins, modules, functions, globals, and external context items
             if k == "__builtins__" or \
@@ -140,37 +371,24 @@ class TaskDataEnvironment(BasePythonScriptEngineEnvironment):
                     k in self.globals or \
                     external_context and k in external_context:
                 context.pop(k)
+            elif original is not None and k in original and original[k][0] is obj and \
+                    (original[k][1] is _NOT_NAMED or _unchanged(obj, original[k][1])):
+                continue
             else:
-                # Check if object is safe for deepcopy (generic approach)
-                if not self._is_safe_for_deepcopy(obj):
+                # Convert known non-serializable objects (DataFrames, numpy values, ...) to JSON
+                converter = _find_context_converter(obj)
+                if converter is not None:
+                    try:
+                        context[k] = converter(obj)
+                    except Exception as exc:
+                        logger.debug(f"[SPIFF] Removing unconvertible object '{k}' (type: {type(obj).__name__}) from context: {exc}")
+                        context.pop(k)
+                elif not self._is_safe_for_deepcopy(obj):
                     logger.debug(f"[SPIFF] Removing non-serializable object '{k}' (type: {type(obj).__name__}) from context")
                     context.pop(k)
-                    continue
-                
-                # Convert other known non-serializable objects to JSON
-                type_name = type(obj).__name__
-                if type_name == 'DataFrame':
-                    context[k] = json.loads(obj.to_json(orient='records'))
-                elif type_name == 'Series':
-                    context[k] = json.loads(obj.to_json(orient='records'))
-                elif type_name == 'ndarray':
-                    context[k] = obj.tolist()
-                elif hasattr(type(obj), '__module__'):
-                    module = type(obj).__module__
-                    if module and module.startswith('pandas'):
-                        if hasattr(obj, 'to_json'):
-                            context[k] = json.loads(obj.to_json())
-                        else:
-                            context[k] = str(obj)
-                    elif module and module.startswith('numpy'):
-                        if hasattr(obj, 'tolist'):
-                            context[k] = obj.tolist()
-                        elif hasattr(obj, 'item'):
-                            context[k] = obj.item()
-                        else:
-                            context[k] = str(obj)    
         
-        logger.debug(f"[SPIFF] script execution context {context}")
+        # Log the keys only; rendering large values here would cost as much as serializing them
+        logger.debug("[SPIFF] script execution context keys: %s", list(context))
         return context
     
     def check_for_overwrite(self, context, external_context):
@@ -116,24 +116,49 @@ class BpmnWorkflowConverter(WorkflowConverter):
         Returns:
             a dictionary representation of the workflow
         """
-        dct = super().to_dict(workflow)
+        dct = self.state_to_dict(workflow)
         dct['spec'] = self.registry.convert(workflow.spec)
         dct['subprocess_specs'] = self.mapping_to_dict(workflow.subprocess_specs)
+        return dct
+
+    def state_to_dict(self, workflow):
+        """Return the workflow's runtime state (tasks, data, subprocesses, events) without its specs.
+
+        :param workflow: the workflow
+
+        Returns:
+            a dictionary that can be restored with `from_dict` when the specs are supplied
+        """
+        dct = super().to_dict(workflow)
         dct['subprocesses'] = self.mapping_to_dict(workflow.subprocesses)
         dct['bpmn_events'] = self.registry.convert(workflow.bpmn_events)
         return dct
 
-    def from_dict(self, dct):
+    def specs_to_dict(self, workflow):
+        """Return the workflow's spec and subprocess specs, as `to_dict` would include them."""
+        return {
+            'spec': self.registry.convert(workflow.spec),
+            'subprocess_specs': self.mapping_to_dict(workflow.subprocess_specs),
+        }
+
+    def from_dict(self, dct, spec=None, subprocess_specs=None):
         """Create a workflow based on a dictionary representation.
 
         :param dct: the dictionary representation
+        :param spec: an already restored process spec (required if `dct` has no spec)
+        :param subprocess_specs: already restored subprocess specs, used along with `spec`
 
         Returns:
             a BPMN Workflow object
         """
-        # Restore the specs
-        spec = self.registry.restore(dct.pop('spec'))
-        subprocess_specs = self.mapping_from_dict(dct.pop('subprocess_specs', {}))
+        # Restore the specs, unless they were provided
+        if spec is None:
+            spec = self.registry.restore(dct.pop('spec'))
+            subprocess_specs = self.mapping_from_dict(dct.pop('subprocess_specs', {}))
+        else:
+            dct.pop('spec', None)
+            dct.pop('subprocess_specs', None)
+            subprocess_specs = subprocess_specs or {}
 
         # Create the top-level workflow
         workflow = self.target_class(spec, subprocess_specs, deserializing=True)
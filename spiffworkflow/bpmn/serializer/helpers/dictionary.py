@@ -47,12 +47,14 @@ class DictionaryConverter:
         typenames (dict): a mapping class to typename
         convert_to_dict (dict): a mapping of typename to function
         convert_from_dct (dict): a mapping of typename to function
+        converters (dict): a mapping of typename to the object providing `to_dict`, when it is a bound method
     """
 
     def __init__(self):
         self.convert_to_dict = { }
         self.convert_from_dict = { }
         self.typenames = { }
+        self.converters = { }
 
     def register(self, cls, to_dict, from_dict, typename=None):
         """Register a conversion/restoration.
@@ -69,6 +71,7 @@ class DictionaryConverter:
         """
         typename = cls.__name__ if typename is None else typename
         self.typenames[cls] = typename
+        self.converters[typename] = getattr(to_dict, '__self__', None)
         self.convert_to_dict[typename] = partial(self._obj_to_dict, typename, to_dict)
         self.convert_from_dict[typename] = partial(self._obj_from_dict, from_dict)
 
@@ -22,21 +22,35 @@ from datetime import datetime, timedelta
 
 from .dictionary import DictionaryConverter
 
+# Types that are never registered and are returned unchanged by `convert`
+_PASSTHROUGH_TYPES = frozenset((str, int, float, bool, type(None)))
+
 class DefaultRegistry(DictionaryConverter):
     """This class forms the basis of serialization for BPMN workflows.
 
     It contains serialization rules for a few python data types that are not JSON serializable by default which
     are used internally by Spiff.  It can be instantiated and customized to handle arbitrary task or workflow
     data as well (see `dictionary.DictionaryConverter`).
+
+    Registered classes are also indexed directly by class, so converting a known object is a single
+    dictionary lookup rather than a typename lookup followed by a converter lookup.
+
+    A configured registry is only read during conversion, so one instance can be shared between threads.
     """
     def __init__(self):
 
         super().__init__()
+        self.class_converters = { }
         self.register(UUID, lambda v: { 'value': str(v) }, lambda v: UUID(v['value']))
         self.register(datetime, lambda v:  { 'value': v.isoformat() }, lambda v: datetime.fromisoformat(v['value']))
         self.register(timedelta, lambda v: { 'days': v.days, 'seconds': v.seconds }, lambda v: timedelta(**v))
 
-    def convert(self, obj):
+    def register(self, cls, to_dict, from_dict, typename=None):
+        """Register a conversion/restoration (see `DictionaryConverter.register`)."""
+        super().register(cls, to_dict, from_dict, typename)
+        self.class_converters[cls] = self.convert_to_dict[self.typenames[cls]]
+
+    def convert(self, obj, **kwargs):
         """Convert an object to a dictionary, with preprocessing.
 
         Arguments:
@@ -45,8 +59,14 @@ class DefaultRegistry(DictionaryConverter):
         Returns:
             the result of `convert` conversion after preprocessing
         """
+        cls = obj.__class__
+        if cls in _PASSTHROUGH_TYPES and cls not in self.class_converters:
+            return obj
         cleaned = self.clean(obj)
-        return super().convert(cleaned)
+        to_dict = self.class_converters.get(cleaned.__class__)
+        if to_dict is not None:
+            return to_dict(cleaned, **kwargs)
+        return super().convert(cleaned, **kwargs)
 
     def clean(self, obj):
         """A method that can be used to preprocess an object before conversion to a dict.
@@ -60,6 +80,8 @@ class DefaultRegistry(DictionaryConverter):
             the preprocessed object
         """
         if isinstance(obj, dict):
-            return dict((k, v) for k, v in obj.items() if not callable(v))
+            # Read the values directly so task data doesn't copy values it shares with other tasks;
+            # conversion builds new containers and never modifies them.
+            return dict((k, v) for k, v in dict.items(obj) if not callable(v))
         else:
             return obj
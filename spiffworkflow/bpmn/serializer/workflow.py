@@ -18,6 +18,7 @@
 # 02110-1301  USA
 
 import json, gzip
+import threading
 
 from .migration.version_migration import MIGRATIONS
 from .helpers import DefaultRegistry
@@ -52,6 +53,28 @@ class BpmnWorkflowSerializer:
 
     VERSION_KEY = "serializer_version"  # Why is this customizable?
 
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Return a process-wide serializer with the default configuration.
+
+        Building a serializer instantiates every converter in `DEFAULT_CONFIG`; the shared instance does
+        this once.  Its registry is only read while serializing, so it can be used from any thread, but it
+        must not be reconfigured; create a separate serializer for custom conversions.
+
+        Returns:
+            the shared `BpmnWorkflowSerializer`
+        """
+        shared = cls.__dict__.get('_shared')
+        if shared is None:
+            with cls._shared_lock:
+                shared = cls.__dict__.get('_shared')
+                if shared is None:
+                    shared = cls._shared = cls()
+        return shared
+
     @staticmethod
     def configure(config=None, registry=None):
         """Can be used to create a with custom Spiff classes.
@@ -128,6 +151,74 @@ class BpmnWorkflowSerializer:
         self.migrate(dct)
         return self.from_dict(dct)
 
+    def serialize_state_json(self, workflow):
+        """Serialize the workflow's runtime state to JSON, leaving out the spec and subprocess specs.
+
+        Arguments:
+            workflow: the workflow to serialize
+
+        Returns:
+            a JSON dump of the state-only dictionary representation
+        """
+        dct = self._workflow_converter(workflow).state_to_dict(workflow)
+        dct['typename'] = self.registry.typenames[workflow.__class__]
+        dct[self.VERSION_KEY] = self.VERSION
+        return json.dumps(dct, cls=self.json_encoder_cls)
+
+    def serialize_spec_json(self, workflow):
+        """Serialize the workflow's spec and subprocess specs to JSON.
+
+        Arguments:
+            workflow: the workflow whose specs should be serialized
+
+        Returns:
+            a JSON dump of a dictionary with `spec` and `subprocess_specs` keys
+        """
+        dct = self._workflow_converter(workflow).specs_to_dict(workflow)
+        dct[self.VERSION_KEY] = self.VERSION
+        return json.dumps(dct, cls=self.json_encoder_cls)
+
+    def deserialize_spec_json(self, serialization):
+        """Restore the specs from `serialize_spec_json`.
+
+        Arguments:
+            serialization: the serialized specs
+
+        Returns:
+            tuple: the process spec and a dictionary of subprocess specs
+        """
+        dct = json.loads(serialization, cls=self.json_decoder_cls)
+        dct.pop(self.VERSION_KEY, None)
+        spec = self.registry.restore(dct['spec'])
+        subprocess_specs = dict((k, self.registry.restore(v)) for k, v in dct.get('subprocess_specs', {}).items())
+        return spec, subprocess_specs
+
+    def deserialize_state_json(self, serialization, spec, subprocess_specs=None):
+        """Restore a workflow from `serialize_state_json` against already restored specs.
+
+        Specs are not modified by running a workflow, so the same spec objects can be shared by
+        every workflow restored from them.
+
+        Arguments:
+            serialization: the serialized state
+            spec: the process spec
+            subprocess_specs (dict): the subprocess specs
+
+        Returns:
+            the restored workflow
+        """
+        dct = json.loads(serialization, cls=self.json_decoder_cls)
+        version = dct.pop(self.VERSION_KEY)
+        if version != self.VERSION:
+            raise ValueError(f"State-only serializations cannot be migrated (found version {version})")
+        return self.from_dict(dct, spec=spec, subprocess_specs=subprocess_specs)
+
+    def _workflow_converter(self, workflow):
+        converter = self.registry.converters.get(self.registry.typenames.get(workflow.__class__))
+        if converter is None or not hasattr(converter, 'state_to_dict'):
+            raise TypeError(f"No state serialization is registered for {workflow.__class__.__name__}")
+        return converter
+
     def get_version(self, serialization):
         """Get the version specified in the serialization
 
@@ -23,6 +23,7 @@ from collections.abc import Iterable, Sequence, Mapping, MutableSequence, Mutabl
 from spiffworkflow.specs.base import TaskSpec
 from spiffworkflow.util.task import TaskState
 from spiffworkflow.util.deep_merge import DeepMerge
+from spiffworkflow.util.task_data import TaskData
 from spiffworkflow.bpmn.specs.bpmn_task_spec import BpmnTaskSpec
 from spiffworkflow.bpmn.exceptions import WorkflowDataException
 
@@ -131,6 +132,9 @@ class MultiInstanceTask(LoopTask):
                 self.raise_data_exception("Expected an output item", child)
             item = self.output_item.get(child)
             key_or_index = child.internal_data.get('key_or_index')
+            if isinstance(my_task.data, TaskData) and self.data_output.bpmn_id in my_task.data:
+                # The output is updated in place, so it can't stay shared with other tasks
+                my_task.data.own(self.data_output.bpmn_id)
             data_output = self.data_output.get(my_task)
             data_input = self.data_input.get(my_task) if self.data_input is not None else None
             if key_or_index is not None and (isinstance(data_output, Mapping) or data_input is data_output):
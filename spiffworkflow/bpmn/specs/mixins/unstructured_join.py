@@ -16,7 +16,6 @@
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
 # 02110-1301  USA
-from copy import deepcopy
 
 from spiffworkflow.util.task import TaskState, TaskIterator
 from spiffworkflow.specs.Join import Join
@@ -50,7 +49,7 @@ class UnstructuredJoin(Join):
         for task in sorted(other_tasks, key=lambda t: t.last_state_change):
             # By inheriting directly from parent tasks, we can avoid copying previouly merged data
 
-            my_task.set_data(**deepcopy(task.parent.data))
+            my_task.data.update(task.parent.data)
             # This condition only applies when a workflow is reset inside a parallel branch.
             # If reset to a branch that was originally cancelled, all the descendants of the previously completed branch will still
             # appear in the tree, potentially corrupting the structure and data.
@@ -19,7 +19,7 @@
 
 from spiffworkflow import Workflow
 from spiffworkflow.exceptions import TaskNotFoundException
-from .task import BpmnTaskIterator
+from .task import BpmnTaskIterator, BpmnTaskFilter
 
 class BpmnBaseWorkflow(Workflow):
 
@@ -32,9 +32,27 @@ class BpmnBaseWorkflow(Workflow):
     def data_objects(self):
         return self.data.get('data_objects', {})
 
+    _INDEXED_QUERY_ARGS = Workflow._INDEXED_QUERY_ARGS | frozenset(['skip_subprocesses', 'catches_event', 'lane'])
+
     def get_tasks_iterator(self, first_task=None, **kwargs):
+        # The index only covers this workflow's own tasks, so queries that descend into subprocesses walk the tree
+        if first_task is None and self._can_use_state_index(kwargs) and (
+            kwargs.get('skip_subprocesses', False) or not self._has_subprocesses()
+        ):
+            kwargs = dict((k, v) for k, v in kwargs.items() if k != 'skip_subprocesses')
+            return self._iter_indexed_tasks(kwargs.pop('task_filter', None) or BpmnTaskFilter(**kwargs))
         return BpmnTaskIterator(first_task or self.task_tree, **kwargs)
 
+    def _task_ready(self, task):
+        # Feed the top workflow's engine queue while `do_engine_steps` is running
+        queue = self.top_workflow._ready_queue
+        if queue is not None:
+            queue.append(task)
+
+    def _has_subprocesses(self):
+        """Whether any subprocess is attached to a task in this workflow"""
+        return any(task_id in self.tasks for task_id in self.top_workflow.subprocesses)
+
 
 class BpmnSubWorkflow(BpmnBaseWorkflow):
 
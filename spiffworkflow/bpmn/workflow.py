@@ -19,6 +19,9 @@
 
 import sys
 import os
+import time
+import heapq
+from itertools import count as counter
 
 # Add project root to path to import logger
 _current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -46,12 +49,43 @@ from .script_engine.python_engine import PythonScriptEngine
 logger = get_logger("spiffworkflow.bpmn")
 
 
+class _ReadyQueue:
+    """Queue of READY tasks for `BpmnWorkflow.do_engine_steps`.
+
+    Tasks in deeper subprocesses come out first, and tasks at the same depth come out in the order they were
+    added, which matches the order of the former pass-based engine loop (subprocesses before their parents).
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = counter()
+
+    def append(self, task):
+        heapq.heappush(self._heap, (-task.workflow.depth, next(self._sequence), task))
+
+    def extend(self, tasks):
+        for task in tasks:
+            self.append(task)
+
+    def popleft(self):
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self):
+        return len(self._heap)
+
+
 class BpmnWorkflow(BpmnBaseWorkflow):
     """
     The engine that executes a BPMN workflow. This specialises the standard
     Spiff Workflow class with a few extra methods and attributes.
     """
 
+    # Default limit on the number of tasks a single `do_engine_steps` call may run (None for no limit)
+    MAX_ENGINE_STEPS = None
+
+    # Tasks becoming READY are appended here while `do_engine_steps` is running
+    _ready_queue = None
+
     def __init__(self, spec, subprocess_specs=None, script_engine=None, **kwargs):
         """
         Constructor.
@@ -167,73 +201,71 @@ class BpmnWorkflow(BpmnBaseWorkflow):
         iter = self.get_tasks_iterator(state=TaskState.WAITING, spec_class=CatchingEvent)
         return [t.task_spec.event_definition.details(t) for t in iter]
 
-    def do_engine_steps(self, will_complete_task=None, did_complete_task=None):
+    def do_engine_steps(self, will_complete_task=None, did_complete_task=None, max_steps=None, task_timer=None):
         """
         Execute any READY tasks that are engine specific (for example, gateways
-        or script tasks). This is done in a loop, so it will keep completing
-        those tasks until there are only READY User tasks, or WAITING tasks
-        left.
+        or script tasks). This keeps completing those tasks until there are
+        only READY User tasks, or WAITING tasks left.
+
+        Tasks are run from a queue: it is seeded with the READY tasks of every
+        active subprocess and of this workflow, and every task that becomes
+        READY while the engine runs is added to it. Each task is therefore
+        picked up once, without rescanning the workflows. Tasks in deeper
+        subprocesses run first.
 
         :param will_complete_task: Callback that will be called prior to completing a task
         :param did_complete_task: Callback that will be called after completing a task
+        :param max_steps: stop after running this many tasks (defaults to `MAX_ENGINE_STEPS`; None for no limit)
+        :param task_timer: Callback that will be called with each task and the seconds it took to run
+
+        :returns: the number of tasks that were run
         """
         logger.debug(f"[SPIFF] ========== do_engine_steps STARTED ==========")
-        
-        def update_workflow(wf):
-            count = 0
-            # Wanted to use the iterator method here, but at least this is a shorter list
-            ready_tasks = wf.get_tasks(state=TaskState.READY)
-            logger.debug(f"[SPIFF] update_workflow - Found {len(ready_tasks)} READY tasks in workflow")
-            
-            for task in ready_tasks:
-                task_type = type(task.task_spec).__name__
-                task_name = getattr(task.task_spec, 'bpmn_name', task.task_spec.name)
-                task_id = getattr(task.task_spec, 'bpmn_id', task.task_spec.name)
-                is_manual = task.task_spec.manual
-                
-                logger.debug(f"[SPIFF] Processing task: {task_id} ({task_name}) - Type: {task_type}, Manual: {is_manual}, State: {task.state}")
-                
-                if not is_manual:
+        max_steps = self.MAX_ENGINE_STEPS if max_steps is None else max_steps
+
+        queue = _ReadyQueue()
+        for subprocess in sorted(self.get_active_subprocesses(), key=lambda v: v.depth, reverse=True):
+            queue.extend(subprocess.get_tasks(state=TaskState.READY, skip_subprocesses=True))
+        queue.extend(self.get_tasks(state=TaskState.READY, skip_subprocesses=True))
+        logger.debug(f"[SPIFF] Seeded engine queue with {len(queue)} READY tasks")
+
+        count = 0
+        self._ready_queue = queue
+        try:
+            while queue:
+                while queue:
+                    task = queue.popleft()
+                    if task.state != TaskState.READY or task.task_spec.manual or task.id not in task.workflow.tasks:
+                        continue
+                    if max_steps is not None and count >= max_steps:
+                        logger.warning(f"[SPIFF] Engine step budget of {max_steps} reached; stopping with tasks still READY")
+                        return count
+
+                    task_id = getattr(task.task_spec, 'bpmn_id', task.task_spec.name)
+                    task_type = type(task.task_spec).__name__
                     logger.info(f"[SPIFF] >> EXECUTING non-manual task: {task_id} ({task_type})")
                     if will_complete_task is not None:
                         will_complete_task(task)
+                    started = time.perf_counter()
                     task.run()
+                    elapsed = time.perf_counter() - started
                     count += 1
                     logger.info(f"[SPIFF] << COMPLETED task: {task_id} ({task_type}) - Total executed: {count}")
+                    if task_timer is not None:
+                        task_timer(task, elapsed)
                     if did_complete_task is not None:
                         did_complete_task(task)
-                else:
-                    logger.debug(f"[SPIFF] Skipping manual task: {task_id} ({task_type})")
-            
-            logger.debug(f"[SPIFF] update_workflow - Executed {count} tasks")
-            return count
-
-        active_subprocesses = self.get_active_subprocesses()
-        logger.debug(f"[SPIFF] Found {len(active_subprocesses)} active subprocesses")
-        
-        for subprocess in sorted(active_subprocesses, key=lambda v: v.depth, reverse=True):
-            logger.debug(f"[SPIFF] Processing subprocess at depth {subprocess.depth}")
-            count = None
-            iteration = 0
-            while count is None or count > 0:
-                iteration += 1
-                logger.debug(f"[SPIFF] Subprocess iteration {iteration}")
-                count = update_workflow(subprocess)
-            if subprocess.parent_task_id is not None:
-                task = self.get_task_from_id(subprocess.parent_task_id)
-                task.task_spec._update(task)
-
-        logger.debug(f"[SPIFF] Processing main workflow")
-        count = update_workflow(self)
-        logger.debug(f"[SPIFF] Main workflow executed {count} tasks")
-        
-        new_subprocesses = len(self.get_active_subprocesses())
-        if count > 0 or new_subprocesses > len(active_subprocesses):
-            logger.debug(f"[SPIFF] Recursing into do_engine_steps (count={count}, new_subprocesses={new_subprocesses})")
-            self.do_engine_steps(will_complete_task, did_complete_task)
-        else:
-            logger.debug(f"[SPIFF] ========== do_engine_steps COMPLETED ==========")
 
+                # Let tasks waiting on subprocesses notice completed ones; anything that becomes READY is queued
+                for subprocess in sorted(self.get_active_subprocesses(), key=lambda v: v.depth, reverse=True):
+                    if subprocess.parent_task_id is not None:
+                        task = self.get_task_from_id(subprocess.parent_task_id)
+                        task.task_spec._update(task)
+        finally:
+            self._ready_queue = None
+
+        logger.debug(f"[SPIFF] ========== do_engine_steps COMPLETED ({count} tasks) ==========")
+        return count
 
     def refresh_waiting_tasks(self, will_refresh_task=None, did_refresh_task=None):
         """
@@ -19,11 +19,14 @@
 
 import logging
 import re
+from collections import ChainMap
 
 from spiffworkflow.exceptions import SpiffWorkflowException
 from spiffworkflow.bpmn.exceptions import WorkflowTaskException
+from spiffworkflow.bpmn.script_engine import PythonScriptEngine, TaskDataEnvironment
 
 from ..specs.model import HitPolicy
+from .compiled_table import CompiledDecisionTable
 
 logger = logging.getLogger('spiff.dmn')
 
@@ -35,8 +38,12 @@ class DMNEngine:
 
     def __init__(self, decision_table):
         self.decision_table = decision_table
+        self.compiled_table = CompiledDecisionTable(decision_table)
 
     def decide(self, task):
+        scope = self._evaluation_globals(task)
+        if scope is not None:
+            return self.compiled_table.decide(scope, task.data, task)
         rules = []
         for rule in self.decision_table.rules:
             if self.__check_rule(rule, task):
@@ -48,21 +55,68 @@ class DMNEngine:
     def result(self, task):
         """Returns the results of running this decision table against
         a given task."""
-        result = {}
+        scope = self._evaluation_globals(task)
+        if scope is not None:
+            matched_rules = self.compiled_table.decide(scope, task.data, task)
+            return self._combine(matched_rules, lambda rule: self.compiled_table.output(rule, scope, task))
         matched_rules = self.decide(task)
+        return self._combine(matched_rules, lambda rule: rule.output_as_dict(task))
+
+    def results(self, rows, task=None):
+        """Returns the results of running this decision table against each of the given rows.
+
+        Each row is a dictionary evaluated the way task data would be.  If a task is given, its data
+        is available to the table as well (values in the row take precedence) and expressions are
+        evaluated with the globals of its script engine's `TaskDataEnvironment`.  The table is only
+        compiled once, so this is much cheaper than running a task per row.
+
+        Arguments:
+            rows (list(dict)): the input data
+            task (`Task`): an optional task providing additional data
+
+        Returns:
+            list(dict): the result for each row
+        """
+        environment = getattr(task.workflow.script_engine, 'environment', None) if task is not None else None
+        if not isinstance(environment, TaskDataEnvironment):
+            environment = TaskDataEnvironment()
+        base = environment.evaluation_globals(environment._flatten_dict(task.data if task is not None else {}))
+
+        results = []
+        for row in rows:
+            scope = dict(base)
+            scope.update(environment._flatten_dict(row))
+            data = ChainMap(row, task.data) if task is not None else row
+            matched_rules = self.compiled_table.decide(scope, data, task)
+            results.append(self._combine(matched_rules, lambda rule: self.compiled_table.output(rule, scope, task)))
+        return results
+
+    def _combine(self, matched_rules, output):
+        result = {}
         if self.decision_table.hit_policy == HitPolicy.COLLECT.value:
             # each output will be an array of values, all outputs will
             # be placed in a dict, which we will then merge.
             for rule in matched_rules:
-                rule_output = rule.output_as_dict(task)
+                rule_output = output(rule)
                 for key in rule_output.keys():
                     if key not in result:
                         result[key] = []
                     result[key].append(rule_output[key])
         elif len(matched_rules) > 0:
-            result = matched_rules[0].output_as_dict(task)
+            result = output(matched_rules[0])
         return result
 
+    def _evaluation_globals(self, task):
+        """The globals the compiled table is evaluated with, or None if the task's script engine
+        evaluates expressions some other way (those keep going through `script_engine.evaluate`)."""
+        script_engine = task.workflow.script_engine
+        environment = getattr(script_engine, 'environment', None)
+        if type(script_engine).evaluate is not PythonScriptEngine.evaluate or \
+                not isinstance(environment, TaskDataEnvironment) or \
+                type(environment).evaluate is not TaskDataEnvironment.evaluate:
+            return None
+        return environment.evaluation_globals(environment._flatten_dict(task.data))
+
 
     def __check_rule(self, rule, task):
         for input_entry in rule.inputEntries:
@@ -0,0 +1,277 @@
+# Copyright (C) 2023 Sartography
+#
+# This file is part of SpiffWorkflow.
+#
+# SpiffWorkflow is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3.0 of the License, or (at your option) any later version.
+#
+# SpiffWorkflow is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301  USA
+
+import ast
+import re
+
+from spiffworkflow.exceptions import SpiffWorkflowException
+from spiffworkflow.bpmn.exceptions import WorkflowTaskException
+from spiffworkflow.bpmn.script_engine.python_environment import compile_expression
+
+from ..specs.model import HitPolicy
+
+# The name the input value is bound to in match expressions
+INPUT_VALUE = 'dmninputexpr'
+
+# A '?' outside of quotes stands for the input value (eg "4 < ? < 6")
+_QUESTION_MARK = re.compile(r'(\?)(?=(?:[^\'"]|[\'"][^\'"]*[\'"])*$)')
+
+# Input values of these types can be looked up in an equality index; they hash consistently with
+# the literals they compare equal to
+_INDEXABLE_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _error(message, task, exception):
+    if task is not None:
+        return WorkflowTaskException(message, task=task, exception=exception)
+    return SpiffWorkflowException(message)
+
+
+class _Expression:
+    """An expression compiled once and evaluated against prepared globals.
+
+    Syntax errors are kept and raised when the expression is evaluated, so that a broken
+    cell fails the decision that reaches it rather than the parse.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        try:
+            self.code = compile_expression(text)
+            self.syntax_error = None
+        except SyntaxError as exc:
+            self.code = None
+            self.syntax_error = exc
+
+    def evaluate(self, scope, task):
+        if self.syntax_error is not None:
+            raise self.syntax_error
+        try:
+            return eval(self.code, scope)
+        except SpiffWorkflowException:
+            raise
+        except Exception as exc:
+            raise _error(f"Error evaluating expression '{self.text}'", task, exc)
+
+
+class _Cell:
+    """One non-empty input entry condition of a rule."""
+
+    def __init__(self, column, input_expression, match_expr):
+        self.column = column
+        self.literal = None
+        self.uses_value = True
+        if _QUESTION_MARK.search(match_expr) is not None:
+            self.expression = _Expression(_QUESTION_MARK.sub(INPUT_VALUE, match_expr))
+        elif self._is_expression(match_expr):
+            # Equality with the input value
+            self.expression = _Expression(f'({INPUT_VALUE}) == ({match_expr})')
+            try:
+                literal = ast.literal_eval(match_expr.strip())
+                if type(literal) in _INDEXABLE_TYPES:
+                    self.literal = (literal, )
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+                pass
+        elif input_expression is not None:
+            # The match expression starts with an operator ("> 5", "in ['a', 'b']"); the input
+            # expression is prefixed as text so operator precedence is the same as it always was
+            self.uses_value = False
+            self.expression = _Expression(input_expression + match_expr)
+        else:
+            self.expression = _Expression(f'{INPUT_VALUE} {match_expr}')
+
+    @staticmethod
+    def _is_expression(text):
+        try:
+            ast.parse(text)
+            return True
+        except SyntaxError:
+            # Only a valid partial expression gets prefixed; anything else fails when evaluated
+            ast.parse(f'v {text}')
+            return False
+
+    def matches(self, inputs, scope, task):
+        if self.uses_value:
+            scope[INPUT_VALUE] = inputs.get(self.column)
+        return self.expression.evaluate(scope, task)
+
+
+class _BrokenCell:
+    """A cell whose text can't be used as a condition at all; it fails when it is reached."""
+
+    literal = None
+
+    def __init__(self, column, exception):
+        self.column = column
+        self.exception = exception
+
+    def matches(self, inputs, scope, task):
+        raise self.exception
+
+
+class _InputValues:
+    """The decision's input values, each evaluated the first time a cell needs it."""
+
+    def __init__(self, table, scope, data, task):
+        self.table = table
+        self.scope = scope
+        self.data = data
+        self.task = task
+        self.values = {}
+
+    def get(self, column):
+        if column not in self.values:
+            expression = self.table.input_expressions[column]
+            if expression is not None:
+                self.values[column] = expression.evaluate(self.scope, self.task)
+            else:
+                # Backwards compatibility: inputs without an expression use the value named by their label
+                self.values[column] = self.data[self.table.inputs[column].label]
+        return self.values[column]
+
+
+class CompiledDecisionTable:
+    """A decision table prepared for repeated evaluation.
+
+    Every input expression, input entry and output entry is compiled once.  Within a decision each
+    input expression is evaluated at most once, and input columns whose entries are all literals
+    (or empty) are indexed by value, so matching a row is a dictionary lookup rather than a scan.
+
+    Matching follows `DMNEngine.decide`: rules are checked in order, a UNIQUE table stops at the
+    first match, and errors carry the row number of the rule being checked.
+    """
+
+    def __init__(self, decision_table):
+        self.decision_table = decision_table
+        self.rules = decision_table.rules
+        self.unique = decision_table.hit_policy == HitPolicy.UNIQUE.value
+
+        self.inputs = []
+        self.input_expressions = []
+        self._columns = {}
+        for item in decision_table.inputs:
+            self._column(item)
+
+        self.cells = [self._compile_cells(rule) for rule in self.rules]
+        self.outputs = dict(
+            (id(rule), [_Expression(entry.text) if getattr(entry, 'text', None) else None for entry in rule.outputEntries])
+            for rule in self.rules
+        )
+        self.indexes = self._build_indexes()
+
+    def _column(self, item):
+        if id(item) not in self._columns:
+            self._columns[id(item)] = len(self.inputs)
+            self.inputs.append(item)
+            self.input_expressions.append(_Expression(item.expression) if item.expression else None)
+        return self._columns[id(item)]
+
+    def _compile_cells(self, rule):
+        cells = []
+        for entry in rule.inputEntries:
+            column = self._column(entry.input)
+            for lhs in entry.lhs:
+                if lhs is None:
+                    continue
+                try:
+                    cells.append(_Cell(column, entry.input.expression or None, lhs))
+                except Exception as exc:
+                    cells.append(_BrokenCell(column, exc))
+        return cells
+
+    def _build_indexes(self):
+        """{column: ({value: set(rows)}, set(rows matching any value))} for all-literal columns"""
+        indexes = {}
+        for column in range(len(self.inputs)):
+            by_value, any_value = {}, set()
+            for row, cells in enumerate(self.cells):
+                column_cells = [cell for cell in cells if cell.column == column]
+                if len(column_cells) == 0:
+                    any_value.add(row)
+                elif len(column_cells) == 1 and column_cells[0].literal is not None:
+                    by_value.setdefault(column_cells[0].literal[0], set()).add(row)
+                else:
+                    break
+            else:
+                if by_value:
+                    indexes[column] = (by_value, any_value)
+        return indexes
+
+    def _candidates(self, inputs):
+        """Rows that can still match after consulting the indexes, and the columns they settled"""
+        rows, settled = None, set()
+        for column, (by_value, any_value) in self.indexes.items():
+            try:
+                value = inputs.get(column)
+            except Exception:
+                # Let the row scan reach (and report) the failure where the table would have
+                continue
+            if type(value) not in _INDEXABLE_TYPES:
+                continue
+            matching = by_value.get(value, set()) | any_value
+            rows = matching if rows is None else rows & matching
+            settled.add(column)
+        if rows is None:
+            return range(len(self.rules)), settled
+        return sorted(rows), settled
+
+    def decide(self, scope, data, task=None):
+        """Returns the rules matching the data `scope` was built from.
+
+        Arguments:
+            scope (dict): the globals expressions are evaluated with (this is modified)
+            data (dict): the data, for inputs that are looked up by label
+            task (`Task`): the task being evaluated, if any, for error reporting
+
+        Returns:
+            list(`Rule`): the matching rules, in table order
+        """
+        inputs = _InputValues(self, scope, data, task)
+        candidates, settled = self._candidates(inputs)
+        matched = []
+        for row in candidates:
+            if self._check(row, settled, inputs, scope, task):
+                matched.append(self.rules[row])
+                if self.unique:
+                    break
+        return matched
+
+    def _check(self, row, settled, inputs, scope, task):
+        row_number = self.rules[row].row_number
+        for cell in self.cells[row]:
+            if cell.column in settled:
+                continue
+            try:
+                if not cell.matches(inputs, scope, task):
+                    return False
+            except SpiffWorkflowException as se:
+                se.add_note(f"Rule failed on row {row_number}")
+                raise se
+            except Exception as e:
+                error = _error(str(e), task, e)
+                error.add_note(f"Failed to execute DMN Rule on row {row_number}")
+                raise error
+        return True
+
+    def output(self, rule, scope, task=None):
+        """Returns the output of a matched rule"""
+        scope.pop(INPUT_VALUE, None)
+        expressions = self.outputs[id(rule)]
+        values = [expr.evaluate(scope, task) if expr is not None else "" for expr in expressions]
+        return rule.build_output(values)
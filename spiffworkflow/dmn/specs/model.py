@@ -102,14 +102,20 @@ class Rule:
 
     def output_as_dict(self, task):
         script_engine = task.workflow.script_engine
-        out = OrderedDict()
+        values = []
         for outputEntry in self.outputEntries:
-            # try to use the id, but fall back to label if no name is provided.
-            key = outputEntry.output.name or outputEntry.output.label
             if hasattr(outputEntry, "text") and outputEntry.text:
-                outvalue = script_engine.evaluate(task, outputEntry.text)
+                values.append(script_engine.evaluate(task, outputEntry.text))
             else:
-                outvalue = ""
+                values.append("")
+        return self.build_output(values)
+
+    def build_output(self, values):
+        """Arrange the evaluated output entries (in outputEntries order) as this rule's output."""
+        out = OrderedDict()
+        for outputEntry, outvalue in zip(self.outputEntries, values):
+            # try to use the id, but fall back to label if no name is provided.
+            key = outputEntry.output.name or outputEntry.output.label
             if '.' in key:         # we need to allow for dot notation in the DMN -
                                    # I would use box to do this, but they didn't have a feature to build
                                    # a dict based on a dot notation withoug eval
@@ -532,7 +532,8 @@ class DictionarySerializer(Serializer):
         task = Task(workflow, task_spec, parent, id=task_id)
 
         task.children = self._deserialize_task_children(task, s_state, ignored_specs)
-        task._state = s_state['state']
+        previous_state, task._state = task._state, s_state['state']
+        workflow._index_task(task, previous_state)
         task.triggered = s_state['triggered']
         task.last_state_change = s_state['last_state_change']
         task.data = self.deserialize_dict(s_state['data'])
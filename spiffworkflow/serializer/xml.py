@@ -723,7 +723,8 @@ class XmlSerializer(Serializer):
         state_name = elem.findtext('state')
         state_value = TaskState.get_value(state_name)
         assert state_value is not None
-        task._state = state_value
+        previous_state, task._state = task._state, state_value
+        workflow._index_task(task, previous_state)
         task.triggered = elem.find('triggered') is not None
         task.last_state_change = float(elem.findtext('last-state-change'))
         task.data = self.deserialize_value_map(elem.find('data'))
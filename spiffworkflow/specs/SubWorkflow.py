@@ -101,6 +101,8 @@ class SubWorkflow(TaskSpec):
         # I don't necessarily like this, but I can't say I like anything about subproceses work here
         for task in subworkflow.task_tree:
             my_task.workflow.tasks[task.id] = task
+        # The spliced tasks change state in the subworkflow's index, not ours
+        my_task.workflow.state_index_enabled = False
         subworkflow.tasks[my_task.id] = my_task
         subworkflow.task_tree.parent = my_task
         my_task._children.insert(0, subworkflow.task_tree.id)
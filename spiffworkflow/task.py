@@ -25,6 +25,7 @@ from uuid import uuid4
 
 from .util.task import TaskState, TaskFilter, TaskIterator
 from .util.deep_merge import DeepMerge
+from .util.task_data import TaskData
 from .exceptions import WorkflowException
 
 logger = logging.getLogger('spiff.task')
@@ -41,7 +42,7 @@ class Task(object):
         triggered (bool): True if the task is not part of output specification of the task spec
         task_spec (`TaskSpec`): the spec associated with this task
         thread_id (int): a thread id for this task
-        data (dict): a dictionary containing data for this task
+        data (`TaskData`): a dictionary containing data for this task
         internal_data (dict): a dictionary containing information relevant to the task state or execution
         last_state_change (float): the timestamp when this task last changed state
         thread_id (int): a thread identifier
@@ -76,6 +77,7 @@ class Task(object):
         self._parent = parent.id if parent is not None else None
         self._children = []
         self._state = state
+        workflow._index_task(self)
 
         self.triggered = False
         self.task_spec = task_spec
@@ -105,6 +107,18 @@ class Task(object):
             )
         self._set_state(value)
 
+    @property
+    def data(self):
+        """`TaskData`: this task's data
+
+        Any dictionary assigned here is converted to `TaskData`.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value if isinstance(value, TaskData) else TaskData(value)
+
     @property
     def parent(self):
         """`Task`: This task's parent task"""
@@ -294,7 +308,8 @@ class Task(object):
         if value != self.state:
             elapsed = time.time() - self.last_state_change
             self.last_state_change = time.time()
-            self._state = value
+            previous_state, self._state = self._state, value
+            self.workflow._index_task(self, previous_state)
             logger.info(
                 f'State changed to {TaskState.get_name(value)}',
                 extra=self.collect_log_extras({'elapsed': elapsed})
@@ -314,8 +329,11 @@ class Task(object):
         return self.thread_id
 
     def _inherit_data(self):
-        """Copies the data from the parent."""
-        self.set_data(**deepcopy(self.parent.data))
+        """Copies the data from the parent.
+
+        Values are shared with the parent until either task modifies them (see `TaskData`).
+        """
+        self.data.update(self.parent.data)
 
     def _set_internal_data(self, **kwargs):
         """Defines the given attribute/value pairs in this task's internal data."""
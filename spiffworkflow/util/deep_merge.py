@@ -17,6 +17,9 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
 # 02110-1301  USA
 
+from .task_data import TaskData
+
+
 class DeepMerge(object):
     # Merges two deeply nested json-like dictionaries,
     # useful for updating things like task data.
@@ -38,15 +41,20 @@ class DeepMerge(object):
                 if a[key] == b[key]:
                     continue
                 elif isinstance(a[key], dict) and isinstance(b[key], dict):
-                    DeepMerge.merge(a[key], b[key], path + [str(key)])
+                    DeepMerge.merge(DeepMerge._own(a, key), b[key], path + [str(key)])
                 elif isinstance(a[key], list) and isinstance(b[key], list):
-                    DeepMerge.merge_array(a[key], b[key], path + [str(key)])
+                    DeepMerge.merge_array(DeepMerge._own(a, key), b[key], path + [str(key)])
                 else:
                     a[key] = b[key]  # Just overwrite the value in a.
             else:
                 a[key] = b[key]
         return a
 
+    @staticmethod
+    def _own(a, key):
+        # Values task data shares with other tasks are copied before they are merged into
+        return a.own(key) if isinstance(a, TaskData) else a[key]
+
     @staticmethod
     def merge_array(a, b, path=None):
 
@@ -0,0 +1,167 @@
+# Copyright (C) 2023 Sartography
+#
+# This file is part of SpiffWorkflow.
+#
+# SpiffWorkflow is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3.0 of the License, or (at your option) any later version.
+#
+# SpiffWorkflow is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301  USA
+
+from copy import deepcopy
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+# Values of these types can't be changed in place, so they never need to be copied
+_IMMUTABLE_TYPES = frozenset([
+    str, bytes, int, float, complex, bool, type(None), range,
+    date, datetime, time, timedelta, Decimal, UUID,
+])
+
+
+def _is_immutable(value):
+    if value.__class__ in _IMMUTABLE_TYPES:
+        return True
+    if value.__class__ is tuple or value.__class__ is frozenset:
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+class TaskData(dict):
+    """A copy-on-write dictionary for task data.
+
+    When one TaskData is updated from (or copied from) another, the mutable values are not copied:
+    both dictionaries hold the same objects and remember those keys as shared.  Reading a value
+    (item access, `get`, `items`, `values`, ...) returns it as it is, so conditions and other code
+    that only read data never copy anything.  Code that modifies a value in place must take it with
+    `own` first, which deep copies a shared value once and keeps the copy; `setdefault`, `pop` and
+    `popitem` do the same.  Assigning or deleting a key simply drops it from the shared keys.
+
+    This lets every task in a workflow inherit its parent's data without duplicating large values
+    that it does not change.
+
+    Notes:
+        A value that was read rather than taken with `own` may still be shared with other tasks, so
+        it must not be changed in place.
+    """
+
+    __slots__ = ('_shared', )
+
+    def __init__(self, *args, **kwargs):
+        self._shared = set()
+        dict.__init__(self)
+        self.update(*args, **kwargs)
+
+    def share(self, keys=None):
+        """Mark every mutable value as shared.
+
+        Args:
+            keys (iterable): only consider these keys (default: all of them)
+
+        Returns:
+            set: the keys of the shared values
+        """
+        if keys is None:
+            keys = dict.keys(self)
+        shared = set(key for key in keys if not _is_immutable(dict.__getitem__(self, key)))
+        self._shared.update(shared)
+        return shared
+
+    def is_shared(self, key):
+        """Whether the value of key is shared with another dictionary (and copied by `own`)."""
+        return key in self._shared
+
+    def own(self, key):
+        """Return the value of key so that it can be modified in place.
+
+        A shared value is deep copied first and the copy replaces it in this dictionary.
+        """
+        if key not in self._shared:
+            return dict.__getitem__(self, key)
+        value = deepcopy(dict.__getitem__(self, key))
+        dict.__setitem__(self, key, value)
+        self._shared.discard(key)
+        return value
+
+    def adopt(self, other):
+        """Update from another TaskData, keeping only the keys shared there marked as shared.
+
+        Unlike `update`, this doesn't share the values `other` owns: it is meant for a temporary
+        TaskData built from this one's values, which must not be used afterwards.
+        """
+        dict.update(self, dict.items(other))
+        self._shared.difference_update(dict.keys(other))
+        self._shared.update(other._shared)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._shared.discard(key)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._shared.discard(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __copy__(self):
+        return self.__class__(self)
+
+    def __deepcopy__(self, memo):
+        copied = self.__class__(self)
+        memo[id(self)] = copied
+        return copied
+
+    def __reduce__(self):
+        return self.__class__, (dict(dict.items(self)), )
+
+    def copy(self):
+        return self.__class__(self)
+
+    def setdefault(self, key, default=None):
+        if key in self._shared:
+            return self.own(key)
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *args):
+        if key in self._shared:
+            self.own(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        if key in self._shared:
+            self._shared.discard(key)
+            value = deepcopy(value)
+        return key, value
+
+    def clear(self):
+        dict.clear(self)
+        self._shared.clear()
+
+    def update(self, other=(), /, **kwargs):
+        if isinstance(other, TaskData):
+            # Both dictionaries now hold the same objects, so neither may change them in place
+            shared = other.share()
+            dict.update(self, dict.items(other))
+            self._shared.difference_update(dict.keys(other))
+            self._shared.update(shared)
+        elif other:
+            if not isinstance(other, dict):
+                other = dict(other)
+            dict.update(self, other)
+            self._shared.difference_update(other)
+        if kwargs:
+            dict.update(self, kwargs)
+            self._shared.difference_update(kwargs)
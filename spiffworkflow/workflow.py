@@ -42,6 +42,12 @@ class Workflow(object):
         tasks (dict(id, `Task`)): a mapping of task ids to tasks
         task_tree (`Task`): the root task of this workflow's task tree
         completed_event (`Event`): an event holding callbacks to be run when the workflow completes
+
+    Notes:
+        The workflow keeps an index of task ids by state, maintained by `Task._set_state`.  State queries
+        over the whole workflow (`get_tasks(state=...)`, `is_completed`, `manual_input_required`) are
+        answered from the index rather than by walking the task tree, so they don't get slower as
+        finished tasks accumulate.
     """
 
     def __init__(self, workflow_spec, deserializing=False):
@@ -57,6 +63,10 @@ class Workflow(object):
         self.success = True
         self.tasks = {}
         self.completed = False
+        # state -> ids of tasks in that state
+        self.tasks_by_state = {}
+        # Cleared when tasks from another workflow are spliced into the tree
+        self.state_index_enabled = True
 
         # Events.
         self.completed_event = Event()
@@ -74,11 +84,14 @@ class Workflow(object):
             bool: True if the workflow has no unfinished tasks
         """
         if not self.completed:
-            iter = TaskIterator(self.task_tree, state=TaskState.NOT_FINISHED_MASK)
-            try:
-                next(iter)
-            except StopIteration:
-                self.completed = True
+            if self.state_index_enabled:
+                self.completed = not self._task_ids_with_state(TaskState.NOT_FINISHED_MASK)
+            else:
+                iter = TaskIterator(self.task_tree, state=TaskState.NOT_FINISHED_MASK)
+                try:
+                    next(iter)
+                except StopIteration:
+                    self.completed = True
         return self.completed
 
     def manual_input_required(self):
@@ -87,6 +100,9 @@ class Workflow(object):
         Returns:
             bool: True if the workflow cannot proceed until manual tasks are complete
         """
+        if self.state_index_enabled:
+            ready = self.tasks_by_state.get(TaskState.READY, ())
+            return not any(not self.tasks[task_id].task_spec.manual for task_id in ready)
         iter = TaskIterator(self.task_tree, state=TaskState.READY, manual=False)
         try:
             next(iter)
@@ -132,9 +148,14 @@ class Workflow(object):
         Notes:
             Other keyword args are passed directly into `TaskIterator`        
 
+            When searching the whole workflow for a subset of unfinished states, candidates are taken
+            from the state index and returned in the order the tree traversal would produce.
+
         Returns:
             `TaskIterator`: an iterator over the matching tasks
         """
+        if first_task is None and self._can_use_state_index(kwargs):
+            return self._iter_indexed_tasks(kwargs.get('task_filter') or TaskFilter(**kwargs))
         return TaskIterator(first_task or self.task_tree, **kwargs)
 
     def get_task_from_id(self, task_id):
@@ -262,7 +283,7 @@ class Workflow(object):
             'completed': self.completed,
         })
         if logger.level < 20:
-            extra.update({'tasks': [t.id for t in Workflow.get_tasks(self)]})
+            extra.update({'tasks': list(self.tasks)})
         return extra
 
     def _predict(self, mask=TaskState.NOT_FINISHED_MASK):
@@ -286,6 +307,82 @@ class Workflow(object):
             self._remove_task(child.id)
         task.parent._children.remove(task.id)
         self.tasks.pop(task_id)
+        self.tasks_by_state.get(task._state, set()).discard(task_id)
+
+    def _index_task(self, task, previous_state=None):
+        """Record the task under its current state, removing it from `previous_state`"""
+        if previous_state is not None:
+            self.tasks_by_state.get(previous_state, set()).discard(task.id)
+        self.tasks_by_state.setdefault(task._state, set()).add(task.id)
+        if task._state == TaskState.READY:
+            self._task_ready(task)
+
+    def _task_ready(self, task):
+        """Called whenever a task enters the READY state"""
+        pass
+
+    def _task_ids_with_state(self, state):
+        """Ids of the indexed tasks whose state is in the `state` mask"""
+        ids = set()
+        for value, task_ids in self.tasks_by_state.items():
+            if value & state:
+                ids.update(task_ids)
+        return ids
+
+    _INDEXED_QUERY_ARGS = frozenset(['task_filter', 'state', 'updated_ts', 'manual', 'spec_name', 'spec_class'])
+
+    def _can_use_state_index(self, kwargs):
+        """Whether a whole-workflow query with these `TaskIterator` arguments can be answered from the index.
+
+        Queries limited to finished states still walk the tree: unfinished parents can have finished children,
+        and the traversal does not descend below them.
+        """
+        if not self.state_index_enabled or not set(kwargs) <= self._INDEXED_QUERY_ARGS:
+            return False
+        task_filter = kwargs.get('task_filter')
+        state = task_filter.state if task_filter is not None else kwargs.get('state', TaskState.ANY_MASK)
+        return state != TaskState.ANY_MASK and state & TaskState.NOT_FINISHED_MASK != 0
+
+    def _iter_indexed_tasks(self, task_filter):
+        """Iterate over indexed tasks matching `task_filter` in depth first tree order"""
+        candidates = [self.tasks[task_id] for task_id in self._task_ids_with_state(task_filter.state)]
+        for task in self._in_tree_order([t for t in candidates if task_filter.matches(t)]):
+            # Earlier tasks may be run by the caller before later ones are reached
+            if task.id in self.tasks and task_filter.matches(task):
+                yield task
+
+    def _in_tree_order(self, tasks):
+        """Sort tasks in depth first order without traversing the whole tree.
+
+        Each task climbs towards the root one level per round; a climb stops when it reaches a node another
+        climb has already visited.  The last climb standing is at a common ancestor of every task, and tasks
+        are then ordered by their child positions below it.
+        """
+        if len(tasks) < 2:
+            return tasks
+        visited = set(task.id for task in tasks)
+        active = list(tasks)
+        while len(active) > 1:
+            climbing = []
+            for task in active:
+                parent = task.parent
+                if parent is None:
+                    climbing.append(task)
+                elif parent.id not in visited:
+                    visited.add(parent.id)
+                    climbing.append(parent)
+            active = climbing
+        top = active[0]
+
+        def position(task):
+            path = []
+            while task.id != top.id:
+                parent = task.parent
+                path.append(parent._children.index(task.id))
+                task = parent
+            return path[::-1]
+
+        return sorted(tasks, key=position)
 
     def _mark_complete(self, task):
         logger.info('Workflow completed', extra=self.collect_log_extras())